@@ -0,0 +1,136 @@
+"""
+Benchmark: 3D eigen-solver backends
+
+Times the sparse 3D eigen-solvers on the bar sizes of
+example_xylophone_range.py. For each note a "population" of similar
+undercut designs is solved in sequence, as in one EA generation:
+
+- eigsh (cold): shift-invert ARPACK from scratch for every design
+- eigsh (warm): shift and start vector reused from the previous design
+- lobpcg: preconditioned LOBPCG, previous eigenvector block reused
+
+With --calibrate, the solve-time calibration used by solver='auto' is
+measured and saved first (see multi_modal_tuning.physics.solver_selection).
+
+Usage:
+    python benchmark_3d_solvers.py [--notes F4 C5 F5] [--designs 8] [--nz 24] [--calibrate]
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from multi_modal_tuning import (
+    MATERIALS,
+    Cut,
+    AnalysisMode,
+    get_preset,
+    note_to_frequency,
+    find_optimal_length,
+)
+from multi_modal_tuning.physics.bar_profile import generate_element_heights
+from multi_modal_tuning.physics.fem_3d import (
+    compute_frequencies_3d,
+    get_bar_mesh_3d,
+    HAS_PYAMG,
+)
+from multi_modal_tuning.physics.solver_selection import calibration_path, run_solver_calibration
+
+
+# Same bar sizes as example_xylophone_range.py
+BAR_WIDTH = 32              # mm
+BAR_HEIGHT = 24             # mm
+MATERIAL_NAME = "sapele"
+TUNING_RATIO = "1:3:6"
+NUM_ELEMENTS_3D_X = 120
+NY = 2
+
+
+def make_designs(length: float, h0: float, count: int, seed: int = 0) -> List[List[float]]:
+    """Element heights of `count` similar two-cut designs (one EA generation)."""
+    rng = np.random.default_rng(seed)
+    designs = []
+    for _ in range(count):
+        jitter = 1.0 + 0.02 * rng.standard_normal(4)
+        cuts = [
+            Cut(lambda_=0.30 * length * jitter[0], h=0.75 * h0 * jitter[1]),
+            Cut(lambda_=0.15 * length * jitter[2], h=0.45 * h0 * jitter[3]),
+        ]
+        designs.append(generate_element_heights(cuts, length, h0, NUM_ELEMENTS_3D_X))
+    return designs
+
+
+def time_solver(designs: List[List[float]], solve: Callable[[List[float]], List[float]]):
+    """Mean time per design and the frequencies of every design."""
+    results = []
+    start = time.perf_counter()
+    for heights in designs:
+        results.append(solve(heights))
+    return (time.perf_counter() - start) / len(designs), np.array(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark 3D eigen-solver backends")
+    parser.add_argument("--notes", nargs="+", default=["F4", "C5", "F5"], help="Notes to benchmark")
+    parser.add_argument("--designs", type=int, default=8, help="Designs per note")
+    parser.add_argument("--nz", type=int, default=24, help="Elements in thickness direction")
+    parser.add_argument("--modes", type=int, default=6, help="Number of modes")
+    parser.add_argument("--calibrate", action="store_true",
+                        help="Measure and save the calibration for solver='auto' first")
+    args = parser.parse_args()
+
+    if args.calibrate:
+        start = time.perf_counter()
+        run_solver_calibration()
+        print(f"Solver calibration saved to {calibration_path()} ({time.perf_counter() - start:.1f}s)")
+        print()
+
+    material = MATERIALS[MATERIAL_NAME]
+    preset = get_preset(TUNING_RATIO)
+    b = BAR_WIDTH / 1000
+    h0 = BAR_HEIGHT / 1000
+
+    print(f"Mesh: {NUM_ELEMENTS_3D_X} x {NY} x {args.nz}, {args.designs} designs per note, "
+          f"{args.modes} modes")
+    print(f"LOBPCG preconditioner: {'smoothed aggregation AMG' if HAS_PYAMG else 'incomplete LU'}")
+    print()
+    print("Mean time per design; deviations are max relative differences to eigsh (warm)")
+    print(f"{'Note':<6}{'L (mm)':>8}{'DOF':>8}{'eigsh cold':>12}{'eigsh warm':>12}{'lobpcg':>10}"
+          f"{'dev cold':>10}{'dev lobpcg':>12}")
+
+    for note in args.notes:
+        f1 = note_to_frequency(note)
+        search = find_optimal_length(
+            f1 * preset.ratios[0], BAR_WIDTH, BAR_HEIGHT, material, 100, 600,
+            analysis_mode=AnalysisMode.BEAM_2D
+        )
+        length = search.length / 1000
+        designs = make_designs(length, h0, args.designs)
+
+        mesh = get_bar_mesh_3d(NUM_ELEMENTS_3D_X, NY, args.nz)
+
+        def solver(name: str, warm: bool) -> Callable[[List[float]], List[float]]:
+            return lambda heights: compute_frequencies_3d(
+                heights, length, b, material.E, material.rho, material.nu,
+                args.modes, NY, args.nz, warm_start=warm, solver=name
+            )
+
+        # Prime the warm-start states with the first design
+        for name in ("eigsh", "lobpcg"):
+            solver(name, True)(designs[0])
+
+        t_cold, f_cold = time_solver(designs, solver("eigsh", False))
+        t_warm, f_warm = time_solver(designs, solver("eigsh", True))
+        t_lobpcg, f_lobpcg = time_solver(designs, solver("lobpcg", True))
+
+        dev_cold = np.max(np.abs(f_cold - f_warm) / f_warm)
+        dev_lobpcg = np.max(np.abs(f_lobpcg - f_warm) / f_warm)
+        print(f"{note:<6}{length * 1000:>8.1f}{mesh.num_dof:>8}"
+              f"{t_cold:>11.3f}s{t_warm:>11.3f}s{t_lobpcg:>9.3f}s"
+              f"{dev_cold:>10.1e}{dev_lobpcg:>12.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark: cross-note warm starts in the range pipeline
+
+Runs the range pipeline of example_xylophone_range.py twice over a note
+range, once with every bar's first 2D optimization started from a random
+population and once seeded from the neighbouring bars (warm_start), and
+reports the generations and time that 2D stage needs per note.
+
+Bars are processed serially in note order, so every bar after the first
+is seeded from the bar below it. The 3D stages use a coarse mesh by
+default; they do not depend on the warm start.
+
+Usage:
+    python benchmark_range_warm_start.py [--start F4] [--end F5] [--seeds 0 1 2]
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+from multi_modal_tuning import (
+    MATERIALS,
+    get_preset,
+    generate_notes_in_range,
+    run_range_pipeline,
+    RangePipelineConfig,
+    BarPipelineResult,
+)
+
+
+# Same bar sizes as example_xylophone_range.py
+BAR_WIDTH = 32              # mm
+BAR_HEIGHT = 24             # mm
+MATERIAL_NAME = "sapele"
+TUNING_RATIO = "1:3:6"
+NUM_CUTS = 2
+
+
+def run_range(notes, args, warm_start: bool, seed: int) -> Dict[str, BarPipelineResult]:
+    """Pipeline results by note name."""
+    config = RangePipelineConfig(
+        width_mm=BAR_WIDTH,
+        height_mm=BAR_HEIGHT,
+        material=MATERIALS[MATERIAL_NAME],
+        ratios=get_preset(TUNING_RATIO).ratios,
+        num_cuts=NUM_CUTS,
+        population_size=args.population,
+        max_generations=args.generations,
+        target_error=args.target_error,
+        num_elements_2d=args.elements,
+        num_elements_3d_x=args.nx3d,
+        ny=2,
+        nz=args.nz,
+        executor='serial',
+        warm_start=warm_start,
+        random_seed=seed,
+    )
+    return {r.note_name: r for r in run_range_pipeline(notes, config)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cross-note warm starts")
+    parser.add_argument("--start", default="F4", help="First note")
+    parser.add_argument("--end", default="F5", help="Last note")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2], help="Random seeds (one run each)")
+    parser.add_argument("--population", type=int, default=50, help="Population size")
+    parser.add_argument("--generations", type=int, default=100, help="Maximum generations")
+    parser.add_argument("--target-error", type=float, default=0.05, help="Target tuning error (%%)")
+    parser.add_argument("--elements", type=int, default=120, help="2D elements")
+    parser.add_argument("--nx3d", type=int, default=40, help="3D elements in length direction")
+    parser.add_argument("--nz", type=int, default=4, help="3D elements in thickness direction")
+    args = parser.parse_args()
+
+    notes = generate_notes_in_range(args.start, args.end, scale_type='chromatic')
+    print(f"Notes: {notes[0].name} to {notes[-1].name} ({len(notes)} bars), "
+          f"population {args.population}, up to {args.generations} generations, "
+          f"2D stage target {2 * args.target_error:.2f}%")
+
+    generations: Dict[bool, Dict[str, List[int]]] = {False: {}, True: {}}
+    seconds: Dict[bool, Dict[str, List[float]]] = {False: {}, True: {}}
+    for seed in args.seeds:
+        for warm_start in (False, True):
+            start = time.perf_counter()
+            results = run_range(notes, args, warm_start, seed)
+            label = "warm" if warm_start else "cold"
+            print(f"  seed {seed}, {label}: {time.perf_counter() - start:.1f}s")
+            for name, r in results.items():
+                generations[warm_start].setdefault(name, []).append(r.generations_2d)
+                seconds[warm_start].setdefault(name, []).append(r.stage_times.get('ea_2d', 0.0))
+
+    def mean(values):
+        return sum(values) / len(values) if values else 0.0
+
+    print(f"\nFirst 2D stage, mean over {len(args.seeds)} seed(s):")
+    print(f"{'Note':<6} {'Gen cold':>9} {'Gen warm':>9} {'Time cold':>10} {'Time warm':>10}")
+    print("-" * 48)
+    for note in notes:
+        print(f"{note.name:<6} {mean(generations[False][note.name]):>9.1f} {mean(generations[True][note.name]):>9.1f} "
+              f"{mean(seconds[False][note.name]):>9.2f}s {mean(seconds[True][note.name]):>9.2f}s")
+
+    # The first bar has no finished neighbour, so it is left out of the totals
+    seeded = [note.name for note in notes[1:]]
+    cold_gen = sum(mean(generations[False][n]) for n in seeded)
+    warm_gen = sum(mean(generations[True][n]) for n in seeded)
+    cold_time = sum(mean(seconds[False][n]) for n in seeded)
+    warm_time = sum(mean(seconds[True][n]) for n in seeded)
+    print("-" * 48)
+    print(f"Seeded bars: {cold_gen / len(seeded):.1f} -> {warm_gen / len(seeded):.1f} generations per note "
+          f"({1 - warm_gen / cold_gen:.0%} fewer), "
+          f"{cold_time:.1f}s -> {warm_time:.1f}s ({1 - warm_time / cold_time:.0%} less time)")
+
+
+if __name__ == "__main__":
+    main()
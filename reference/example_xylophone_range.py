@@ -4,7 +4,8 @@ Example: Xylophone Range Optimization
 This example demonstrates a complete workflow for generating a range of xylophone bars:
 1. Takes a note range (e.g., F4 to F5), bar dimensions, material, and tuning ratio
 2. Finds optimal bar lengths using the 2D FEM solver
-3. Runs multi-stage optimization: 2D fast -> 3D correction -> 2D refined -> 3D final
+3. Runs multi-stage optimization: 2D fast -> 3D correction -> 2D refined -> 3D final,
+   with the stages of different bars running in parallel (run_range_pipeline)
 4. Uses proper 3D solid element FEM with mode classification for verification
 5. Generates both 2D profile and 3D mesh diagrams for each bar
 
@@ -19,43 +20,34 @@ Output:
     │   └── F4_results.txt
     ├── Fs4/  (F#4)
     │   └── ...
+    ├── results.sqlite  (finished bars, reused when the script is run again)
     └── summary.txt
 """
 
 import os
 import time
 import math
-from dataclasses import dataclass
-from typing import List, Optional
+from typing import List
 
 from multi_modal_tuning import (
     # Types
     BarParameters,
-    EAParameters,
-    EAConfig,
-    OptimizationResult,
     Cut,
-    AnalysisMode,
     # Data
     MATERIALS,
     get_preset,
-    calculate_target_frequencies,
-    # Algorithm
-    run_evolutionary_algorithm,
+    # Range pipeline
+    run_range_pipeline,
+    ResultStore,
+    RangePipelineConfig,
+    BarPipelineResult,
     # Utils
-    note_to_frequency,
     generate_notes_in_range,
-    frequency_error_cents,
-    find_optimal_length,
-    # Physics
-    compute_frequencies_from_genes,
-    genes_to_cuts,
 )
 
 # Import 3D FEM functions
 from multi_modal_tuning.physics.fem_3d import (
     generate_bar_mesh_3d,
-    compute_frequencies_3d_classified,
 )
 from multi_modal_tuning.physics.bar_profile import (
     generate_element_heights,
@@ -79,6 +71,7 @@ MATERIAL_NAME = "sapele"    # Material from materials database
 TUNING_RATIO = "1:3:6"      # Tuning preset (xylophone)
 NUM_CUTS = 2                # Number of undercuts
 OUTPUT_DIR = "output"       # Output directory for diagrams
+RESULT_STORE = "output/results.sqlite"  # Finished bars are reused on re-runs (None = off)
 
 # Length search bounds (mm)
 MIN_BAR_LENGTH = 100        # Minimum bar length to search
@@ -88,6 +81,8 @@ MAX_BAR_LENGTH = 600        # Maximum bar length to search
 POPULATION_SIZE = 50
 MAX_GENERATIONS = 100
 TARGET_ERROR = 0.05         # Target tuning error (%)
+EXECUTOR = "process"        # Stage backend: 'thread', 'process' or 'serial'
+MAX_WORKERS = 0             # Bars processed in parallel (0 = one per CPU)
 
 # FEM discretization
 NUM_ELEMENTS_2D = 120       # For 2D optimization
@@ -96,30 +91,6 @@ NY = 2                      # Elements in width direction for 3D
 NZ = 24                      # Elements in thickness direction for 3D
 
 
-# ============================================================================
-# DATA STRUCTURES
-# ============================================================================
-
-@dataclass
-class BarResult:
-    """Result for a single optimized bar."""
-    note_name: str
-    note_frequency: float
-    bar_length: float               # mm (final optimized length)
-    initial_length: float           # mm (length from initial search)
-    target_frequencies: List[float]
-    computed_frequencies_2d: List[float]
-    computed_frequencies_3d: List[float]
-    frequency_offset: List[float]   # 3D - 2D for each mode
-    final_frequencies: List[float]
-    errors_cents: List[float]
-    tuning_error: float
-    cuts: List[Cut]
-    optimization_time: float        # seconds
-    success: bool
-    error_message: Optional[str] = None
-
-
 # ============================================================================
 # CORE FUNCTIONS
 # ============================================================================
@@ -181,360 +152,90 @@ def generate_bar_visualizations(
     return profile_path, mesh_path
 
 
-def process_single_bar(
-    note_name: str,
-    note_frequency: float,
-    width_mm: float,
-    height_mm: float,
+def write_bar_outputs(
+    result: BarPipelineResult,
     material,
     preset,
-    num_cuts: int,
     output_dir: str,
     verbose: bool = True
-) -> BarResult:
-    """
-    Process a single bar through the full multi-stage optimization pipeline.
-
-    Pipeline:
-    1. Find optimal length using 2D FEM (fast)
-    2. Run fast 2D optimization
-    3. Compute 3D frequencies with mode classification to get offset
-    4. Run corrected 2D optimization
-    5. Final 3D verification with mode classification
-    6. Generate diagrams
-    """
-    start_time = time.time()
-
-    try:
-        # Calculate target frequencies from preset
-        target_frequencies = calculate_target_frequencies(preset.ratios, note_frequency)
-        num_modes = len(target_frequencies)
-
-        if verbose:
-            print(f"\n{'='*60}")
-            print(f"Processing {note_name} ({note_frequency:.2f} Hz)")
-            print(f"{'='*60}")
-            print(f"Target frequencies: {', '.join(f'{f:.1f} Hz' for f in target_frequencies)}")
-
-        # ----------------------------------------------------------------
-        # Stage 1: Find optimal bar length using 2D FEM (fast)
-        # ----------------------------------------------------------------
-        if verbose:
-            print(f"\n[1/5] Finding optimal bar length...")
-
-        length_result = find_optimal_length(
-            target_frequency=note_frequency,
-            width=width_mm,
-            thickness=height_mm,
-            material=material,
-            min_length=MIN_BAR_LENGTH,
-            max_length=MAX_BAR_LENGTH,
-            tolerance_cents=2.0,
-            max_iterations=30,
-            num_elements=NUM_ELEMENTS_2D,
-            analysis_mode=AnalysisMode.BEAM_2D  # Use 2D for speed
-        )
-
-        initial_length_mm = length_result.length
-        bar_length_mm = initial_length_mm
-        if verbose:
-            print(f"    Optimal length: {bar_length_mm:.1f} mm (f1 = {length_result.computed_freq:.2f} Hz, {length_result.error_cents:+.1f} cents)")
-
-        # Create bar parameters (convert mm to m)
-        bar = BarParameters(
-            L=bar_length_mm / 1000,
-            b=width_mm / 1000,
-            h0=height_mm / 1000,
-            hMin=height_mm / 10000  # 10% of thickness
-        )
-
-        # ----------------------------------------------------------------
-        # Stage 2: Fast 2D optimization
-        # ----------------------------------------------------------------
-        if verbose:
-            print(f"\n[2/5] Running 2D optimization (fast)...")
-
-        ea_params_2d = EAParameters(
-            population_size=POPULATION_SIZE,
-            max_generations=MAX_GENERATIONS,
-            target_error=TARGET_ERROR * 2,  # Looser tolerance for speed
-            num_elements=NUM_ELEMENTS_2D,
-            elitism_percent=10,
-            crossover_percent=30,
-            mutation_percent=60,
-            mutation_strength=0.12,
-            f1_priority=1.5,
-            max_length_trim=0.02,    # Allow up to 20mm trim from each end
-            max_length_extend=0.02,  # Allow up to 20mm extension from each end
-            analysis_mode=AnalysisMode.BEAM_2D,
-        )
-
-        config_2d = EAConfig(
-            bar=bar,
-            material=material,
-            target_frequencies=target_frequencies,
-            num_cuts=num_cuts,
-            ea_params=ea_params_2d,
-            on_progress=lambda u: None,  # Silent
-        )
-
-        result_2d = run_evolutionary_algorithm(config_2d)
-
-        # Update bar length if optimizer trimmed/extended it
-        if result_2d.effective_length > 0:
-            bar_length_mm = result_2d.effective_length * 1000
-            bar = BarParameters(
-                L=result_2d.effective_length,
-                b=width_mm / 1000,
-                h0=height_mm / 1000,
-                hMin=height_mm / 10000
-            )
-
-        if verbose:
-            print(f"    2D result: {result_2d.tuning_error:.4f}% error, {result_2d.generations} generations")
-            if result_2d.length_trim != 0:
-                print(f"    Length adjustment: {result_2d.length_trim*1000:+.1f} mm (new length: {bar_length_mm:.1f} mm)")
-            for i, f in enumerate(result_2d.computed_frequencies):
-                print(f"      f{i+1}: {f:.1f} Hz (target: {target_frequencies[i]:.1f} Hz)")
-
-        # ----------------------------------------------------------------
-        # Stage 3: 3D analysis with mode classification to compute offset
-        # ----------------------------------------------------------------
-        if verbose:
-            print(f"\n[3/5] Computing 3D frequency offset (with mode classification)...")
-
-        # Get cuts from 2D result
-        cuts_2d = genes_to_cuts(result_2d.best_individual.genes[:num_cuts * 2])
-
-        # Generate element heights for 3D analysis
-        element_heights = generate_element_heights(cuts_2d, bar.L, bar.h0, NUM_ELEMENTS_3D_X)
-
-        # Run 3D FEM with mode classification
-        all_freqs_3d, classified_modes, _ = compute_frequencies_3d_classified(
-            element_heights,
-            bar.L,
-            bar.b,
-            material.E,
-            material.rho,
-            material.nu,
-            num_modes=10,  # Request more modes for classification
-            ny=NY,
-            nz=NZ
-        )
-
-        # Extract vertical bending modes (what we care about for xylophones)
-        bending_modes = classified_modes.get('vertical_bending', [])
-        freqs_3d_check = [m['frequency'] for m in bending_modes[:num_modes]]
-
-        # Pad if we didn't get enough bending modes
-        while len(freqs_3d_check) < num_modes:
-            freqs_3d_check.append(all_freqs_3d[len(freqs_3d_check)] if len(freqs_3d_check) < len(all_freqs_3d) else 0)
-
-        # Calculate offset: how much 3D differs from 2D
-        frequency_offset = [f3d - f2d for f3d, f2d in zip(freqs_3d_check, result_2d.computed_frequencies)]
-
-        if verbose:
-            print(f"    3D bending modes found: {len(bending_modes)}")
-            print(f"    Frequency offset (3D - 2D):")
-            for i, (f2d, f3d, offset) in enumerate(zip(result_2d.computed_frequencies, freqs_3d_check, frequency_offset)):
-                print(f"      f{i+1}: 2D={f2d:.1f} Hz, 3D={f3d:.1f} Hz, offset={offset:+.2f} Hz")
-
-        # ----------------------------------------------------------------
-        # Stage 4: Corrected 2D optimization
-        # ----------------------------------------------------------------
-        if verbose:
-            print(f"\n[4/5] Running corrected 2D optimization...")
-
-        # Adjust target frequencies to compensate for the offset
-        # If 3D is higher than 2D, we need to aim lower in 2D
-        corrected_targets = [ft - offset for ft, offset in zip(target_frequencies, frequency_offset)]
-
-        if verbose:
-            print(f"    Corrected targets: {', '.join(f'{f:.1f} Hz' for f in corrected_targets)}")
-
-        ea_params_corrected = EAParameters(
-            population_size=POPULATION_SIZE,
-            max_generations=MAX_GENERATIONS,
-            target_error=TARGET_ERROR,
-            num_elements=NUM_ELEMENTS_2D,
-            elitism_percent=10,
-            crossover_percent=30,
-            mutation_percent=60,
-            mutation_strength=0.10,
-            f1_priority=1.5,
-            analysis_mode=AnalysisMode.BEAM_2D,
-        )
-
-        # Only use the cut genes as seed (exclude length adjustment gene if present)
-        seed_genes = result_2d.best_individual.genes[:num_cuts * 2]
-
-        config_corrected = EAConfig(
-            bar=bar,
-            material=material,
-            target_frequencies=corrected_targets,
-            num_cuts=num_cuts,
-            ea_params=ea_params_corrected,
-            on_progress=lambda u: None,
-            seed_genes=seed_genes,  # Seed from previous result (cut genes only)
-        )
-
-        result_corrected = run_evolutionary_algorithm(config_corrected)
-
-        if verbose:
-            print(f"    Corrected 2D result: {result_corrected.tuning_error:.4f}% error")
-
-        # ----------------------------------------------------------------
-        # Stage 5: Final 3D verification with mode classification
-        # ----------------------------------------------------------------
-        if verbose:
-            print(f"\n[5/5] Final 3D verification...")
-
-        # Get final cuts
-        cuts = genes_to_cuts(result_corrected.best_individual.genes[:num_cuts * 2])
-
-        # Generate element heights for final 3D analysis
-        element_heights_final = generate_element_heights(cuts, bar.L, bar.h0, NUM_ELEMENTS_3D_X)
-
-        # Run final 3D FEM with mode classification
-        all_freqs_final, classified_modes_final, _ = compute_frequencies_3d_classified(
-            element_heights_final,
-            bar.L,
-            bar.b,
-            material.E,
-            material.rho,
-            material.nu,
-            num_modes=10,
-            ny=NY,
-            nz=NZ
-        )
-
-        # Extract vertical bending modes for final frequencies
-        bending_modes_final = classified_modes_final.get('vertical_bending', [])
-        final_freqs = [m['frequency'] for m in bending_modes_final[:num_modes]]
-
-        # Pad if needed
-        while len(final_freqs) < num_modes:
-            final_freqs.append(all_freqs_final[len(final_freqs)] if len(final_freqs) < len(all_freqs_final) else 0)
-
-        # Calculate final errors
-        errors_cents = [frequency_error_cents(f, ft) for f, ft in zip(final_freqs, target_frequencies)]
-        max_error = max(abs(e) for e in errors_cents)
-
-        # Compute overall tuning error
-        weights = [1.5 if i == 0 else 1.0 for i in range(num_modes)]
-        tuning_error = 100 * sum(w * ((f - ft) / ft) ** 2 for w, f, ft in zip(weights, final_freqs, target_frequencies)) / sum(weights)
-
-        if verbose:
-            print(f"    Final 3D frequencies (vertical bending modes):")
-            for i, (f, ft, e) in enumerate(zip(final_freqs, target_frequencies, errors_cents)):
-                sign = '+' if e >= 0 else ''
-                print(f"      f{i+1}: {f:.1f} Hz (target: {ft:.1f} Hz, {sign}{e:.1f} cents)")
-            print(f"    Tuning error: {tuning_error:.4f}%, max error: {max_error:.1f} cents")
-
-            # Show other mode types found
-            for mode_type, modes in classified_modes_final.items():
-                if mode_type != 'vertical_bending' and modes:
-                    mode_freqs = [m['frequency'] for m in modes[:3]]
-                    print(f"    Other modes ({mode_type}): {', '.join(f'{f:.1f}' for f in mode_freqs)} Hz")
-
-        # ----------------------------------------------------------------
-        # Generate diagrams
-        # ----------------------------------------------------------------
-        if verbose:
-            print(f"\n    Generating diagrams...")
-
-        safe_note_name = note_name.replace('#', 's').replace('b', 'b')
-        note_output_dir = os.path.join(output_dir, safe_note_name)
-        os.makedirs(note_output_dir, exist_ok=True)
-
-        profile_path, mesh_path = generate_bar_visualizations(
-            bar=bar,
-            cuts=cuts,
-            note_name=note_name,
-            frequencies=final_freqs,
-            target_frequencies=target_frequencies,
-            output_dir=note_output_dir,
-            material=material
-        )
-
-        # Write results file
-        results_path = os.path.join(note_output_dir, f'{safe_note_name}_results.txt')
-        with open(results_path, 'w') as f:
-            f.write(f"Bar Optimization Results: {note_name}\n")
-            f.write(f"{'='*50}\n\n")
-            f.write(f"Note: {note_name} ({note_frequency:.2f} Hz)\n")
-            f.write(f"Material: {material.name}\n")
-            f.write(f"Tuning ratio: {preset.name}\n\n")
-            f.write(f"Bar Dimensions:\n")
-            f.write(f"  Length: {bar_length_mm:.1f} mm\n")
-            f.write(f"  Width: {width_mm:.1f} mm\n")
-            f.write(f"  Height: {height_mm:.1f} mm\n\n")
-            f.write(f"3D FEM Analysis:\n")
-            f.write(f"  Elements: {NUM_ELEMENTS_3D_X} x {NY} x {NZ}\n")
-            f.write(f"  Mode classification: Soares' corner displacement method\n\n")
-            f.write(f"Frequencies (vertical bending modes):\n")
-            for i, (f_val, ft, e) in enumerate(zip(final_freqs, target_frequencies, errors_cents)):
-                sign = '+' if e >= 0 else ''
-                f.write(f"  f{i+1}: {f_val:.2f} Hz (target: {ft:.2f} Hz, {sign}{e:.1f} cents)\n")
-            f.write(f"\nTuning Error: {tuning_error:.4f}%\n")
-            f.write(f"Max Error: {max_error:.1f} cents\n\n")
-            f.write(f"2D/3D Frequency Offset:\n")
-            for i, offset in enumerate(frequency_offset):
-                f.write(f"  f{i+1}: {offset:+.2f} Hz\n")
-            f.write(f"\nCut Geometry (symmetric about center):\n")
-            for i, cut in enumerate(cuts):
-                depth_mm = (bar.h0 - cut.h) * 1000
-                width_cut = cut.lambda_ * 2 * 1000
-                f.write(f"  Cut {i+1}: lambda = {cut.lambda_*1000:.2f} mm, h = {cut.h*1000:.2f} mm\n")
-                f.write(f"          (width = {width_cut:.1f} mm, depth = {depth_mm:.2f} mm)\n")
-
-        elapsed = time.time() - start_time
-
-        if verbose:
-            print(f"    Saved to: {note_output_dir}/")
-            print(f"    Time: {elapsed:.1f}s")
-
-        return BarResult(
-            note_name=note_name,
-            note_frequency=note_frequency,
-            bar_length=bar_length_mm,
-            initial_length=initial_length_mm,
-            target_frequencies=target_frequencies,
-            computed_frequencies_2d=result_2d.computed_frequencies,
-            computed_frequencies_3d=freqs_3d_check,
-            frequency_offset=frequency_offset,
-            final_frequencies=final_freqs,
-            errors_cents=errors_cents,
-            tuning_error=tuning_error,
-            cuts=cuts,
-            optimization_time=elapsed,
-            success=True
-        )
-
-    except Exception as e:
-        elapsed = time.time() - start_time
-        if verbose:
-            print(f"    ERROR: {str(e)}")
-            import traceback
-            traceback.print_exc()
-
-        return BarResult(
-            note_name=note_name,
-            note_frequency=note_frequency,
-            bar_length=0,
-            initial_length=0,
-            target_frequencies=[],
-            computed_frequencies_2d=[],
-            computed_frequencies_3d=[],
-            frequency_offset=[],
-            final_frequencies=[],
-            errors_cents=[],
-            tuning_error=float('inf'),
-            cuts=[],
-            optimization_time=elapsed,
-            success=False,
-            error_message=str(e)
-        )
+) -> None:
+    """Print a finished bar and write its diagrams and results file."""
+    bar = result.bar
+    cuts = result.cuts
+    final_freqs = result.final_frequencies
+    target_frequencies = result.target_frequencies
+    errors_cents = result.errors_cents
+    max_error = max(abs(e) for e in errors_cents)
+
+    if verbose:
+        print(f"\n{'='*60}")
+        print(f"{result.note_name} ({result.note_frequency:.2f} Hz) "
+              f"{'taken from the result store' if result.from_store else 'finished'}")
+        print(f"{'='*60}")
+        print(f"    Length: {result.initial_length:.1f} mm from search, {result.bar_length:.1f} mm final")
+        print(f"    Frequency offset (3D - 2D):")
+        for i, (f2d, f3d, offset) in enumerate(zip(result.computed_frequencies_2d, result.computed_frequencies_3d, result.frequency_offset)):
+            print(f"      f{i+1}: 2D={f2d:.1f} Hz, 3D={f3d:.1f} Hz, offset={offset:+.2f} Hz")
+        print(f"    Final 3D frequencies (vertical bending modes):")
+        for i, (f, ft, e) in enumerate(zip(final_freqs, target_frequencies, errors_cents)):
+            sign = '+' if e >= 0 else ''
+            print(f"      f{i+1}: {f:.1f} Hz (target: {ft:.1f} Hz, {sign}{e:.1f} cents)")
+        print(f"    Tuning error: {result.tuning_error:.4f}%, max error: {max_error:.1f} cents")
+
+        # Show other mode types found
+        for mode_type, modes in result.classified_modes.items():
+            if mode_type != 'vertical_bending' and modes:
+                mode_freqs = [m['frequency'] for m in modes[:3]]
+                print(f"    Other modes ({mode_type}): {', '.join(f'{f:.1f}' for f in mode_freqs)} Hz")
+
+    safe_note_name = result.note_name.replace('#', 's').replace('b', 'b')
+    note_output_dir = os.path.join(output_dir, safe_note_name)
+    os.makedirs(note_output_dir, exist_ok=True)
+
+    generate_bar_visualizations(
+        bar=bar,
+        cuts=cuts,
+        note_name=result.note_name,
+        frequencies=final_freqs,
+        target_frequencies=target_frequencies,
+        output_dir=note_output_dir,
+        material=material
+    )
+
+    # Write results file
+    results_path = os.path.join(note_output_dir, f'{safe_note_name}_results.txt')
+    with open(results_path, 'w') as f:
+        f.write(f"Bar Optimization Results: {result.note_name}\n")
+        f.write(f"{'='*50}\n\n")
+        f.write(f"Note: {result.note_name} ({result.note_frequency:.2f} Hz)\n")
+        f.write(f"Material: {material.name}\n")
+        f.write(f"Tuning ratio: {preset.name}\n\n")
+        f.write(f"Bar Dimensions:\n")
+        f.write(f"  Length: {result.bar_length:.1f} mm\n")
+        f.write(f"  Width: {BAR_WIDTH:.1f} mm\n")
+        f.write(f"  Height: {BAR_HEIGHT:.1f} mm\n\n")
+        f.write(f"3D FEM Analysis:\n")
+        f.write(f"  Elements: {NUM_ELEMENTS_3D_X} x {NY} x {NZ}\n")
+        f.write(f"  Mode classification: Soares' corner displacement method\n\n")
+        f.write(f"Frequencies (vertical bending modes):\n")
+        for i, (f_val, ft, e) in enumerate(zip(final_freqs, target_frequencies, errors_cents)):
+            sign = '+' if e >= 0 else ''
+            f.write(f"  f{i+1}: {f_val:.2f} Hz (target: {ft:.2f} Hz, {sign}{e:.1f} cents)\n")
+        f.write(f"\nTuning Error: {result.tuning_error:.4f}%\n")
+        f.write(f"Max Error: {max_error:.1f} cents\n\n")
+        f.write(f"2D/3D Frequency Offset:\n")
+        for i, offset in enumerate(result.frequency_offset):
+            f.write(f"  f{i+1}: {offset:+.2f} Hz\n")
+        f.write(f"\nCut Geometry (symmetric about center):\n")
+        for i, cut in enumerate(cuts):
+            depth_mm = (bar.h0 - cut.h) * 1000
+            width_cut = cut.lambda_ * 2 * 1000
+            f.write(f"  Cut {i+1}: lambda = {cut.lambda_*1000:.2f} mm, h = {cut.h*1000:.2f} mm\n")
+            f.write(f"          (width = {width_cut:.1f} mm, depth = {depth_mm:.2f} mm)\n")
+
+    if verbose:
+        print(f"    Saved to: {note_output_dir}/")
+        print(f"    Time: {result.optimization_time:.1f}s")
 
 
 def main():
@@ -557,6 +258,7 @@ def main():
     print(f"  Tuning ratio: {preset.name} ({preset.description})")
     print(f"  Number of cuts: {NUM_CUTS}")
     print(f"  Output directory: {OUTPUT_DIR}/")
+    print(f"  Result store: {RESULT_STORE or 'off'}")
     print(f"\nFEM Settings:")
     print(f"  2D optimization: {NUM_ELEMENTS_2D} elements")
     print(f"  3D verification: {NUM_ELEMENTS_3D_X} x {NY} x {NZ} elements")
@@ -572,27 +274,46 @@ def main():
     # Create output directory
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    # Process each bar
-    results: List[BarResult] = []
-    total_start = time.time()
+    # Stages of all bars are scheduled across the worker pool; each bar is
+    # reported and written out as soon as its last stage finishes
+    config = RangePipelineConfig(
+        width_mm=BAR_WIDTH,
+        height_mm=BAR_HEIGHT,
+        material=material,
+        ratios=preset.ratios,
+        num_cuts=NUM_CUTS,
+        min_length_mm=MIN_BAR_LENGTH,
+        max_length_mm=MAX_BAR_LENGTH,
+        population_size=POPULATION_SIZE,
+        max_generations=MAX_GENERATIONS,
+        target_error=TARGET_ERROR,
+        num_elements_2d=NUM_ELEMENTS_2D,
+        num_elements_3d_x=NUM_ELEMENTS_3D_X,
+        ny=NY,
+        nz=NZ,
+        executor=EXECUTOR,
+        max_workers=MAX_WORKERS,
+        result_store=ResultStore(RESULT_STORE) if RESULT_STORE else None,
+    )
 
-    for i, note in enumerate(notes):
-        print(f"\n[{i+1}/{len(notes)}] ", end="")
-
-        result = process_single_bar(
-            note_name=note.name,
-            note_frequency=note.frequency,
-            width_mm=BAR_WIDTH,
-            height_mm=BAR_HEIGHT,
-            material=material,
-            preset=preset,
-            num_cuts=NUM_CUTS,
-            output_dir=OUTPUT_DIR,
-            verbose=True
-        )
+    def on_stage(note_name: str, stage: str, seconds: float) -> None:
+        print(f"    {note_name}: {stage} done ({seconds:.1f}s)")
 
+    results: List[BarPipelineResult] = []
+    total_start = time.time()
+
+    for result in run_range_pipeline(notes, config, on_stage=on_stage):
+        print(f"\n[{len(results)+1}/{len(notes)}] ", end="")
+        if result.success:
+            write_bar_outputs(result, material, preset, OUTPUT_DIR)
+        else:
+            print(f"{result.note_name}: ERROR: {result.error_message}")
         results.append(result)
 
+    # Report in note order
+    order = {note.name: i for i, note in enumerate(notes)}
+    results.sort(key=lambda r: order[r.note_name])
+
     total_time = time.time() - total_start
 
     # Generate summary
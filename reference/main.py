@@ -16,6 +16,7 @@ from multi_modal_tuning import (
     MATERIALS,
     get_preset,
     calculate_target_frequencies,
+    ResultStore,
 )
 
 
@@ -92,7 +93,9 @@ def main():
         penalty_type='none',
         penalty_weight=0.0,
         ea_params=ea_params,
-        on_progress=progress_callback
+        on_progress=progress_callback,
+        # Re-runs start from the best stored result for this bar
+        result_store=ResultStore()
     )
 
     # Run optimization
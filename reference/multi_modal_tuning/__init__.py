@@ -41,6 +41,12 @@ from .optimization.algorithm import (
     EAConfig,
 )
 
+from .optimization.range_pipeline import (
+    run_range_pipeline,
+    RangePipelineConfig,
+    BarPipelineResult,
+)
+
 from .utils.note_utils import (
     note_to_frequency,
     frequency_to_note,
@@ -53,11 +59,14 @@ from .utils.note_utils import (
 from .utils.bar_length_finder import (
     find_optimal_length,
     find_lengths_for_notes,
+    interpolate_lengths,
     compute_f1_for_uniform_bar,
+    compute_f1_for_uniform_bars,
     estimate_length_from_theory,
     LengthSearchResult,
     BarLengthResult,
 )
+from .utils.result_store import ResultStore, StoredResult
 
 from .visualization.bar_diagrams import (
     generate_2d_profile_diagram,
@@ -65,7 +74,8 @@ from .visualization.bar_diagrams import (
     generate_bar_diagrams,
 )
 
-from .physics.frequencies import compute_frequencies_from_genes
+from .physics.frequencies import compute_frequencies_from_genes, Evaluator
+from .physics.frequency_cache import get_frequency_cache
 from .physics.bar_profile import genes_to_cuts, generate_profile_points
 
 __version__ = "1.0.0"
@@ -98,6 +108,10 @@ __all__ = [
     "run_adaptive_evolution",
     "get_default_ea_parameters",
     "EAConfig",
+    # Range pipeline
+    "run_range_pipeline",
+    "RangePipelineConfig",
+    "BarPipelineResult",
     # Utils
     "note_to_frequency",
     "frequency_to_note",
@@ -108,16 +122,23 @@ __all__ = [
     # Bar length finder
     "find_optimal_length",
     "find_lengths_for_notes",
+    "interpolate_lengths",
     "compute_f1_for_uniform_bar",
+    "compute_f1_for_uniform_bars",
     "estimate_length_from_theory",
     "LengthSearchResult",
     "BarLengthResult",
+    # Result store
+    "ResultStore",
+    "StoredResult",
     # Visualization
     "generate_2d_profile_diagram",
     "generate_3d_isometric_diagram",
     "generate_bar_diagrams",
     # Physics
     "compute_frequencies_from_genes",
+    "Evaluator",
+    "get_frequency_cache",
     "genes_to_cuts",
     "generate_profile_points",
 ]
@@ -14,6 +14,8 @@ from .population import (
     calculate_diversity,
     BoundsConstraints,
     PopulationStats,
+    Population,
+    IndividualView,
 )
 
 from .selection import (
@@ -42,6 +44,20 @@ from .mutation import (
     FrequencyError,
 )
 
+from .vectorized import (
+    make_rng,
+    gene_ranges,
+    gene_limits,
+    clamp_to_bounds_batch,
+    roulette_selection_batch,
+    select_mating_pairs_batch,
+    select_elite_indices,
+    heuristic_crossover_batch,
+    uniform_mutation_batch,
+    adaptive_length_mutation_batch,
+    gaussian_self_adaptive_mutation_batch,
+)
+
 from .penalties import (
     compute_volume_penalty,
     compute_roughness_penalty,
@@ -65,6 +81,12 @@ from .algorithm import (
     EAConfig,
 )
 
+from .range_pipeline import (
+    run_range_pipeline,
+    RangePipelineConfig,
+    BarPipelineResult,
+)
+
 __all__ = [
     # Population
     "create_bounds",
@@ -80,6 +102,8 @@ __all__ = [
     "calculate_diversity",
     "BoundsConstraints",
     "PopulationStats",
+    "Population",
+    "IndividualView",
     # Selection
     "roulette_selection",
     "tournament_selection",
@@ -100,6 +124,18 @@ __all__ = [
     "polynomial_mutation",
     "perform_mutation",
     "FrequencyError",
+    # Vectorized operators
+    "make_rng",
+    "gene_ranges",
+    "gene_limits",
+    "clamp_to_bounds_batch",
+    "roulette_selection_batch",
+    "select_mating_pairs_batch",
+    "select_elite_indices",
+    "heuristic_crossover_batch",
+    "uniform_mutation_batch",
+    "adaptive_length_mutation_batch",
+    "gaussian_self_adaptive_mutation_batch",
     # Penalties
     "compute_volume_penalty",
     "compute_roughness_penalty",
@@ -117,4 +153,8 @@ __all__ = [
     "run_adaptive_evolution",
     "get_default_ea_parameters",
     "EAConfig",
+    # Range pipeline
+    "run_range_pipeline",
+    "RangePipelineConfig",
+    "BarPipelineResult",
 ]
@@ -8,12 +8,12 @@ undercut geometries for target frequencies.
 Uses multithreading for parallel fitness evaluation.
 """
 
-from typing import List, Optional, Callable, Literal
+from typing import List, Optional, Callable, Literal, Tuple
 from dataclasses import dataclass
 import math
+import numpy as np
 
 from ..types import (
-    Individual,
     BarParameters,
     Material,
     EAParameters,
@@ -21,8 +21,13 @@ from ..types import (
     ProgressUpdate,
     AnalysisMode,
 )
-from ..physics.frequencies import compute_frequencies_from_genes, batch_compute_fitness
+from ..physics.frequencies import (
+    compute_frequencies_from_genes,
+    batch_compute_fitness,
+    Evaluator,
+)
 from ..physics.bar_profile import genes_to_cuts
+from ..utils.result_store import MODEL_VERSION, ResultStore, StoredResult, material_key
 
 from .population import (
     create_bounds,
@@ -33,10 +38,17 @@ from .population import (
     clone_individual,
     get_length_adjust_from_genes,
     BoundsConstraints,
+    Population,
+)
+from .vectorized import (
+    make_rng,
+    select_elite_indices,
+    select_mating_pairs_batch,
+    heuristic_crossover_batch,
+    uniform_mutation_batch,
+    adaptive_length_mutation_batch,
+    gaussian_self_adaptive_mutation_batch,
 )
-from .selection import select_elite, select_mating_pairs
-from .crossover import heuristic_crossover
-from .mutation import uniform_mutation, gaussian_self_adaptive_mutation, adaptive_length_mutation, FrequencyError
 from .penalties import compute_volume_penalty, compute_roughness_penalty
 from .objective import evaluate_detailed
 
@@ -52,8 +64,105 @@ class EAConfig:
     penalty_weight: float = 0.0
     ea_params: Optional[EAParameters] = None
     seed_genes: Optional[List[float]] = None
+    seeds: Optional[List[List[float]]] = None  # Further seed genes (multi-seed start)
     on_progress: Optional[Callable[[ProgressUpdate], None]] = None
     should_stop: Optional[Callable[[], bool]] = None
+    evaluator: Optional[Evaluator] = None  # Shared worker pool (owned by the caller)
+    # Earlier results of the same bar seed the population; improved results are stored
+    result_store: Optional[ResultStore] = None
+
+
+def _result_store_key(config: EAConfig) -> dict:
+    """Bar description an EA result is stored under."""
+    return dict(
+        material_key(config.material),
+        width_mm=config.bar.b * 1000,
+        height_mm=config.bar.h0 * 1000,
+        length_mm=config.bar.L * 1000,
+        num_cuts=config.num_cuts,
+        target_frequencies=config.target_frequencies,
+    )
+
+
+def _result_store_settings(config: EAConfig, ea_params: EAParameters) -> dict:
+    """Settings that change the fitness of a design."""
+    return {
+        'model_version': MODEL_VERSION,
+        'h_min_mm': config.bar.hMin * 1000,
+        'analysis_mode': ea_params.analysis_mode.value,
+        'num_elements': ea_params.num_elements,
+        'num_elements_y': ea_params.num_elements_y,
+        'num_elements_z': ea_params.num_elements_z,
+        'solver_3d': ea_params.solver_3d,
+        'frequency_offset': ea_params.frequency_offset,
+        'f1_priority': ea_params.f1_priority,
+        'penalty_type': config.penalty_type,
+        'penalty_weight': config.penalty_weight,
+        'min_cut_width': ea_params.min_cut_width,
+        'max_cut_width': ea_params.max_cut_width,
+        'min_cut_depth': ea_params.min_cut_depth,
+        'max_cut_depth': ea_params.max_cut_depth,
+        'max_length_trim': ea_params.max_length_trim,
+        'max_length_extend': ea_params.max_length_extend,
+    }
+
+
+def _lookup_stored_result(config: EAConfig, ea_params: EAParameters) -> Tuple[Optional[StoredResult], bool]:
+    """
+    Best stored result of the bar: with the same settings if there is one,
+    otherwise with any settings.
+
+    Returns:
+        Tuple of (stored result or None, whether its settings are the same)
+    """
+    if config.result_store is None:
+        return None, False
+    key = _result_store_key(config)
+    stored = config.result_store.best('ea', key, _result_store_settings(config, ea_params))
+    if stored is not None:
+        return stored, True
+    return config.result_store.best('ea', key), False
+
+
+def _stored_seeds(stored: Optional[StoredResult], num_cuts: int, ea_params: EAParameters) -> List[List[float]]:
+    """Genes of a stored result as a seed, with or without the length gene as this run needs."""
+    if stored is None:
+        return []
+    genes = list(stored.genes[:num_cuts * 2])
+    if ea_params.max_length_trim > 0 or ea_params.max_length_extend > 0:
+        genes.append(stored.genes[num_cuts * 2] if len(stored.genes) > num_cuts * 2 else 0.0)
+    return [genes]
+
+
+def _store_result(
+    config: EAConfig,
+    ea_params: EAParameters,
+    result: OptimizationResult,
+    previous: Optional[StoredResult],
+    algorithm: str
+) -> None:
+    """Store a result unless a result with the same settings was at least as good."""
+    if config.result_store is None or (previous is not None and result.tuning_error >= previous.tuning_error):
+        return
+    config.result_store.put(
+        'ea',
+        _result_store_key(config),
+        _result_store_settings(config, ea_params),
+        genes=result.best_individual.genes,
+        bar_length=config.bar.L * 1000,
+        target_frequencies=config.target_frequencies,
+        frequencies=result.computed_frequencies,
+        tuning_error=result.tuning_error,
+        metadata={
+            'algorithm': algorithm,
+            'fitness': result.best_individual.fitness,
+            'generations': result.generations,
+            'population_size': ea_params.population_size,
+            'max_generations': ea_params.max_generations,
+            'random_seed': ea_params.random_seed,
+            'effective_length_mm': result.effective_length * 1000,
+        },
+    )
 
 
 def _compute_frequencies_and_errors(
@@ -65,12 +174,16 @@ def _compute_frequencies_and_errors(
     num_cuts: int,
     analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D,
     ny: int = 2,
-    nz: int = 2
+    nz: int = 2,
+    frequencies: Optional[List[float]] = None
 ) -> dict:
-    """Compute frequencies and cents errors for an individual."""
+    """
+    Compute frequencies and cents errors for an individual.
+    Frequencies already known from evaluation are reused instead of re-solved.
+    """
     try:
         length_trim = get_length_adjust_from_genes(genes, num_cuts)
-        computed_frequencies = compute_frequencies_from_genes(
+        computed_frequencies = frequencies if frequencies is not None else compute_frequencies_from_genes(
             genes,
             bar,
             material,
@@ -104,7 +217,7 @@ def _compute_frequencies_and_errors(
 
 
 def _batch_evaluate_population(
-    population: List[Individual],
+    population: Population,
     bar: BarParameters,
     material: Material,
     target_frequencies: List[float],
@@ -116,14 +229,16 @@ def _batch_evaluate_population(
     max_workers: int = 0,
     analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D,
     ny: int = 2,
-    nz: int = 2
-) -> List[Individual]:
+    nz: int = 2,
+    evaluator: Optional[Evaluator] = None,
+    solver_3d: str = 'auto'
+) -> Population:
     """
-    Batch evaluate population fitness using multithreading.
+    Batch evaluate population fitness on the evaluator's worker pool.
+    Returns a population sharing the gene and sigma arrays of the input.
     """
-    genes_array = [ind.genes for ind in population]
-    tuning_errors = batch_compute_fitness(
-        genes_array,
+    tuning_errors, frequencies = batch_compute_fitness(
+        population.genes,
         bar,
         material,
         target_frequencies,
@@ -133,37 +248,32 @@ def _batch_evaluate_population(
         max_workers,
         analysis_mode,
         ny,
-        nz
+        nz,
+        evaluator=evaluator,
+        return_frequencies=True,
+        solver_3d=solver_3d
     )
 
-    # Apply penalties if needed
-    result: List[Individual] = []
-    for i, ind in enumerate(population):
-        fitness = tuning_errors[i]
+    fitness = np.array(tuning_errors, dtype=np.float64)
 
-        if penalty_type != 'none' and penalty_weight > 0:
+    # Apply penalties if needed
+    if penalty_type != 'none' and penalty_weight > 0:
+        for i, genes in enumerate(population.genes.tolist()):
             # Extract cut genes only (exclude length trim)
-            cut_genes = ind.genes[:num_cuts * 2]
+            cut_genes = genes[:num_cuts * 2]
             cuts = genes_to_cuts(cut_genes)
 
             # Get effective bar length if length adjustment is used
-            length_adjust = get_length_adjust_from_genes(ind.genes, num_cuts)
+            length_adjust = get_length_adjust_from_genes(genes, num_cuts)
             effective_L = bar.L - 2 * length_adjust
 
             if penalty_type == 'volume':
                 penalty = compute_volume_penalty(cuts, effective_L, bar.h0)
-                fitness = (1 - penalty_weight) * fitness + penalty_weight * penalty
             else:
                 penalty = compute_roughness_penalty(cuts, bar.h0)
-                fitness = (1 - penalty_weight) * fitness + penalty_weight * penalty
+            fitness[i] = (1 - penalty_weight) * fitness[i] + penalty_weight * penalty
 
-        result.append(Individual(
-            genes=ind.genes.copy(),
-            fitness=fitness,
-            sigmas=ind.sigmas.copy() if ind.sigmas else None
-        ))
-
-    return result
+    return Population(population.genes, fitness, population.sigmas, frequencies)
 
 
 def run_evolutionary_algorithm(config: EAConfig) -> OptimizationResult:
@@ -184,6 +294,8 @@ def run_evolutionary_algorithm(config: EAConfig) -> OptimizationResult:
     penalty_weight = config.penalty_weight
     ea_params = config.ea_params or get_default_ea_parameters(num_cuts)
     seed_genes = config.seed_genes
+    stored, stored_settings_match = _lookup_stored_result(config, ea_params)
+    seeds = _stored_seeds(stored, num_cuts, ea_params) + list(config.seeds or [])
     on_progress = config.on_progress
     should_stop = config.should_stop
 
@@ -208,132 +320,147 @@ def run_evolutionary_algorithm(config: EAConfig) -> OptimizationResult:
     analysis_mode = ea_params.analysis_mode
     ny = ea_params.num_elements_y
     nz = ea_params.num_elements_z
+    rng = make_rng(ea_params.random_seed)
 
-    # Report Generation 0: uncut bar baseline
-    if on_progress:
-        uncut_bar = create_uncut_bar_individual(num_cuts, bounds, bar.h0)
-        [evaluated_uncut] = _batch_evaluate_population(
-            [uncut_bar], bar, material, target_frequencies,
-            penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
-            analysis_mode, ny, nz
-        )
-        freq_data = _compute_frequencies_and_errors(
-            evaluated_uncut.genes, bar, material, target_frequencies, ea_params.num_elements, num_cuts,
-            analysis_mode, ny, nz
-        )
-        on_progress(ProgressUpdate(
-            generation=0,
-            best_fitness=evaluated_uncut.fitness,
-            best_individual=evaluated_uncut,
-            average_fitness=evaluated_uncut.fitness,
-            computed_frequencies=freq_data["computed_frequencies"],
-            errors_in_cents=freq_data["errors_in_cents"],
-            length_trim=freq_data["length_trim"]
-        ))
-
-    # Initialize population (with optional seed)
-    population = initialize_population(ea_params.population_size, num_cuts, bounds, seed_genes)
-
-    # Evaluate initial population
-    population = _batch_evaluate_population(
-        population, bar, material, target_frequencies,
-        penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
-        analysis_mode, ny, nz
-    )
-
-    # Calculate percentages for different operations
-    num_elite = max(1, int(ea_params.population_size * ea_params.elitism_percent / 100))
-    num_crossover = int(ea_params.population_size * ea_params.crossover_percent / 100)
-    num_crossover_pairs = (num_crossover + 1) // 2
-
-    best_ever = get_best_individual(population)
-    generation = 0
-
-    # Main evolution loop
-    while generation < ea_params.max_generations:
-        # Check stopping condition
-        if should_stop and should_stop():
-            break
-
-        # Check if target error reached
-        if best_ever.fitness <= ea_params.target_error:
-            break
-
-        # Create next generation
-        next_generation: List[Individual] = []
-
-        # 1. Elitism: Keep best individuals unchanged
-        elite = select_elite(population, num_elite)
-        next_generation.extend(elite)
-
-        # 2. Crossover: Select parents and create children
-        new_offspring: List[Individual] = []
-        if num_crossover > 0:
-            mating_pairs = select_mating_pairs(population, num_crossover_pairs, 'roulette')
-
-            for parent1, parent2 in mating_pairs:
-                child1, child2 = heuristic_crossover(parent1, parent2, bounds)
-                new_offspring.append(child1)
-                if len(next_generation) + len(new_offspring) < ea_params.population_size:
-                    new_offspring.append(child2)
-
-        # 3. Mutation: Select individuals and mutate
-        sorted_pop = sorted(population, key=lambda ind: ind.fitness)
-        while len(next_generation) + len(new_offspring) < ea_params.population_size:
-            idx = int(len(sorted_pop) * min(0.5, (num_elite + num_crossover) / ea_params.population_size) *
-                     (1 + 0.5 * (1 - len(next_generation) / ea_params.population_size)))
-            idx = min(idx, len(sorted_pop) - 1)
-            parent = sorted_pop[idx]
-
-            # Use adaptive mutation if length adjustment is enabled
-            if has_length_adjust:
-                parent_freqs = compute_frequencies_from_genes(
-                    parent.genes, bar, material, 1, ea_params.num_elements, num_cuts,
-                    analysis_mode, ny, nz
-                )
-                f1_error = parent_freqs[0] - target_frequencies[0] if parent_freqs else 0
-                freq_error = FrequencyError(f1_error=f1_error)
-                mutant = adaptive_length_mutation(parent, ea_params.mutation_strength, bounds, freq_error)
-            else:
-                mutant = uniform_mutation(parent, ea_params.mutation_strength, bounds)
-            new_offspring.append(mutant)
-
-        # Batch evaluate all new offspring at once
-        if new_offspring:
-            evaluated_offspring = _batch_evaluate_population(
-                new_offspring, bar, material, target_frequencies,
-                penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
-                analysis_mode, ny, nz
-            )
-            next_generation.extend(evaluated_offspring)
-
-        # Update population
-        population = next_generation
-
-        # Update best ever
-        current_best = get_best_individual(population)
-        if current_best.fitness < best_ever.fitness:
-            best_ever = clone_individual(current_best)
-
-        generation += 1
-
-        # Report progress
+    # Worker pool for the whole run: the caller's evaluator or one owned by this run
+    evaluator = config.evaluator or Evaluator(ea_params.executor, max_workers)
+    try:
+        # Report Generation 0: uncut bar baseline
         if on_progress:
-            stats = calculate_population_stats(population)
+            uncut_bar = create_uncut_bar_individual(num_cuts, bounds, bar.h0)
+            evaluated_uncut = _batch_evaluate_population(
+                Population.from_individuals([uncut_bar]), bar, material, target_frequencies,
+                penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
+                analysis_mode, ny, nz, evaluator, ea_params.solver_3d
+            )[0].to_individual()
             freq_data = _compute_frequencies_and_errors(
-                best_ever.genes, bar, material, target_frequencies, ea_params.num_elements, num_cuts,
-                analysis_mode, ny, nz
+                evaluated_uncut.genes, bar, material, target_frequencies, ea_params.num_elements, num_cuts,
+                analysis_mode, ny, nz, evaluated_uncut.frequencies
             )
             on_progress(ProgressUpdate(
-                generation=generation,
-                best_fitness=best_ever.fitness,
-                best_individual=clone_individual(best_ever),
-                average_fitness=stats.average_fitness,
+                generation=0,
+                best_fitness=evaluated_uncut.fitness,
+                best_individual=evaluated_uncut,
+                average_fitness=evaluated_uncut.fitness,
                 computed_frequencies=freq_data["computed_frequencies"],
                 errors_in_cents=freq_data["errors_in_cents"],
                 length_trim=freq_data["length_trim"]
             ))
 
+        # Initialize population (with optional seeds)
+        population = Population.from_individuals(
+            initialize_population(ea_params.population_size, num_cuts, bounds, seed_genes, seeds, rng)
+        )
+
+        # Evaluate initial population
+        population = _batch_evaluate_population(
+            population, bar, material, target_frequencies,
+            penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
+            analysis_mode, ny, nz, evaluator, ea_params.solver_3d
+        )
+
+        # Calculate percentages for different operations
+        num_elite = max(1, int(ea_params.population_size * ea_params.elitism_percent / 100))
+        num_crossover = int(ea_params.population_size * ea_params.crossover_percent / 100)
+        num_crossover_pairs = (num_crossover + 1) // 2
+
+        best_ever = clone_individual(get_best_individual(population))
+        generation = 0
+
+        # Main evolution loop
+        while generation < ea_params.max_generations:
+            # Check stopping condition
+            if should_stop and should_stop():
+                break
+
+            # Check if target error reached
+            if best_ever.fitness <= ea_params.target_error:
+                break
+
+            # Operators run on the whole population as arrays
+            genes, fitness = population.genes, population.fitness
+            ranking = select_elite_indices(fitness, len(population))
+
+            # 1. Elitism: Keep best individuals unchanged
+            elite = population.take(ranking[:num_elite])
+
+            # 2. Crossover: Select parents and create children
+            offspring_genes: List[np.ndarray] = []
+            if num_crossover > 0:
+                pairs = select_mating_pairs_batch(fitness, num_crossover_pairs, rng)
+                children1, children2, _, _ = heuristic_crossover_batch(
+                    genes[pairs[:, 0]], genes[pairs[:, 1]], bounds, rng
+                )
+                # Children interleaved per pair; a second child only while there is room
+                room = ea_params.population_size - len(elite)
+                keep = np.ones((len(pairs), 2), dtype=bool)
+                keep[:, 1] = 2 * np.arange(len(pairs)) + 1 < room
+                children = np.stack([children1, children2], axis=1).reshape(-1, genes.shape[1])
+                offspring_genes.append(children[keep.ravel()])
+
+            # 3. Mutation: Mutate copies of one parent of the current ranking
+            num_mutants = ea_params.population_size - len(elite) - sum(map(len, offspring_genes))
+            if num_mutants > 0:
+                idx = int(len(population) * min(0.5, (num_elite + num_crossover) / ea_params.population_size) *
+                          (1 + 0.5 * (1 - len(elite) / ea_params.population_size)))
+                idx = min(idx, len(population) - 1)
+                parent = population[ranking[idx]]
+                parents = np.repeat(genes[ranking[idx]][None, :], num_mutants, axis=0)
+
+                # Use adaptive mutation if length adjustment is enabled
+                if has_length_adjust:
+                    parent_freqs = parent.frequencies or compute_frequencies_from_genes(
+                        parent.genes.tolist(), bar, material, 1, ea_params.num_elements, num_cuts,
+                        analysis_mode, ny, nz
+                    )
+                    f1_error = parent_freqs[0] - target_frequencies[0] if parent_freqs else 0
+                    offspring_genes.append(adaptive_length_mutation_batch(
+                        parents, ea_params.mutation_strength, bounds, np.full(num_mutants, f1_error), rng
+                    ))
+                else:
+                    offspring_genes.append(uniform_mutation_batch(
+                        parents, ea_params.mutation_strength, bounds, rng
+                    ))
+
+            # Batch evaluate all new offspring at once
+            next_generation = [elite]
+            if offspring_genes:
+                next_generation.append(_batch_evaluate_population(
+                    Population(np.concatenate(offspring_genes)), bar, material, target_frequencies,
+                    penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
+                    analysis_mode, ny, nz, evaluator, ea_params.solver_3d
+                ))
+
+            # Update population
+            population = Population.concatenate(next_generation)
+
+            # Update best ever
+            current_best = get_best_individual(population)
+            if current_best.fitness < best_ever.fitness:
+                best_ever = clone_individual(current_best)
+
+            generation += 1
+
+            # Report progress
+            if on_progress:
+                stats = calculate_population_stats(population)
+                freq_data = _compute_frequencies_and_errors(
+                    best_ever.genes, bar, material, target_frequencies, ea_params.num_elements, num_cuts,
+                    analysis_mode, ny, nz, best_ever.frequencies
+                )
+                on_progress(ProgressUpdate(
+                    generation=generation,
+                    best_fitness=best_ever.fitness,
+                    best_individual=clone_individual(best_ever),
+                    average_fitness=stats.average_fitness,
+                    computed_frequencies=freq_data["computed_frequencies"],
+                    errors_in_cents=freq_data["errors_in_cents"],
+                    length_trim=freq_data["length_trim"]
+                ))
+    finally:
+        if config.evaluator is None:
+            evaluator.close()
+
     # Get detailed results for best solution
     length_adjust = get_length_adjust_from_genes(best_ever.genes, num_cuts)
     effective_length = bar.L - 2 * length_adjust
@@ -358,10 +485,12 @@ def run_evolutionary_algorithm(config: EAConfig) -> OptimizationResult:
         penalty_type,
         penalty_weight,
         ea_params.num_elements,
-        num_cuts
+        num_cuts,
+        # Reuse the frequencies from evaluation (reported results use the 2D model)
+        best_ever.frequencies if analysis_mode == AnalysisMode.BEAM_2D else None
     )
 
-    return OptimizationResult(
+    result = OptimizationResult(
         best_individual=best_ever,
         cuts=genes_to_cuts(cut_genes),
         computed_frequencies=detailed.computed_frequencies,
@@ -375,6 +504,8 @@ def run_evolutionary_algorithm(config: EAConfig) -> OptimizationResult:
         length_trim=length_adjust,
         effective_length=effective_length
     )
+    _store_result(config, ea_params, result, stored if stored_settings_match else None, 'evolutionary')
+    return result
 
 
 def run_adaptive_evolution(config: EAConfig) -> OptimizationResult:
@@ -413,101 +544,110 @@ def run_adaptive_evolution(config: EAConfig) -> OptimizationResult:
     analysis_mode = ea_params.analysis_mode
     ny = ea_params.num_elements_y
     nz = ea_params.num_elements_z
+    rng = make_rng(ea_params.random_seed)
+    seed_genes = config.seed_genes
+    stored, stored_settings_match = _lookup_stored_result(config, ea_params)
+    seeds = _stored_seeds(stored, num_cuts, ea_params) + list(config.seeds or [])
 
-    # Report Generation 0: uncut bar baseline
-    if on_progress:
-        uncut_bar = create_uncut_bar_individual(num_cuts, bounds, bar.h0)
-        [evaluated_uncut] = _batch_evaluate_population(
-            [uncut_bar], bar, material, target_frequencies,
-            penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
-            analysis_mode, ny, nz
-        )
-        freq_data = _compute_frequencies_and_errors(
-            evaluated_uncut.genes, bar, material, target_frequencies, ea_params.num_elements, num_cuts,
-            analysis_mode, ny, nz
+    # Worker pool for the whole run: the caller's evaluator or one owned by this run
+    evaluator = config.evaluator or Evaluator(ea_params.executor, max_workers)
+    try:
+        # Report Generation 0: uncut bar baseline
+        if on_progress:
+            uncut_bar = create_uncut_bar_individual(num_cuts, bounds, bar.h0)
+            evaluated_uncut = _batch_evaluate_population(
+                Population.from_individuals([uncut_bar]), bar, material, target_frequencies,
+                penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
+                analysis_mode, ny, nz, evaluator, ea_params.solver_3d
+            )[0].to_individual()
+            freq_data = _compute_frequencies_and_errors(
+                evaluated_uncut.genes, bar, material, target_frequencies, ea_params.num_elements, num_cuts,
+                analysis_mode, ny, nz, evaluated_uncut.frequencies
+            )
+            on_progress(ProgressUpdate(
+                generation=0,
+                best_fitness=evaluated_uncut.fitness,
+                best_individual=evaluated_uncut,
+                average_fitness=evaluated_uncut.fitness,
+                computed_frequencies=freq_data["computed_frequencies"],
+                errors_in_cents=freq_data["errors_in_cents"],
+                length_trim=freq_data["length_trim"]
+            ))
+
+        # Initialize population with sigmas (with optional seeds)
+        population = Population.from_individuals(
+            initialize_population(ea_params.population_size, num_cuts, bounds, seed_genes, seeds, rng)
         )
-        on_progress(ProgressUpdate(
-            generation=0,
-            best_fitness=evaluated_uncut.fitness,
-            best_individual=evaluated_uncut,
-            average_fitness=evaluated_uncut.fitness,
-            computed_frequencies=freq_data["computed_frequencies"],
-            errors_in_cents=freq_data["errors_in_cents"],
-            length_trim=freq_data["length_trim"]
-        ))
-
-    # Initialize population with sigmas
-    population = initialize_population(ea_params.population_size, num_cuts, bounds)
-    for ind in population:
-        ind.sigmas = [0.2] * num_genes
-
-    # Evaluate initial population
-    population = _batch_evaluate_population(
-        population, bar, material, target_frequencies,
-        penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
-        analysis_mode, ny, nz
-    )
+        population.sigmas = np.full((len(population), num_genes), 0.2)
 
-    num_elite = max(1, int(ea_params.population_size * ea_params.elitism_percent / 100))
+        # Evaluate initial population
+        population = _batch_evaluate_population(
+            population, bar, material, target_frequencies,
+            penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
+            analysis_mode, ny, nz, evaluator, ea_params.solver_3d
+        )
 
-    best_ever = get_best_individual(population)
-    generation = 0
+        num_elite = max(1, int(ea_params.population_size * ea_params.elitism_percent / 100))
 
-    while generation < ea_params.max_generations:
-        if should_stop and should_stop():
-            break
-        if best_ever.fitness <= ea_params.target_error:
-            break
+        best_ever = clone_individual(get_best_individual(population))
+        generation = 0
 
-        next_generation: List[Individual] = []
+        while generation < ea_params.max_generations:
+            if should_stop and should_stop():
+                break
+            if best_ever.fitness <= ea_params.target_error:
+                break
 
-        # Elitism
-        elite = select_elite(population, num_elite)
-        next_generation.extend(elite)
+            ranking = select_elite_indices(population.fitness, len(population))
 
-        # Generate offspring through mutation only (mu + lambda strategy)
-        new_offspring: List[Individual] = []
-        sorted_pop = sorted(population, key=lambda ind: ind.fitness)
+            # Elitism
+            next_generation = [population.take(ranking[:num_elite])]
 
-        while len(next_generation) + len(new_offspring) < ea_params.population_size:
-            idx = int(len(sorted_pop) * 0.5 * (1 - len(new_offspring) / ea_params.population_size))
-            idx = min(idx, len(sorted_pop) - 1)
-            parent = sorted_pop[idx]
-            mutant = gaussian_self_adaptive_mutation(parent, ea_params.mutation_strength, bounds)
-            new_offspring.append(mutant)
+            # Generate offspring through mutation only (mu + lambda strategy),
+            # parents moving from the middle of the ranking towards the best
+            num_mutants = ea_params.population_size - len(next_generation[0])
+            if num_mutants > 0:
+                idx = (len(population) * 0.5 * (1 - np.arange(num_mutants) / ea_params.population_size)).astype(int)
+                parents = ranking[np.minimum(idx, len(population) - 1)]
+                mutant_genes, mutant_sigmas = gaussian_self_adaptive_mutation_batch(
+                    population.genes[parents],
+                    population.sigmas[parents] if population.sigmas is not None else None,
+                    ea_params.mutation_strength, bounds, rng
+                )
 
-        # Batch evaluate all new offspring at once
-        if new_offspring:
-            evaluated_offspring = _batch_evaluate_population(
-                new_offspring, bar, material, target_frequencies,
-                penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
-                analysis_mode, ny, nz
-            )
-            next_generation.extend(evaluated_offspring)
+                # Batch evaluate all new offspring at once
+                next_generation.append(_batch_evaluate_population(
+                    Population(mutant_genes, sigmas=mutant_sigmas), bar, material, target_frequencies,
+                    penalty_type, penalty_weight, ea_params.num_elements, f1_priority, num_cuts, max_workers,
+                    analysis_mode, ny, nz, evaluator, ea_params.solver_3d
+                ))
 
-        population = next_generation
+            population = Population.concatenate(next_generation)
 
-        current_best = get_best_individual(population)
-        if current_best.fitness < best_ever.fitness:
-            best_ever = clone_individual(current_best)
+            current_best = get_best_individual(population)
+            if current_best.fitness < best_ever.fitness:
+                best_ever = clone_individual(current_best)
 
-        generation += 1
+            generation += 1
 
-        if on_progress:
-            stats = calculate_population_stats(population)
-            freq_data = _compute_frequencies_and_errors(
-                best_ever.genes, bar, material, target_frequencies, ea_params.num_elements, num_cuts,
-                analysis_mode, ny, nz
-            )
-            on_progress(ProgressUpdate(
-                generation=generation,
-                best_fitness=best_ever.fitness,
-                best_individual=clone_individual(best_ever),
-                average_fitness=stats.average_fitness,
-                computed_frequencies=freq_data["computed_frequencies"],
-                errors_in_cents=freq_data["errors_in_cents"],
-                length_trim=freq_data["length_trim"]
-            ))
+            if on_progress:
+                stats = calculate_population_stats(population)
+                freq_data = _compute_frequencies_and_errors(
+                    best_ever.genes, bar, material, target_frequencies, ea_params.num_elements, num_cuts,
+                    analysis_mode, ny, nz, best_ever.frequencies
+                )
+                on_progress(ProgressUpdate(
+                    generation=generation,
+                    best_fitness=best_ever.fitness,
+                    best_individual=clone_individual(best_ever),
+                    average_fitness=stats.average_fitness,
+                    computed_frequencies=freq_data["computed_frequencies"],
+                    errors_in_cents=freq_data["errors_in_cents"],
+                    length_trim=freq_data["length_trim"]
+                ))
+    finally:
+        if config.evaluator is None:
+            evaluator.close()
 
     # Get detailed results
     length_adjust = get_length_adjust_from_genes(best_ever.genes, num_cuts)
@@ -531,10 +671,12 @@ def run_adaptive_evolution(config: EAConfig) -> OptimizationResult:
         penalty_type,
         penalty_weight,
         ea_params.num_elements,
-        num_cuts
+        num_cuts,
+        # Reuse the frequencies from evaluation (reported results use the 2D model)
+        best_ever.frequencies if analysis_mode == AnalysisMode.BEAM_2D else None
     )
 
-    return OptimizationResult(
+    result = OptimizationResult(
         best_individual=best_ever,
         cuts=genes_to_cuts(cut_genes),
         computed_frequencies=detailed.computed_frequencies,
@@ -548,6 +690,8 @@ def run_adaptive_evolution(config: EAConfig) -> OptimizationResult:
         length_trim=length_adjust,
         effective_length=effective_length
     )
+    _store_result(config, ea_params, result, stored if stored_settings_match else None, 'adaptive')
+    return result
 
 
 def get_default_ea_parameters(num_cuts: int) -> EAParameters:
@@ -5,7 +5,7 @@ Implements the tuning error objective function from the paper (Eq. 7)
 and combined objective functions with penalties (Eq. 11, 13).
 """
 
-from typing import List, Literal
+from typing import List, Optional, Literal
 import math
 
 from ..types import Individual, BarParameters, Material, DetailedEvaluation
@@ -249,23 +249,26 @@ def evaluate_detailed(
     penalty_type: Literal['volume', 'roughness', 'none'],
     alpha: float,
     num_elements: int = 150,
-    num_cuts: int = 1
+    num_cuts: int = 1,
+    computed_frequencies: Optional[List[float]] = None
 ) -> DetailedEvaluation:
     """
     Get detailed evaluation results for an individual.
     Used for displaying results to user.
+    Pass computed_frequencies when they are already known to skip the solve.
     """
     cuts = genes_to_cuts(genes)
 
     # Compute frequencies
-    computed_frequencies = compute_frequencies_from_genes(
-        genes,
-        bar,
-        material,
-        len(target_freq),
-        num_elements,
-        num_cuts
-    )
+    if computed_frequencies is None:
+        computed_frequencies = compute_frequencies_from_genes(
+            genes,
+            bar,
+            material,
+            len(target_freq),
+            num_elements,
+            num_cuts
+        )
 
     # Compute tuning error
     tuning_error = compute_tuning_error(computed_frequencies, target_freq)
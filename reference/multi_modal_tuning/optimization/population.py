@@ -2,14 +2,17 @@
 Population Management for Evolutionary Algorithm
 
 Handles creation, manipulation, and analysis of populations of individuals.
+A population is either a list of Individuals or an array-backed Population.
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Sequence, Union
 from dataclasses import dataclass
 import random
 import math
+import numpy as np
 
 from ..types import Individual, VariableBounds, BarParameters
+from .vectorized import select_elite_indices
 
 
 @dataclass
@@ -33,6 +36,183 @@ class PopulationStats:
     standard_deviation: float
 
 
+class IndividualView:
+    """
+    One individual of a Population.
+
+    genes and sigmas are rows of the population arrays (not copies);
+    use to_individual() or clone_individual() for a standalone Individual.
+    """
+    __slots__ = ('population', 'index')
+
+    def __init__(self, population: 'Population', index: int):
+        self.population = population
+        self.index = index
+
+    @property
+    def genes(self) -> np.ndarray:
+        return self.population.genes[self.index]
+
+    @property
+    def fitness(self) -> float:
+        return float(self.population.fitness[self.index])
+
+    @fitness.setter
+    def fitness(self, value: float) -> None:
+        self.population.fitness[self.index] = value
+
+    @property
+    def sigmas(self) -> Optional[np.ndarray]:
+        sigmas = self.population.sigmas
+        return sigmas[self.index] if sigmas is not None else None
+
+    @property
+    def frequencies(self) -> Optional[List[float]]:
+        """Frequencies of the last evaluation (None if unknown or the solve failed)."""
+        frequencies = self.population.frequencies
+        if frequencies is None or not np.all(np.isfinite(frequencies[self.index])):
+            return None
+        return frequencies[self.index].tolist()
+
+    def to_individual(self) -> Individual:
+        """Standalone copy as an Individual."""
+        sigmas = self.sigmas
+        return Individual(
+            genes=self.genes.tolist(),
+            fitness=self.fitness,
+            sigmas=sigmas.tolist() if sigmas is not None else None,
+            frequencies=self.frequencies
+        )
+
+    def __repr__(self) -> str:
+        return f"IndividualView(index={self.index}, fitness={self.fitness})"
+
+
+class Population:
+    """
+    Array-backed population.
+
+    Attributes:
+        genes: (P, G) gene matrix
+        fitness: (P,) fitness values (inf = not evaluated)
+        sigmas: (P, G) self-adaptive step sizes, or None
+        frequencies: (P, num_modes) frequencies of the last evaluation with
+            NaN rows where unknown, or None
+
+    Indexing with an int gives an IndividualView; indexing with a slice,
+    index array or mask gives a new Population holding copies of the rows.
+    """
+    __slots__ = ('genes', 'fitness', 'sigmas', 'frequencies')
+
+    def __init__(
+        self,
+        genes: np.ndarray,
+        fitness: Optional[np.ndarray] = None,
+        sigmas: Optional[np.ndarray] = None,
+        frequencies: Optional[np.ndarray] = None
+    ):
+        genes = np.asarray(genes, dtype=np.float64)
+        if genes.ndim < 2:
+            # A single gene vector is one individual; an empty input is an empty population
+            genes = genes.reshape(1, -1) if genes.size else genes.reshape(0, 0)
+        self.genes = genes
+        num_individuals = len(self.genes)
+        self.fitness = (
+            np.full(num_individuals, math.inf) if fitness is None
+            else np.asarray(fitness, dtype=np.float64)
+        )
+        self.sigmas = None if sigmas is None else np.asarray(sigmas, dtype=np.float64)
+        self.frequencies = None if frequencies is None else np.asarray(frequencies, dtype=np.float64)
+
+    @classmethod
+    def from_individuals(cls, individuals: Sequence[Individual]) -> 'Population':
+        """
+        Population from a list of Individuals.
+
+        sigmas are kept only if every individual has them; missing
+        frequencies become NaN rows.
+        """
+        genes = np.array([ind.genes for ind in individuals], dtype=np.float64)
+        fitness = np.array([ind.fitness for ind in individuals], dtype=np.float64)
+
+        sigmas = None
+        if individuals and all(ind.sigmas is not None for ind in individuals):
+            sigmas = np.array([ind.sigmas for ind in individuals], dtype=np.float64)
+
+        frequencies = None
+        num_modes = max((len(ind.frequencies) for ind in individuals if ind.frequencies), default=0)
+        if num_modes > 0:
+            frequencies = np.full((len(individuals), num_modes), np.nan)
+            for i, ind in enumerate(individuals):
+                if ind.frequencies:
+                    frequencies[i, :len(ind.frequencies)] = ind.frequencies
+
+        return cls(genes, fitness, sigmas, frequencies)
+
+    @classmethod
+    def concatenate(cls, populations: Sequence['Population']) -> 'Population':
+        """
+        Stack populations into one.
+
+        sigmas are kept only if every population has them; frequencies are
+        padded with NaN. Empty populations are skipped.
+        """
+        populations = [pop for pop in populations if len(pop) > 0] or list(populations[:1])
+        genes = np.concatenate([pop.genes for pop in populations])
+        fitness = np.concatenate([pop.fitness for pop in populations])
+
+        sigmas = None
+        if all(pop.sigmas is not None for pop in populations):
+            sigmas = np.concatenate([pop.sigmas for pop in populations])
+
+        frequencies = None
+        num_modes = max((pop.frequencies.shape[1] for pop in populations if pop.frequencies is not None), default=0)
+        if num_modes > 0:
+            frequencies = np.full((len(genes), num_modes), np.nan)
+            start = 0
+            for pop in populations:
+                if pop.frequencies is not None:
+                    frequencies[start:start + len(pop), :pop.frequencies.shape[1]] = pop.frequencies
+                start += len(pop)
+
+        return cls(genes, fitness, sigmas, frequencies)
+
+    def to_individuals(self) -> List[Individual]:
+        """Standalone Individuals for every row."""
+        return [view.to_individual() for view in self]
+
+    def take(self, indices) -> 'Population':
+        """New population with copies of the selected rows."""
+        if isinstance(indices, slice):
+            # Basic slicing would return views
+            indices = np.arange(len(self))[indices]
+        return Population(
+            self.genes[indices],
+            self.fitness[indices],
+            self.sigmas[indices] if self.sigmas is not None else None,
+            self.frequencies[indices] if self.frequencies is not None else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.genes)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("population index out of range")
+            return IndividualView(self, int(index))
+        return self.take(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield IndividualView(self, i)
+
+    def __repr__(self) -> str:
+        return f"Population(size={len(self)}, num_genes={self.genes.shape[1]})"
+
+
 def create_bounds(
     bar: BarParameters,
     num_cuts: int,
@@ -106,17 +286,23 @@ def create_uncut_bar_individual(
     return Individual(genes=genes, fitness=float('inf'))
 
 
-def create_random_individual(num_cuts: int, bounds: VariableBounds) -> Individual:
+def create_random_individual(
+    num_cuts: int,
+    bounds: VariableBounds,
+    rng: Optional[np.random.Generator] = None
+) -> Individual:
     """
     Create a random individual within bounds, respecting min/max cut width constraints.
 
     Args:
         num_cuts: Number of cuts (2 genes per cut: lambda, h)
         bounds: Variable bounds
+        rng: Random generator (None = the random module)
 
     Returns:
         New individual with random genes
     """
+    uniform = rng.random if rng is not None else random.random
     genes: List[float] = []
     min_width = bounds.min_cut_width or 0.0
     max_width = bounds.max_cut_width or 0.0
@@ -126,7 +312,7 @@ def create_random_individual(num_cuts: int, bounds: VariableBounds) -> Individua
 
     if num_cuts == 1:
         # Single cut
-        lambda_ = bounds.lambda_min + random.random() * (bounds.lambda_max - bounds.lambda_min)
+        lambda_ = bounds.lambda_min + uniform() * (bounds.lambda_max - bounds.lambda_min)
         if max_width > 0:
             lambda_ = min(lambda_, max_width)
         lambdas.append(lambda_)
@@ -148,7 +334,7 @@ def create_random_individual(num_cuts: int, bounds: VariableBounds) -> Individua
             if cut_max < cut_min:
                 cut_max = cut_min
 
-            lambda_ = cut_min + random.random() * (cut_max - cut_min)
+            lambda_ = cut_min + uniform() * (cut_max - cut_min)
             lambdas.append(lambda_)
 
             current_max = lambda_ - min_width
@@ -159,7 +345,7 @@ def create_random_individual(num_cuts: int, bounds: VariableBounds) -> Individua
     # Build genes array with lambdas and random heights
     for i in range(num_cuts):
         genes.append(lambdas[i])
-        h = bounds.h_min + random.random() * (bounds.h_max - bounds.h_min)
+        h = bounds.h_min + uniform() * (bounds.h_max - bounds.h_min)
         genes.append(h)
 
     # Add length adjustment gene if enabled
@@ -167,7 +353,7 @@ def create_random_individual(num_cuts: int, bounds: VariableBounds) -> Individua
     if has_length_adjust:
         min_val = -bounds.max_length_extend
         max_val = bounds.max_length_trim
-        length_adjust = min_val + random.random() * (max_val - min_val)
+        length_adjust = min_val + uniform() * (max_val - min_val)
         genes.append(length_adjust)
 
     return Individual(genes=genes, fitness=float('inf'))
@@ -177,7 +363,9 @@ def initialize_population(
     population_size: int,
     num_cuts: int,
     bounds: VariableBounds,
-    seed_genes: Optional[List[float]] = None
+    seed_genes: Optional[List[float]] = None,
+    seeds: Optional[List[List[float]]] = None,
+    rng: Optional[np.random.Generator] = None
 ) -> List[Individual]:
     """
     Initialize a population of random individuals, optionally seeded with initial genes.
@@ -187,23 +375,33 @@ def initialize_population(
         num_cuts: Number of cuts per individual
         bounds: Variable bounds
         seed_genes: Optional seed genes to use for initial individual(s)
+        seeds: Optional further seed gene vectors (e.g. from neighbouring
+            notes); the variants are shared out between all seeds
+        rng: Random generator for the random individuals and seed variants
+            (None = the random module)
 
     Returns:
         Array of individuals
     """
+    uniform = rng.random if rng is not None else random.random
     population: List[Individual] = []
 
-    # If seed genes provided, create an individual from them
-    if seed_genes and len(seed_genes) > 0:
-        clamped_genes = clamp_to_bounds(seed_genes, bounds)
+    all_seeds = [g for g in [seed_genes] + list(seeds or []) if g and len(g) > 0]
+    num_variants = min(int(population_size * 0.2), 10)
+    for k, genes in enumerate(all_seeds):
+        if len(population) >= population_size:
+            break
+
+        # Create an individual from each seed
+        clamped_genes = clamp_to_bounds(list(genes), bounds)
         population.append(Individual(genes=clamped_genes, fitness=float('inf')))
 
         # Also add some mutated variants of the seed for diversity
-        num_variants = min(int(population_size * 0.2), 10)
-        for _ in range(num_variants):
+        seed_variants = num_variants // len(all_seeds) + (1 if k < num_variants % len(all_seeds) else 0)
+        for _ in range(seed_variants):
             if len(population) >= population_size:
                 break
-            variant_genes = [g * (0.95 + random.random() * 0.1) for g in clamped_genes]
+            variant_genes = [g * (0.95 + uniform() * 0.1) for g in clamped_genes]
             population.append(Individual(
                 genes=clamp_to_bounds(variant_genes, bounds),
                 fitness=float('inf')
@@ -211,29 +409,42 @@ def initialize_population(
 
     # Fill remaining slots with random individuals
     while len(population) < population_size:
-        population.append(create_random_individual(num_cuts, bounds))
+        population.append(create_random_individual(num_cuts, bounds, rng))
 
     return population
 
 
-def get_best_individual(population: List[Individual]) -> Individual:
+def get_best_individual(
+    population: Union[List[Individual], Population]
+) -> Union[Individual, IndividualView]:
     """
     Get the best individual from a population.
     (Lowest fitness is best - we're minimizing)
     """
+    if isinstance(population, Population):
+        return population[int(np.argmin(population.fitness))]
     return min(population, key=lambda ind: ind.fitness)
 
 
-def get_top_individuals(population: List[Individual], n: int) -> List[Individual]:
-    """Get the N best individuals from a population."""
+def get_top_individuals(
+    population: Union[List[Individual], Population],
+    n: int
+) -> Union[List[Individual], Population]:
+    """Get the N best individuals from a population (a Population for a Population)."""
+    if isinstance(population, Population):
+        return population.take(select_elite_indices(population.fitness, n))
     return sorted(population, key=lambda ind: ind.fitness)[:n]
 
 
-def calculate_population_stats(population: List[Individual]) -> PopulationStats:
+def calculate_population_stats(population: Union[List[Individual], Population]) -> PopulationStats:
     """Calculate population statistics."""
-    fitnesses = [ind.fitness for ind in population if math.isfinite(ind.fitness)]
+    if isinstance(population, Population):
+        fitnesses = population.fitness
+    else:
+        fitnesses = np.array([ind.fitness for ind in population], dtype=np.float64)
+    fitnesses = fitnesses[np.isfinite(fitnesses)]
 
-    if not fitnesses:
+    if len(fitnesses) == 0:
         return PopulationStats(
             best_fitness=float('inf'),
             worst_fitness=float('inf'),
@@ -242,34 +453,24 @@ def calculate_population_stats(population: List[Individual]) -> PopulationStats:
             standard_deviation=0.0
         )
 
-    fitnesses.sort()
-
-    average = sum(fitnesses) / len(fitnesses)
-
-    if len(fitnesses) % 2 == 0:
-        median = (fitnesses[len(fitnesses) // 2 - 1] + fitnesses[len(fitnesses) // 2]) / 2
-    else:
-        median = fitnesses[len(fitnesses) // 2]
-
-    squared_diffs = [(f - average) ** 2 for f in fitnesses]
-    variance = sum(squared_diffs) / len(fitnesses)
-    std_dev = math.sqrt(variance)
-
     return PopulationStats(
-        best_fitness=fitnesses[0],
-        worst_fitness=fitnesses[-1],
-        average_fitness=average,
-        median_fitness=median,
-        standard_deviation=std_dev
+        best_fitness=float(np.min(fitnesses)),
+        worst_fitness=float(np.max(fitnesses)),
+        average_fitness=float(np.mean(fitnesses)),
+        median_fitness=float(np.median(fitnesses)),
+        standard_deviation=float(np.std(fitnesses))
     )
 
 
-def clone_individual(individual: Individual) -> Individual:
+def clone_individual(individual: Union[Individual, IndividualView]) -> Individual:
     """Deep clone an individual."""
+    if isinstance(individual, IndividualView):
+        return individual.to_individual()
     return Individual(
         genes=individual.genes.copy(),
         fitness=individual.fitness,
-        sigmas=individual.sigmas.copy() if individual.sigmas else None
+        sigmas=individual.sigmas.copy() if individual.sigmas else None,
+        frequencies=individual.frequencies.copy() if individual.frequencies else None
     )
 
 
@@ -352,7 +553,7 @@ def get_length_adjust_from_genes(genes: List[float], num_cuts: int) -> float:
     return 0.0
 
 
-def calculate_diversity(population: List[Individual]) -> float:
+def calculate_diversity(population: Union[List[Individual], Population]) -> float:
     """
     Calculate diversity measure for population.
     Higher values indicate more diverse population.
@@ -360,6 +561,9 @@ def calculate_diversity(population: List[Individual]) -> float:
     if len(population) < 2:
         return 0.0
 
+    if isinstance(population, Population):
+        return float(np.sqrt(np.mean(np.var(population.genes, axis=0))))
+
     num_genes = len(population[0].genes)
     total_variance = 0.0
 
@@ -0,0 +1,590 @@
+"""
+Range Pipeline for Multi-Note Bar Sets
+
+Runs every bar of a note range through the multi-stage workflow:
+
+1. Length search with the 2D model
+2. Fast 2D optimization (with length trim/extension)
+3. 3D check with mode classification, giving the 2D/3D frequency offset
+4. Corrected 2D optimization, seeded from stage 2
+5. Final 3D verification with mode classification
+
+Each stage of each bar is a separate task on a process pool. A bar's
+stages run in order, but different bars are independent, so while one
+bar is in a long 3D solve the other workers run the 2D stages of other
+bars. Bars that are further along are scheduled first, which keeps the
+number of half-finished bars low and lets results stream out as bars
+finish instead of all at the end.
+
+Adjacent notes have nearly the same optimal geometry once scaled by the
+bar length. With warm_start, the first 2D optimization of a bar is seeded
+with the best genes of the nearest bars below and above it whose 2D stage
+has already finished, with cut positions and length adjustment scaled by
+the ratio of the bar lengths.
+
+With a result_store, every finished bar is stored. A bar with a stored
+result for the same model settings that meets target_error is not
+recomputed; any other stored result of the bar seeds its first 2D stage,
+so re-running a range after a change only redoes the bars it affects.
+"""
+
+from typing import Callable, Dict, Iterator, List, Literal, Optional, Sequence
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+import time
+import zlib
+
+from ..types import BarParameters, Cut, EAParameters, Material, AnalysisMode
+from ..data.presets import calculate_target_frequencies
+from ..physics.frequencies import _resolve_max_workers
+from ..physics.fem_3d import compute_frequencies_3d_classified
+from ..physics.solver_selection import get_solver_calibration
+from ..physics.bar_profile import genes_to_cuts, generate_element_heights
+from ..utils.bar_length_finder import find_optimal_length
+from ..utils.note_utils import NoteInfo, frequency_error_cents
+from ..utils.result_store import MODEL_VERSION, ResultStore, StoredResult, material_key
+from .algorithm import run_evolutionary_algorithm, EAConfig
+
+STAGES = ('length', 'ea_2d', 'check_3d', 'refine_2d', 'verify_3d')
+
+STAGES_3D = frozenset({'check_3d', 'verify_3d'})
+
+
+@dataclass
+class RangePipelineConfig:
+    """Settings shared by all bars of a range."""
+    width_mm: float
+    height_mm: float
+    material: Material
+    ratios: List[float]               # Tuning ratios, e.g. [1, 3, 6]
+    num_cuts: int = 2
+    min_length_mm: float = 100.0      # Length search bounds
+    max_length_mm: float = 600.0
+    population_size: int = 50
+    max_generations: int = 100
+    target_error: float = 0.05        # Target tuning error (%) of the corrected 2D stage
+    f1_priority: float = 1.5
+    max_length_adjust: float = 0.02   # Trim/extension allowed in the first 2D stage (m)
+    num_elements_2d: int = 120
+    num_elements_3d_x: int = 120
+    ny: int = 2
+    nz: int = 24
+    num_modes_3d: int = 10            # Modes requested for 3D classification
+    # Stage backend: 'process' (one stage per worker process), 'thread' or 'serial'
+    executor: Literal['thread', 'process', 'serial'] = 'process'
+    max_workers: int = 0              # 0 = auto
+    max_concurrent_3d: int = 0        # 3D stages running at once (0 = no limit)
+    warm_start: bool = True           # Seed the 2D stage from finished neighbouring bars
+    # Seeds the EA of every stage from (seed, note, stage), so 'process' and
+    # 'serial' runs give the same results whichever worker ran a stage (None = unseeded).
+    # Warm starts depend on which neighbours finished first, so parallel runs
+    # with warm_start are only reproducible with 'serial'.
+    random_seed: Optional[int] = None
+    # Reuse and store finished bars (None = always recompute)
+    result_store: Optional[ResultStore] = None
+
+
+@dataclass
+class BarPipelineResult:
+    """Result for a single bar of a range."""
+    note_name: str
+    note_frequency: float
+    bar_length: float                 # mm (final length)
+    initial_length: float             # mm (length from the length search)
+    target_frequencies: List[float]
+    computed_frequencies_2d: List[float]
+    computed_frequencies_3d: List[float]
+    frequency_offset: List[float]     # 3D - 2D for each mode
+    final_frequencies: List[float]    # 3D vertical bending modes
+    errors_cents: List[float]
+    tuning_error: float
+    cuts: List[Cut]
+    optimization_time: float          # seconds spent in the stages of this bar
+    success: bool
+    error_message: Optional[str] = None
+    bar: Optional[BarParameters] = None
+    classified_modes: Dict[str, List[dict]] = field(default_factory=dict)  # Final 3D modes by family
+    stage_times: Dict[str, float] = field(default_factory=dict)
+    generations_2d: int = 0           # Generations of the first 2D stage
+    generations_refined: int = 0      # Generations of the corrected 2D stage
+    seeded_from: List[str] = field(default_factory=list)  # Notes the 2D stage was seeded from
+    from_store: bool = False          # Taken from the result store, not recomputed
+
+
+@dataclass
+class _BarState:
+    """Intermediate results of one bar, passed between stages."""
+    index: int
+    note_name: str
+    note_frequency: float
+    target_frequencies: List[float]
+    stage: int = 0
+    bar: Optional[BarParameters] = None
+    initial_length: float = 0.0
+    seeds: List[List[float]] = field(default_factory=list)
+    seeded_from: List[str] = field(default_factory=list)
+    best_genes_2d: List[float] = field(default_factory=list)  # Including the length gene
+    genes_2d: List[float] = field(default_factory=list)
+    generations_2d: int = 0
+    generations_refined: int = 0
+    computed_frequencies_2d: List[float] = field(default_factory=list)
+    computed_frequencies_3d: List[float] = field(default_factory=list)
+    frequency_offset: List[float] = field(default_factory=list)
+    genes_final: List[float] = field(default_factory=list)
+    final_frequencies: List[float] = field(default_factory=list)
+    classified_modes: Dict[str, List[dict]] = field(default_factory=dict)
+    stage_times: Dict[str, float] = field(default_factory=dict)
+    stored: Optional[StoredResult] = None  # Earlier result of the bar (seeds the 2D stage)
+    stored_settings_match: bool = False    # The stored result has the current model settings
+    from_store: bool = False
+
+    @property
+    def next_stage(self) -> Optional[str]:
+        return STAGES[self.stage] if self.stage < len(STAGES) else None
+
+
+def _bending_frequencies_3d(bar: BarParameters, genes: List[float], config: RangePipelineConfig, num_modes: int):
+    """
+    Vertical bending frequencies of a design with the 3D model, padded with
+    unclassified modes if fewer bending modes were found.
+
+    Returns:
+        Tuple of (bending frequencies, classified modes)
+    """
+    cuts = genes_to_cuts(genes[:config.num_cuts * 2])
+    element_heights = generate_element_heights(cuts, bar.L, bar.h0, config.num_elements_3d_x)
+    material = config.material
+    all_frequencies, classified, _ = compute_frequencies_3d_classified(
+        element_heights, bar.L, bar.b, material.E, material.rho, material.nu,
+        num_modes=config.num_modes_3d, ny=config.ny, nz=config.nz
+    )
+
+    frequencies = [m['frequency'] for m in classified.get('vertical_bending', [])[:num_modes]]
+    while len(frequencies) < num_modes:
+        frequencies.append(all_frequencies[len(frequencies)] if len(frequencies) < len(all_frequencies) else 0)
+    return frequencies, classified
+
+
+def _rescale_genes(genes: List[float], num_cuts: int, length_ratio: float) -> List[float]:
+    """
+    Genes of a bar carried over to a bar length_ratio times as long.
+
+    Cut positions (lambda) and the length adjustment scale with the length;
+    cut heights are kept, since all bars of a range share the thickness.
+    """
+    scaled = list(genes)
+    for i in range(0, min(2 * num_cuts, len(scaled)), 2):
+        scaled[i] *= length_ratio
+    if len(scaled) > 2 * num_cuts:
+        scaled[2 * num_cuts] *= length_ratio
+    return scaled
+
+
+def _neighbour_seeds(state: '_BarState', states: Sequence['_BarState'], num_cuts: int) -> None:
+    """Seed a bar from the nearest bars below and above with a finished 2D stage."""
+    finished = [s for s in states if s.best_genes_2d and s is not state]
+    below = [s for s in finished if s.index < state.index]
+    above = [s for s in finished if s.index > state.index]
+    neighbours = []
+    if below:
+        neighbours.append(max(below, key=lambda s: s.index))
+    if above:
+        neighbours.append(min(above, key=lambda s: s.index))
+
+    state.seeds = [
+        _rescale_genes(s.best_genes_2d, num_cuts, state.initial_length / s.initial_length)
+        for s in neighbours
+    ]
+    state.seeded_from = [s.note_name for s in neighbours]
+
+
+def _stored_seed(state: '_BarState', num_cuts: int) -> None:
+    """Put the 2D genes of the bar's stored result first among its seeds."""
+    metadata = state.stored.metadata
+    genes, length = metadata.get('best_genes_2d'), metadata.get('initial_length')
+    if genes and length:
+        state.seeds.insert(0, _rescale_genes(genes, num_cuts, state.initial_length / length))
+        state.seeded_from.insert(0, 'store')
+
+
+def _result_store_key(config: RangePipelineConfig, note_name: str) -> dict:
+    """Bar description a range bar is stored under."""
+    return dict(
+        material_key(config.material),
+        width_mm=config.width_mm,
+        height_mm=config.height_mm,
+        ratios=config.ratios,
+        num_cuts=config.num_cuts,
+        note=note_name,
+    )
+
+
+def _result_store_settings(config: RangePipelineConfig) -> dict:
+    """Model settings that change the result of a bar (not the search effort)."""
+    return {
+        'model_version': MODEL_VERSION,
+        'min_length_mm': config.min_length_mm,
+        'max_length_mm': config.max_length_mm,
+        'max_length_adjust': config.max_length_adjust,
+        'num_elements_2d': config.num_elements_2d,
+        'num_elements_3d_x': config.num_elements_3d_x,
+        'ny': config.ny,
+        'nz': config.nz,
+        'num_modes_3d': config.num_modes_3d,
+        'f1_priority': config.f1_priority,
+    }
+
+
+def _restore_stored(state: '_BarState', stored: StoredResult, config: RangePipelineConfig) -> None:
+    """Fill a bar's state from a stored result, marking all stages done."""
+    metadata = stored.metadata
+    width, height = config.width_mm / 1000, config.height_mm / 1000
+    state.bar = BarParameters(L=stored.bar_length / 1000, b=width, h0=height, hMin=height / 10)
+    state.initial_length = metadata.get('initial_length', stored.bar_length)
+    state.best_genes_2d = list(metadata.get('best_genes_2d', []))
+    state.genes_2d = state.best_genes_2d[:config.num_cuts * 2]
+    state.computed_frequencies_2d = list(metadata.get('computed_frequencies_2d', []))
+    state.computed_frequencies_3d = list(metadata.get('computed_frequencies_3d', []))
+    state.frequency_offset = list(stored.frequency_offset)
+    state.genes_final = list(stored.genes)
+    state.final_frequencies = list(stored.frequencies)
+    state.classified_modes = metadata.get('classified_modes', {})
+    state.generations_2d = metadata.get('generations_2d', 0)
+    state.generations_refined = metadata.get('generations_refined', 0)
+    state.stage = len(STAGES)
+    state.from_store = True
+
+
+def _store_bar(result: 'BarPipelineResult', state: '_BarState', config: RangePipelineConfig) -> None:
+    """Store a finished bar unless a result with the same settings was at least as good."""
+    if config.result_store is None or state.from_store:
+        return
+    if state.stored_settings_match and result.tuning_error >= state.stored.tuning_error:
+        return
+    config.result_store.put(
+        'range_bar',
+        _result_store_key(config, state.note_name),
+        _result_store_settings(config),
+        genes=state.genes_final,
+        bar_length=result.bar_length,
+        target_frequencies=result.target_frequencies,
+        frequencies=result.final_frequencies,
+        tuning_error=result.tuning_error,
+        frequency_offset=result.frequency_offset,
+        metadata={
+            'initial_length': state.initial_length,
+            'best_genes_2d': state.best_genes_2d,
+            'computed_frequencies_2d': state.computed_frequencies_2d,
+            'computed_frequencies_3d': state.computed_frequencies_3d,
+            'classified_modes': state.classified_modes,
+            'generations_2d': state.generations_2d,
+            'generations_refined': state.generations_refined,
+            'stage_times': state.stage_times,
+            'seeded_from': state.seeded_from,
+            'population_size': config.population_size,
+            'max_generations': config.max_generations,
+            'target_error': config.target_error,
+            'random_seed': config.random_seed,
+        },
+    )
+
+
+def _load_stored(states: Sequence['_BarState'], config: RangePipelineConfig) -> None:
+    """Look up the stored results of all bars; restore those that need no recomputation."""
+    settings = _result_store_settings(config)
+    for state in states:
+        key = _result_store_key(config, state.note_name)
+        stored = config.result_store.best('range_bar', key, settings)
+        if stored is not None and stored.tuning_error <= config.target_error:
+            _restore_stored(state, stored, config)
+            continue
+        state.stored_settings_match = stored is not None
+        state.stored = stored or config.result_store.best('range_bar', key)
+
+
+def _seed_2d_stage(state: '_BarState', states: Sequence['_BarState'], config: RangePipelineConfig) -> None:
+    """Seeds of the first 2D stage: the bar's stored result and finished neighbours."""
+    state.seeds, state.seeded_from = [], []
+    if config.warm_start:
+        _neighbour_seeds(state, states, config.num_cuts)
+    if state.stored is not None:
+        _stored_seed(state, config.num_cuts)
+
+
+def _ea_parameters(config: RangePipelineConfig, **overrides) -> EAParameters:
+    params = EAParameters(
+        population_size=config.population_size,
+        max_generations=config.max_generations,
+        num_elements=config.num_elements_2d,
+        elitism_percent=10,
+        crossover_percent=30,
+        mutation_percent=60,
+        f1_priority=config.f1_priority,
+        analysis_mode=AnalysisMode.BEAM_2D,
+        executor='serial',  # Parallelism is across bars
+    )
+    for name, value in overrides.items():
+        setattr(params, name, value)
+    return params
+
+
+def _stage_seed(state: '_BarState', stage: str, config: RangePipelineConfig) -> Optional[int]:
+    """EA random seed of one stage of a bar, derived from (seed, note, stage)."""
+    if config.random_seed is None:
+        return None
+    return zlib.crc32(f"{config.random_seed}:{state.note_name}:{stage}".encode())
+
+
+def _run_bar_stage(state: _BarState, config: RangePipelineConfig) -> _BarState:
+    """
+    Run the next stage of one bar.
+
+    Args:
+        state: Bar state after the previous stages
+        config: Range settings
+
+    Returns:
+        The updated state
+    """
+    stage = state.next_stage
+    start = time.perf_counter()
+    num_modes = len(state.target_frequencies)
+    width, height = config.width_mm / 1000, config.height_mm / 1000
+
+    if stage == 'length':
+        length_result = find_optimal_length(
+            target_frequency=state.note_frequency,
+            width=config.width_mm,
+            thickness=config.height_mm,
+            material=config.material,
+            min_length=config.min_length_mm,
+            max_length=config.max_length_mm,
+            tolerance_cents=2.0,
+            max_iterations=30,
+            num_elements=config.num_elements_2d,
+            analysis_mode=AnalysisMode.BEAM_2D
+        )
+        state.initial_length = length_result.length
+        state.bar = BarParameters(L=length_result.length / 1000, b=width, h0=height, hMin=height / 10)
+
+    elif stage == 'ea_2d':
+        result = run_evolutionary_algorithm(EAConfig(
+            bar=state.bar,
+            material=config.material,
+            target_frequencies=state.target_frequencies,
+            num_cuts=config.num_cuts,
+            ea_params=_ea_parameters(
+                config,
+                target_error=config.target_error * 2,  # Looser tolerance for speed
+                mutation_strength=0.12,
+                max_length_trim=config.max_length_adjust,
+                max_length_extend=config.max_length_adjust,
+                random_seed=_stage_seed(state, stage, config)
+            ),
+            seeds=state.seeds or None,
+        ))
+        # Keep the trimmed/extended length for the later stages
+        if result.effective_length > 0:
+            state.bar = BarParameters(L=result.effective_length, b=width, h0=height, hMin=height / 10)
+        state.best_genes_2d = list(result.best_individual.genes)
+        state.genes_2d = state.best_genes_2d[:config.num_cuts * 2]
+        state.computed_frequencies_2d = result.computed_frequencies
+        state.generations_2d = result.generations
+
+    elif stage == 'check_3d':
+        state.computed_frequencies_3d, _ = _bending_frequencies_3d(state.bar, state.genes_2d, config, num_modes)
+        state.frequency_offset = [
+            f3d - f2d for f3d, f2d in zip(state.computed_frequencies_3d, state.computed_frequencies_2d)
+        ]
+
+    elif stage == 'refine_2d':
+        # Aim the 2D model off by the 3D offset
+        corrected_targets = [ft - offset for ft, offset in zip(state.target_frequencies, state.frequency_offset)]
+        result = run_evolutionary_algorithm(EAConfig(
+            bar=state.bar,
+            material=config.material,
+            target_frequencies=corrected_targets,
+            num_cuts=config.num_cuts,
+            ea_params=_ea_parameters(
+                config,
+                target_error=config.target_error,
+                mutation_strength=0.10,
+                random_seed=_stage_seed(state, stage, config)
+            ),
+            seed_genes=state.genes_2d,
+        ))
+        state.genes_final = list(result.best_individual.genes[:config.num_cuts * 2])
+        state.generations_refined = result.generations
+
+    elif stage == 'verify_3d':
+        state.final_frequencies, state.classified_modes = _bending_frequencies_3d(
+            state.bar, state.genes_final, config, num_modes
+        )
+
+    else:
+        raise ValueError(f"Bar {state.note_name} has no stage left")
+
+    state.stage_times[stage] = time.perf_counter() - start
+    state.stage += 1
+    return state
+
+
+def _bar_result(state: _BarState, error: Optional[BaseException] = None) -> BarPipelineResult:
+    """Final result of a bar (failed if error is given)."""
+    elapsed = sum(state.stage_times.values())
+    if error is not None:
+        return BarPipelineResult(
+            note_name=state.note_name,
+            note_frequency=state.note_frequency,
+            bar_length=0,
+            initial_length=0,
+            target_frequencies=[],
+            computed_frequencies_2d=[],
+            computed_frequencies_3d=[],
+            frequency_offset=[],
+            final_frequencies=[],
+            errors_cents=[],
+            tuning_error=float('inf'),
+            cuts=[],
+            optimization_time=elapsed,
+            success=False,
+            error_message=str(error),
+            stage_times=state.stage_times,
+            generations_2d=state.generations_2d,
+            generations_refined=state.generations_refined,
+            seeded_from=state.seeded_from
+        )
+
+    targets = state.target_frequencies
+    errors_cents = [frequency_error_cents(f, ft) for f, ft in zip(state.final_frequencies, targets)]
+    weights = [1.5 if i == 0 else 1.0 for i in range(len(targets))]
+    tuning_error = 100 * sum(
+        w * ((f - ft) / ft) ** 2 for w, f, ft in zip(weights, state.final_frequencies, targets)
+    ) / sum(weights)
+
+    return BarPipelineResult(
+        note_name=state.note_name,
+        note_frequency=state.note_frequency,
+        bar_length=state.bar.L * 1000,
+        initial_length=state.initial_length,
+        target_frequencies=targets,
+        computed_frequencies_2d=state.computed_frequencies_2d,
+        computed_frequencies_3d=state.computed_frequencies_3d,
+        frequency_offset=state.frequency_offset,
+        final_frequencies=state.final_frequencies,
+        errors_cents=errors_cents,
+        tuning_error=tuning_error,
+        cuts=genes_to_cuts(state.genes_final),
+        optimization_time=elapsed,
+        success=True,
+        bar=state.bar,
+        classified_modes=state.classified_modes,
+        stage_times=state.stage_times,
+        generations_2d=state.generations_2d,
+        generations_refined=state.generations_refined,
+        seeded_from=state.seeded_from,
+        from_store=state.from_store
+    )
+
+
+def _finish_bar(state: _BarState, config: RangePipelineConfig) -> BarPipelineResult:
+    """Result of a bar whose last stage finished, stored in the result store."""
+    result = _bar_result(state)
+    _store_bar(result, state, config)
+    return result
+
+
+def run_range_pipeline(
+    notes: Sequence[NoteInfo],
+    config: RangePipelineConfig,
+    on_stage: Optional[Callable[[str, str, float], None]] = None
+) -> Iterator[BarPipelineResult]:
+    """
+    Optimize the bars of a note range, yielding each bar's result as soon as
+    it is finished (in completion order, not note order).
+
+    Args:
+        notes: Notes to make bars for (e.g. from generate_notes_in_range)
+        config: Range settings
+        on_stage: Called with (note name, stage, seconds) after every stage
+
+    Yields:
+        BarPipelineResult per bar; a failing stage gives a failed result for
+        that bar only
+    """
+    states = [
+        _BarState(
+            index=i,
+            note_name=note.name,
+            note_frequency=note.frequency,
+            target_frequencies=calculate_target_frequencies(config.ratios, note.frequency)
+        )
+        for i, note in enumerate(notes)
+    ]
+
+    if config.result_store is not None:
+        _load_stored(states, config)
+        for state in states:
+            if state.from_store:
+                yield _bar_result(state)
+
+    if config.executor == 'serial':
+        for state in states:
+            if state.from_store:
+                continue
+            try:
+                while state.next_stage is not None:
+                    stage = state.next_stage
+                    if stage == 'ea_2d':
+                        _seed_2d_stage(state, states, config)
+                    _run_bar_stage(state, config)
+                    if on_stage:
+                        on_stage(state.note_name, stage, state.stage_times[stage])
+            except Exception as e:
+                yield _bar_result(state, e)
+                continue
+            yield _finish_bar(state, config)
+        return
+
+    max_workers = _resolve_max_workers(config.max_workers)
+    max_3d = config.max_concurrent_3d if config.max_concurrent_3d > 0 else max_workers
+    pool_type = ProcessPoolExecutor if config.executor == 'process' else ThreadPoolExecutor
+    # Load the 3D solver calibration once here, before the workers fork
+    get_solver_calibration()
+
+    with pool_type(max_workers=max_workers) as pool:
+        ready = [s for s in states if not s.from_store]
+        running = {}
+        while ready or running:
+            # Fill idle workers, bars that are furthest along first
+            ready.sort(key=lambda s: (-s.stage, s.index))
+            while ready and len(running) < max_workers:
+                running_3d = sum(1 for s in running.values() if s.next_stage in STAGES_3D)
+                state = next(
+                    (s for s in ready if s.next_stage not in STAGES_3D or running_3d < max_3d), None
+                )
+                if state is None:
+                    break
+                ready.remove(state)
+                if state.next_stage == 'ea_2d':
+                    _seed_2d_stage(state, states, config)
+                running[pool.submit(_run_bar_stage, state, config)] = state
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                state = running.pop(future)
+                try:
+                    state = future.result()
+                except Exception as e:
+                    yield _bar_result(state, e)
+                    continue
+                # Process workers return a copy
+                states[state.index] = state
+
+                stage = STAGES[state.stage - 1]
+                if on_stage:
+                    on_stage(state.note_name, stage, state.stage_times[stage])
+                if state.next_stage is None:
+                    yield _finish_bar(state, config)
+                else:
+                    ready.append(state)
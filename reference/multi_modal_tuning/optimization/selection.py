@@ -5,11 +5,13 @@ Implements roulette wheel selection (Eq. 15 from paper)
 and other selection strategies.
 """
 
-from typing import List, Tuple, Literal
+from typing import List, Tuple, Literal, Union
 import random
 import math
 
 from ..types import Individual
+from .population import Population
+from .vectorized import select_elite_indices
 
 
 def roulette_selection(
@@ -194,7 +196,10 @@ def select_mating_pairs(
     return pairs
 
 
-def select_elite(population: List[Individual], num_elite: int) -> List[Individual]:
+def select_elite(
+    population: Union[List[Individual], Population],
+    num_elite: int
+) -> Union[List[Individual], Population]:
     """
     Elitism: select the best individuals to pass unchanged to next generation.
 
@@ -203,14 +208,18 @@ def select_elite(population: List[Individual], num_elite: int) -> List[Individua
         num_elite: Number of elite individuals
 
     Returns:
-        Array of elite individuals (cloned)
+        Array of elite individuals (cloned); a Population for a Population
     """
+    if isinstance(population, Population):
+        return population.take(select_elite_indices(population.fitness, num_elite))
+
     sorted_pop = sorted(population, key=lambda ind: ind.fitness)
     return [
         Individual(
             genes=ind.genes.copy(),
             fitness=ind.fitness,
-            sigmas=ind.sigmas.copy() if ind.sigmas else None
+            sigmas=ind.sigmas.copy() if ind.sigmas else None,
+            frequencies=ind.frequencies.copy() if ind.frequencies else None
         )
         for ind in sorted_pop[:num_elite]
     ]
@@ -0,0 +1,295 @@
+"""
+Vectorized Operators for Evolutionary Algorithm
+
+Array versions of the selection, crossover, mutation and bound clamping
+operators. A population is a (P, G) float64 gene matrix with (P,) fitness
+and optional (P, G) sigmas; each operator handles a whole generation in a
+few NumPy operations and draws its random numbers from a numpy Generator.
+
+The operators follow the per-individual versions in selection.py,
+crossover.py, mutation.py and population.py exactly (same distributions,
+same clamping rules); only the random number streams differ.
+"""
+
+from typing import Optional, Tuple
+import random
+import numpy as np
+
+from ..types import VariableBounds
+
+
+def make_rng(seed: Optional[int] = None) -> np.random.Generator:
+    """
+    Random generator for the vectorized operators.
+
+    Without a seed the generator is seeded from the `random` module, so
+    random.seed() keeps a run reproducible.
+    """
+    return np.random.default_rng(seed if seed is not None else random.getrandbits(64))
+
+
+def _has_length_adjust(bounds: VariableBounds) -> bool:
+    return bounds.max_length_trim > 0 or bounds.max_length_extend > 0
+
+
+def _num_cut_genes(num_genes: int, bounds: VariableBounds) -> int:
+    num_cuts = (num_genes - 1) // 2 if _has_length_adjust(bounds) else num_genes // 2
+    return num_cuts * 2
+
+
+def gene_ranges(num_genes: int, bounds: VariableBounds) -> np.ndarray:
+    """Mutation scale (bound range) of each gene: lambda, h, ..., length adjust."""
+    ranges = np.empty(num_genes)
+    ranges[0::2] = bounds.lambda_max - bounds.lambda_min
+    ranges[1::2] = bounds.h_max - bounds.h_min
+    cut_genes = _num_cut_genes(num_genes, bounds)
+    if _has_length_adjust(bounds) and num_genes > cut_genes:
+        ranges[cut_genes] = bounds.max_length_trim + bounds.max_length_extend
+    return ranges
+
+
+def gene_limits(num_genes: int, bounds: VariableBounds) -> Tuple[np.ndarray, np.ndarray]:
+    """Lower and upper bound of each gene."""
+    lower = np.empty(num_genes)
+    upper = np.empty(num_genes)
+    lower[0::2], upper[0::2] = bounds.lambda_min, bounds.lambda_max
+    lower[1::2], upper[1::2] = bounds.h_min, bounds.h_max
+    cut_genes = _num_cut_genes(num_genes, bounds)
+    if _has_length_adjust(bounds) and num_genes > cut_genes:
+        lower[cut_genes], upper[cut_genes] = -bounds.max_length_extend, bounds.max_length_trim
+    return lower, upper
+
+
+def clamp_to_bounds_batch(genes: np.ndarray, bounds: VariableBounds) -> np.ndarray:
+    """
+    Clamp every row of a gene matrix (see clamp_to_bounds).
+
+    Args:
+        genes: (P, G) gene matrix
+        bounds: Variable bounds
+
+    Returns:
+        New (P, G) clamped gene matrix
+    """
+    genes = np.asarray(genes, dtype=np.float64)
+    lower, upper = gene_limits(genes.shape[1], bounds)
+    clamped = np.minimum(np.maximum(genes, lower), upper)
+
+    min_width = bounds.min_cut_width or 0.0
+    max_width = bounds.max_cut_width or 0.0
+    num_cuts = _num_cut_genes(genes.shape[1], bounds) // 2
+    if (min_width > 0 or max_width > 0) and num_cuts >= 1:
+        # Enforce spacing from the outermost cut inwards
+        order = np.argsort(-clamped[:, 0:2 * num_cuts:2], axis=1, kind='stable')
+        lambdas = np.take_along_axis(clamped[:, 0:2 * num_cuts:2], order, axis=1)
+        for i in range(1, num_cuts):
+            outer = lambdas[:, i - 1]
+            inner = lambdas[:, i]
+            if min_width > 0:
+                max_allowed = outer - min_width
+                inner = np.where(inner > max_allowed, np.maximum(bounds.lambda_min, max_allowed), inner)
+            if max_width > 0:
+                min_allowed = outer - max_width
+                inner = np.where(inner < min_allowed, np.maximum(bounds.lambda_min, min_allowed), inner)
+            lambdas[:, i] = inner
+        rows = np.arange(len(clamped))[:, None]
+        clamped[rows, 2 * order] = lambdas
+
+    return clamped
+
+
+def roulette_selection_batch(
+    fitness: np.ndarray,
+    num_selections: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Roulette wheel selection (Eq. 15), p_i proportional to 1/e_i.
+
+    Args:
+        fitness: (P,) fitness values (lower is better)
+        num_selections: Number of individuals to select
+        rng: Random generator
+
+    Returns:
+        (num_selections,) indices into the population
+    """
+    fitness = np.asarray(fitness, dtype=np.float64)
+    valid = np.flatnonzero(np.isfinite(fitness) & (fitness > 0))
+    if len(valid) == 0:
+        return rng.integers(0, len(fitness), size=num_selections)
+
+    inverse = 1.0 / fitness[valid]
+    cumulative = np.cumsum(inverse / inverse.sum())
+    picks = np.searchsorted(cumulative, rng.random(num_selections), side='left')
+    # Rounding can leave the last cumulative value just below r
+    return valid[np.minimum(picks, len(valid) - 1)]
+
+
+def select_mating_pairs_batch(
+    fitness: np.ndarray,
+    num_pairs: int,
+    rng: np.random.Generator,
+    max_attempts: int = 10
+) -> np.ndarray:
+    """
+    Roulette-select parent pairs, redrawing the second parent while it
+    equals the first (up to max_attempts times).
+
+    Returns:
+        (num_pairs, 2) parent indices
+    """
+    first = roulette_selection_batch(fitness, num_pairs, rng)
+    second = roulette_selection_batch(fitness, num_pairs, rng)
+    for _ in range(max_attempts - 1):
+        same = np.flatnonzero(second == first)
+        if len(same) == 0:
+            break
+        second[same] = roulette_selection_batch(fitness, len(same), rng)
+    return np.stack([first, second], axis=1)
+
+
+def select_elite_indices(fitness: np.ndarray, num_elite: int) -> np.ndarray:
+    """Indices of the num_elite best individuals, best first (ties keep population order)."""
+    fitness = np.asarray(fitness)
+    if num_elite <= 0:
+        return np.empty(0, dtype=np.intp)
+    if num_elite < len(fitness):
+        # Partition first so only the elite are sorted
+        candidates = np.sort(np.argpartition(fitness, num_elite - 1)[:num_elite])
+        return candidates[np.argsort(fitness[candidates], kind='stable')]
+    return np.argsort(fitness, kind='stable')
+
+
+def heuristic_crossover_batch(
+    genes1: np.ndarray,
+    genes2: np.ndarray,
+    bounds: VariableBounds,
+    rng: np.random.Generator,
+    sigmas1: Optional[np.ndarray] = None,
+    sigmas2: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+    """
+    Heuristic crossover (Eq. 16) of N parent pairs, one r per pair.
+
+    Returns:
+        Tuple of (children1 genes, children2 genes, children1 sigmas,
+        children2 sigmas); sigmas are None unless both parents have them
+    """
+    r = rng.random((len(genes1), 1))
+    children1 = clamp_to_bounds_batch(genes1 + r * (genes2 - genes1), bounds)
+    children2 = clamp_to_bounds_batch(genes2 + r * (genes1 - genes2), bounds)
+
+    if sigmas1 is None or sigmas2 is None:
+        return children1, children2, None, None
+    return (
+        children1,
+        children2,
+        sigmas1 + r * (sigmas2 - sigmas1),
+        sigmas2 + r * (sigmas1 - sigmas2),
+    )
+
+
+def _random_gene_mask(num_rows: int, num_genes: int, rng: np.random.Generator) -> np.ndarray:
+    """A random subset of 1 to num_genes genes per row."""
+    num_mutate = rng.integers(1, num_genes + 1, size=(num_rows, 1))
+    ranks = rng.random((num_rows, num_genes)).argsort(axis=1).argsort(axis=1)
+    return ranks < num_mutate
+
+
+def uniform_mutation_batch(
+    genes: np.ndarray,
+    sigma: float,
+    bounds: VariableBounds,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Uniform random mutation (Section 3.3) of every row.
+
+    Each row mutates a random number (1 to G) of randomly chosen genes by
+    sigma * range * r with r uniform in [-1, 1].
+
+    Returns:
+        New (P, G) clamped gene matrix
+    """
+    num_rows, num_genes = genes.shape
+    mask = _random_gene_mask(num_rows, num_genes, rng)
+    r = rng.uniform(-1.0, 1.0, size=(num_rows, num_genes))
+    mutated = genes + mask * (sigma * gene_ranges(num_genes, bounds) * r)
+    return clamp_to_bounds_batch(mutated, bounds)
+
+
+def adaptive_length_mutation_batch(
+    genes: np.ndarray,
+    sigma: float,
+    bounds: VariableBounds,
+    f1_errors: Optional[np.ndarray],
+    rng: np.random.Generator,
+    adaptive_bias: float = 0.7
+) -> np.ndarray:
+    """
+    Uniform mutation with the length gene biased by the f1 error of each row
+    (see adaptive_length_mutation).
+
+    Args:
+        genes: (P, G) gene matrix
+        sigma: Mutation strength (normalized to bounds)
+        bounds: Variable bounds
+        f1_errors: (P,) f1_computed - f1_target per row, or None
+        rng: Random generator
+        adaptive_bias: Probability of moving the length gene in the desired direction
+
+    Returns:
+        New (P, G) clamped gene matrix
+    """
+    num_rows, num_genes = genes.shape
+    mask = _random_gene_mask(num_rows, num_genes, rng)
+    r = rng.uniform(-1.0, 1.0, size=(num_rows, num_genes))
+
+    length_gene = _num_cut_genes(num_genes, bounds)
+    if _has_length_adjust(bounds) and num_genes > length_gene and f1_errors is not None:
+        f1_errors = np.asarray(f1_errors, dtype=np.float64)
+        # f1 too high -> extend (negative adjust), too low -> trim (positive adjust)
+        direction = np.where(f1_errors < 0, 1.0, -1.0)
+        biased = (np.abs(f1_errors) > 0.001) & (rng.random(num_rows) < adaptive_bias)
+        r[:, length_gene] = np.where(biased, direction * rng.random(num_rows), r[:, length_gene])
+
+    mutated = genes + mask * (sigma * gene_ranges(num_genes, bounds) * r)
+    return clamp_to_bounds_batch(mutated, bounds)
+
+
+def gaussian_self_adaptive_mutation_batch(
+    genes: np.ndarray,
+    sigmas: Optional[np.ndarray],
+    phi: float,
+    bounds: VariableBounds,
+    rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Self-adaptive Gaussian mutation (Eq. 17-18) of every row.
+
+    Args:
+        genes: (P, G) gene matrix
+        sigmas: (P, G) step sizes (None = 0.2 for every gene)
+        phi: Standard deviation of the step size random factors
+        bounds: Variable bounds
+        rng: Random generator
+
+    Returns:
+        Tuple of (new clamped genes, updated sigmas)
+    """
+    num_rows, num_genes = genes.shape
+    if sigmas is None:
+        sigmas = np.full((num_rows, num_genes), 0.2)
+
+    # Learning rates from Eq. 18
+    tau1 = 1.0 / np.sqrt(2 * np.sqrt(2 * num_genes))
+    tau2 = 1.0 / np.sqrt(4 * num_genes)
+
+    z1 = rng.standard_normal((num_rows, 1)) * phi
+    z2 = rng.standard_normal((num_rows, num_genes)) * phi
+    z3 = rng.standard_normal((num_rows, num_genes))
+
+    new_sigmas = np.clip(sigmas * np.exp(tau1 * z1 + tau2 * z2), 0.001, 1.0)
+    mutated = genes + new_sigmas * gene_ranges(num_genes, bounds) * z3
+    return clamp_to_bounds_batch(mutated, bounds), new_sigmas
@@ -5,22 +5,33 @@ Supports both 2D Timoshenko beam elements and 3D solid hexahedral elements.
 
 from .bar_profile import (
     compute_height,
+    compute_heights,
     generate_element_heights,
     genes_to_cuts,
     cuts_to_genes,
     count_effective_cuts,
     validate_cuts,
     generate_profile_points,
+    genes_to_element_heights,
 )
 
 from .timoshenko import (
     compute_element_stiffness,
     compute_element_mass,
+    compute_element_matrices_batch,
 )
 
 from .fem_assembly import (
     assemble_global_matrices,
+    assemble_banded_matrices,
+    banded_to_dense,
     solve_generalized_eigenvalue,
+    solve_generalized_eigenvalue_batch,
+    solve_generalized_eigenvalue_subset,
+    is_mirror_symmetric,
+    assemble_half_banded_matrices,
+    solve_half_beam,
+    solve_half_beam_batch,
 )
 
 from .fem_3d import (
@@ -28,36 +39,121 @@ from .fem_3d import (
     generate_bar_mesh_3d,
     assemble_global_matrices_3d,
     solve_eigenvalue_3d,
+    BarMesh3D,
+    get_bar_mesh_3d,
+    ShiftInvertWarmStart,
+    solve_eigenvalue_3d_lobpcg,
+    rigid_body_modes_3d,
+    compute_frequencies_3d_symmetric,
+    compute_frequencies_3d_symmetric_classified,
+    symmetry_basis_3d,
+    SYMMETRY_CLASSES,
+    BENDING_SYMMETRY_CLASSES,
+    EIGEN_SOLVERS_3D,
+    REDUCED_SOLVER_3D,
+    SYMMETRIC_SOLVERS_3D,
+    resolve_solver_3d,
+)
+
+from .modal_surrogate import (
+    ModalSurrogate3D,
+    SurrogateStats,
+)
+
+from .solver_selection import (
+    SolverTiming,
+    SolverCalibration,
+    calibrate_solvers_3d,
+    load_calibration,
+    save_calibration,
+    get_solver_calibration,
+    set_solver_calibration,
+    run_solver_calibration,
+    choose_solver_3d,
+)
+
+from .frequency_cache import (
+    FrequencyCache,
+    CacheStats,
+    get_frequency_cache,
 )
 
 from .frequencies import (
     compute_frequencies,
     compute_frequencies_from_genes,
+    batch_compute_frequencies_2d,
     batch_compute_fitness,
+    FitnessProblem,
+    Evaluator,
 )
 
 __all__ = [
     # Bar profile
     "compute_height",
+    "compute_heights",
     "generate_element_heights",
     "genes_to_cuts",
     "cuts_to_genes",
     "count_effective_cuts",
     "validate_cuts",
     "generate_profile_points",
+    "genes_to_element_heights",
     # Timoshenko (2D)
     "compute_element_stiffness",
     "compute_element_mass",
+    "compute_element_matrices_batch",
     # FEM assembly (2D)
     "assemble_global_matrices",
+    "assemble_banded_matrices",
+    "banded_to_dense",
     "solve_generalized_eigenvalue",
+    "solve_generalized_eigenvalue_batch",
+    "solve_generalized_eigenvalue_subset",
+    "is_mirror_symmetric",
+    "assemble_half_banded_matrices",
+    "solve_half_beam",
+    "solve_half_beam_batch",
     # FEM 3D
     "compute_frequencies_3d",
     "generate_bar_mesh_3d",
     "assemble_global_matrices_3d",
     "solve_eigenvalue_3d",
+    "BarMesh3D",
+    "get_bar_mesh_3d",
+    "ShiftInvertWarmStart",
+    "solve_eigenvalue_3d_lobpcg",
+    "rigid_body_modes_3d",
+    "compute_frequencies_3d_symmetric",
+    "compute_frequencies_3d_symmetric_classified",
+    "symmetry_basis_3d",
+    "SYMMETRY_CLASSES",
+    "BENDING_SYMMETRY_CLASSES",
+    "EIGEN_SOLVERS_3D",
+    "REDUCED_SOLVER_3D",
+    "SYMMETRIC_SOLVERS_3D",
+    "resolve_solver_3d",
+    # Reduced-basis 3D surrogate
+    "ModalSurrogate3D",
+    "SurrogateStats",
+    # 3D solver selection
+    "SolverTiming",
+    "SolverCalibration",
+    "calibrate_solvers_3d",
+    "load_calibration",
+    "save_calibration",
+    "get_solver_calibration",
+    "set_solver_calibration",
+    "run_solver_calibration",
+    "choose_solver_3d",
+    # Frequency cache
+    "FrequencyCache",
+    "CacheStats",
+    "get_frequency_cache",
     # Frequencies (unified interface)
     "compute_frequencies",
     "compute_frequencies_from_genes",
+    "batch_compute_frequencies_2d",
     "batch_compute_fitness",
+    "FitnessProblem",
+    "Evaluator",
 ]
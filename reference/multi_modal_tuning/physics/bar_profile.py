@@ -9,9 +9,10 @@ Key equations from paper:
 - Quadratic interpolation for discontinuities (Eq. 6)
 """
 
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 from dataclasses import dataclass
 import math
+import numpy as np
 from ..types import Cut, BarParameters
 
 
@@ -38,24 +39,80 @@ def compute_height(
     Returns:
         Height H(x) at position x
     """
-    # Distance from center
-    dist_from_center = abs(x - L / 2)
+    return float(compute_heights(np.array([x]), cuts, L, h0)[0])
 
-    # Sort cuts by lambda descending (largest first = outermost)
-    sorted_cuts = sorted(cuts, key=lambda c: c.lambda_, reverse=True)
 
-    # Find all cuts that contain this point, then return the innermost one's height
-    containing_cuts = [
-        cut for cut in sorted_cuts
-        if cut.lambda_ > 0 and dist_from_center <= cut.lambda_
-    ]
+def compute_heights(
+    x: Union[List[float], np.ndarray],
+    cuts: List[Cut],
+    L: float,
+    h0: float
+) -> np.ndarray:
+    """
+    Vectorized compute_height: the bar profile H(x) at many positions.
 
-    if not containing_cuts:
-        # Outside all cuts - return original height
-        return h0
+    Args:
+        x: Positions along bar (m)
+        cuts: Array of cuts (any order)
+        L: Bar length (m)
+        h0: Original bar height (m)
 
-    # Return innermost (smallest lambda) containing cut
-    return containing_cuts[-1].h
+    Returns:
+        Heights with the same shape as x
+    """
+    x = np.asarray(x, dtype=np.float64)
+    lambdas = np.array([[cut.lambda_ for cut in cuts]], dtype=np.float64).reshape(1, -1)
+    cut_heights = np.array([[cut.h for cut in cuts]], dtype=np.float64).reshape(1, -1)
+    dist = np.abs(x.reshape(1, -1) - L / 2)
+    return _innermost_cut_heights(dist, lambdas, cut_heights, h0).reshape(x.shape)
+
+
+def _quadratic_element_heights(
+    x_nodes: np.ndarray,
+    cuts: List[Cut],
+    L: float,
+    h0: float,
+    disc_pos: np.ndarray,
+    h_before: np.ndarray,
+    h_after: np.ndarray
+) -> np.ndarray:
+    """
+    Element heights for a 1D mesh with quadratic interpolation (Eq. 6) in
+    elements that contain a discontinuity and midpoint heights elsewhere.
+    The first discontinuity (in the given order) inside an element is used.
+
+    Args:
+        x_nodes: Element boundary positions, shape (Ne + 1,)
+        cuts: Array of cuts
+        L: Bar length (m)
+        h0: Original height (m)
+        disc_pos: Discontinuity positions, shape (D,)
+        h_before: Heights just before each discontinuity
+        h_after: Heights just after each discontinuity
+
+    Returns:
+        Element heights, shape (Ne,)
+    """
+    x_start = x_nodes[:-1]
+    x_end = x_nodes[1:]
+    heights = compute_heights((x_start + x_end) / 2, cuts, L, h0)
+
+    if len(disc_pos) == 0:
+        return heights
+
+    inside = (disc_pos > x_start[:, None]) & (disc_pos < x_end[:, None])
+    has_disc = inside.any(axis=1)
+    first = np.argmax(inside, axis=1)[has_disc]
+
+    pos = disc_pos[first]
+    dx1 = pos - x_start[has_disc]
+    dx2 = x_end[has_disc] - pos
+    h1 = h_before[first]
+    h2 = h_after[first]
+
+    # Quadratic weighting from Eq. 6
+    heights[has_disc] = np.sqrt((h1 * h1 * dx1 + h2 * h2 * dx2) / (dx1 + dx2))
+    return heights
 
 
 def generate_element_heights(
@@ -80,71 +137,29 @@ def generate_element_heights(
         Array of element heights (length Ne)
     """
     Le = L / Ne  # Element length
-    heights: List[float] = []
     center_x = L / 2
 
     # Sort cuts by lambda (descending - largest/outermost first)
     sorted_cuts = sorted(cuts, key=lambda c: c.lambda_, reverse=True)
 
-    # Build list of discontinuity positions with heights on each side
-    discontinuities: List[dict] = []
+    # Discontinuity candidates: left and right boundary of every cut
+    lambdas = np.array([cut.lambda_ for cut in sorted_cuts if cut.lambda_ > 0], dtype=np.float64)
+    disc_pos = np.stack([center_x - lambdas, center_x + lambdas], axis=1).ravel()
 
-    for cut in sorted_cuts:
-        if cut.lambda_ <= 0:
-            continue
-
-        left_boundary = center_x - cut.lambda_
-        right_boundary = center_x + cut.lambda_
-
-        # At left boundary: compute heights just before and after
-        h_outside_left = compute_height(left_boundary - 0.0001, sorted_cuts, L, h0)
-        h_inside_left = compute_height(left_boundary + 0.0001, sorted_cuts, L, h0)
-        if abs(h_outside_left - h_inside_left) > 1e-9:
-            discontinuities.append({
-                "pos": left_boundary,
-                "h_before": h_outside_left,
-                "h_after": h_inside_left
-            })
-
-        # At right boundary: compute heights just before and after
-        h_inside_right = compute_height(right_boundary - 0.0001, sorted_cuts, L, h0)
-        h_outside_right = compute_height(right_boundary + 0.0001, sorted_cuts, L, h0)
-        if abs(h_inside_right - h_outside_right) > 1e-9:
-            discontinuities.append({
-                "pos": right_boundary,
-                "h_before": h_inside_right,
-                "h_after": h_outside_right
-            })
+    # Heights just before and after each boundary; keep real jumps only
+    h_before = compute_heights(disc_pos - 0.0001, sorted_cuts, L, h0)
+    h_after = compute_heights(disc_pos + 0.0001, sorted_cuts, L, h0)
+    is_jump = np.abs(h_before - h_after) > 1e-9
+    disc_pos, h_before, h_after = disc_pos[is_jump], h_before[is_jump], h_after[is_jump]
 
     # Sort discontinuities by position
-    discontinuities.sort(key=lambda d: d["pos"])
-
-    # For each element, compute the appropriate height
-    for i in range(Ne):
-        x_start = i * Le
-        x_end = (i + 1) * Le
-        x_mid = (x_start + x_end) / 2
+    order = np.argsort(disc_pos, kind='stable')
 
-        # Check if element contains a discontinuity
-        found_discontinuity = False
-        for disc in discontinuities:
-            if disc["pos"] > x_start and disc["pos"] < x_end:
-                # Element contains a discontinuity - use quadratic interpolation (Eq. 6)
-                dx1 = disc["pos"] - x_start
-                dx2 = x_end - disc["pos"]
-                h1 = disc["h_before"]
-                h2 = disc["h_after"]
-
-                # Quadratic weighting from Eq. 6
-                heights.append(math.sqrt((h1 * h1 * dx1 + h2 * h2 * dx2) / (dx1 + dx2)))
-                found_discontinuity = True
-                break
-
-        if not found_discontinuity:
-            # No discontinuity in this element - use height at midpoint
-            heights.append(compute_height(x_mid, sorted_cuts, L, h0))
-
-    return heights
+    x_nodes = np.arange(Ne + 1) * Le
+    heights = _quadratic_element_heights(
+        x_nodes, sorted_cuts, L, h0, disc_pos[order], h_before[order], h_after[order]
+    )
+    return heights.tolist()
 
 
 def genes_to_cuts(genes: List[float]) -> List[Cut]:
@@ -193,6 +208,101 @@ def cuts_to_genes(cuts: List[Cut]) -> List[float]:
     return genes
 
 
+def _innermost_cut_heights(
+    dist_from_center: np.ndarray,
+    lambdas: np.ndarray,
+    cut_heights: np.ndarray,
+    h0: float
+) -> np.ndarray:
+    """
+    Vectorized "innermost containing cut" lookup (Eq. 3).
+
+    For every distance from the bar centre, returns the height of the cut
+    with the smallest lambda that still contains the point, or h0 when no
+    cut contains it. Cuts with lambda <= 0 (or NaN genes) are ignored; among
+    equal lambdas the later cut wins, matching the sorted-list behaviour of
+    compute_height.
+
+    Args:
+        dist_from_center: Distances |x - L/2|, shape (P, K)
+        lambdas: Cut lambdas, shape (P, C)
+        cut_heights: Cut heights, shape (P, C)
+        h0: Original bar height (m)
+
+    Returns:
+        Heights with shape (P, K)
+    """
+    valid = (lambdas > 0) & ~np.isnan(lambdas) & ~np.isnan(cut_heights)
+    lam = np.where(valid, lambdas, -1.0)
+
+    # Stable ascending sort of the reversed columns puts later cuts first on ties
+    lam = lam[:, ::-1]
+    hs = cut_heights[:, ::-1]
+    order = np.argsort(lam, axis=1, kind='stable')
+    lam = np.take_along_axis(lam, order, axis=1)
+    hs = np.take_along_axis(hs, order, axis=1)
+
+    # searchsorted(lam, dist, 'left') per row: index of the smallest containing cut
+    if lam.shape[0] == 1:
+        idx = np.searchsorted(lam[0], dist_from_center[0], side='left')[None, :]
+    else:
+        # Row-wise searchsorted over the few cuts as one broadcast comparison
+        idx = np.sum(lam[:, None, :] < dist_from_center[:, :, None], axis=2)
+
+    hs = np.concatenate([hs, np.full((hs.shape[0], 1), h0)], axis=1)
+    return np.take_along_axis(hs, idx, axis=1)
+
+
+def genes_to_element_heights(
+    genes: Union[List[float], np.ndarray],
+    bar_length: float,
+    h0: float,
+    num_elements: int,
+    num_cuts: int = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert genes to element midpoint heights in a single vectorized pass.
+
+    Accepts either one gene vector or a (P, num_genes) matrix, handling the
+    optional trailing length adjustment gene the same way as
+    compute_frequencies_from_genes.
+
+    Args:
+        genes: Flat array [lambda_1, h_1, ..., length_adjust?] or (P, num_genes) matrix
+        bar_length: Nominal bar length (m)
+        h0: Original bar height (m)
+        num_elements: Number of finite elements
+        num_cuts: Number of cuts (0 = treat all gene pairs as cuts, no length gene)
+
+    Returns:
+        Tuple of (element_heights, effective_lengths):
+        - element_heights: shape (num_elements,) or (P, num_elements)
+        - effective_lengths: scalar array or shape (P,)
+    """
+    g = np.asarray(genes, dtype=np.float64)
+    single = g.ndim == 1
+    g = g.reshape(1, -1) if single else g
+    num_genes = g.shape[1]
+
+    lengths = np.full(g.shape[0], float(bar_length))
+    if num_cuts > 0:
+        if num_genes > num_cuts * 2:
+            lengths = bar_length - 2 * g[:, num_cuts * 2]
+        cut_genes = g[:, :num_cuts * 2]
+    else:
+        cut_genes = g[:, :(num_genes // 2) * 2]
+
+    le = lengths / num_elements
+    x_mid = (np.arange(num_elements) + 0.5) * le[:, None]
+    dist = np.abs(x_mid - (lengths / 2)[:, None])
+
+    heights = _innermost_cut_heights(dist, cut_genes[:, 0::2], cut_genes[:, 1::2], h0)
+
+    if single:
+        return heights[0], lengths[0]
+    return heights, lengths
+
+
 def count_effective_cuts(cuts: List[Cut]) -> int:
     """
     Compute the effective number of cuts (ignoring cuts that are inside others).
@@ -308,32 +418,16 @@ def generate_adaptive_mesh_1d(
         x_positions[-1] = L
 
     # Generate heights for each element
-    num_elements = len(x_positions) - 1
-    element_heights: List[float] = []
-
-    for i in range(num_elements):
-        x_start = x_positions[i]
-        x_end = x_positions[i + 1]
-        x_mid = (x_start + x_end) / 2
-
-        # Check if element contains a discontinuity
-        found_discontinuity = False
-        for disc_x in discontinuities:
-            if disc_x > x_start and disc_x < x_end:
-                # Element contains a discontinuity - use quadratic interpolation
-                dx1 = disc_x - x_start
-                dx2 = x_end - disc_x
-                h1 = compute_height(disc_x - 0.0001, sorted_cuts, L, h0)
-                h2 = compute_height(disc_x + 0.0001, sorted_cuts, L, h0)
-
-                # Quadratic weighting from Eq. 6
-                element_heights.append(math.sqrt((h1 * h1 * dx1 + h2 * h2 * dx2) / (dx1 + dx2)))
-                found_discontinuity = True
-                break
-
-        if not found_discontinuity:
-            # No discontinuity - use height at midpoint
-            element_heights.append(compute_height(x_mid, sorted_cuts, L, h0))
+    disc_pos = np.array(discontinuities, dtype=np.float64)
+    element_heights = _quadratic_element_heights(
+        np.array(x_positions),
+        sorted_cuts,
+        L,
+        h0,
+        disc_pos,
+        compute_heights(disc_pos - 0.0001, sorted_cuts, L, h0),
+        compute_heights(disc_pos + 0.0001, sorted_cuts, L, h0)
+    ).tolist()
 
     return x_positions, element_heights
 
@@ -529,33 +623,22 @@ def generate_profile_points(
     Returns:
         List of (x, h) coordinate pairs
     """
-    points: List[Tuple[float, float]] = []
     sorted_cuts = sorted(cuts, key=lambda c: c.lambda_, reverse=True)
 
-    # Generate points from left to right
-    for i in range(num_points + 1):
-        x = (i / num_points) * L
-        h = compute_height(x, sorted_cuts, L, h0)
-        points.append((x, h))
+    # Points from left to right
+    x = np.arange(num_points + 1) / num_points * L
 
     # Add extra points at discontinuities for crisp edges
-    extra_points: List[Tuple[float, float]] = []
+    epsilon = L / 10000
+    extra_x: List[float] = []
     for cut in sorted_cuts:
-        left_edge = L / 2 - cut.lambda_
-        right_edge = L / 2 + cut.lambda_
-
-        epsilon = L / 10000
-
-        if 0 < left_edge < L:
-            extra_points.append((left_edge - epsilon, compute_height(left_edge - epsilon, sorted_cuts, L, h0)))
-            extra_points.append((left_edge + epsilon, compute_height(left_edge + epsilon, sorted_cuts, L, h0)))
-
-        if 0 < right_edge < L:
-            extra_points.append((right_edge - epsilon, compute_height(right_edge - epsilon, sorted_cuts, L, h0)))
-            extra_points.append((right_edge + epsilon, compute_height(right_edge + epsilon, sorted_cuts, L, h0)))
+        for edge in (L / 2 - cut.lambda_, L / 2 + cut.lambda_):
+            if 0 < edge < L:
+                extra_x.extend([edge - epsilon, edge + epsilon])
 
     # Merge and sort all points by x
-    all_points = points + extra_points
-    all_points.sort(key=lambda p: p[0])
+    all_x = np.concatenate([x, np.array(extra_x, dtype=np.float64)])
+    all_x = all_x[np.argsort(all_x, kind='stable')]
+    all_h = compute_heights(all_x, sorted_cuts, L, h0)
 
-    return all_points
+    return list(zip(all_x.tolist(), all_h.tolist()))
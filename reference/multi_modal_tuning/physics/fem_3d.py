@@ -9,13 +9,37 @@ especially for complex undercut geometries and wide bars where
 3D effects become significant.
 """
 
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Hashable
+from collections import OrderedDict
+import threading
+import warnings
 import numpy as np
 from scipy import linalg
-from scipy.sparse import lil_matrix, csr_matrix
-from scipy.sparse.linalg import eigsh
+from scipy.sparse import csr_matrix, coo_matrix, diags, identity
+from scipy.sparse.linalg import eigsh, lobpcg, spilu, LinearOperator
 import math
 
+from .fem_assembly import is_mirror_symmetric
+
+try:
+    import pyamg
+    HAS_PYAMG = True
+except ImportError:
+    HAS_PYAMG = False
+    pyamg = None
+
+# 3D eigen-solver backends: LAPACK subset driver on dense matrices, shift-invert
+# ARPACK and preconditioned LOBPCG on sparse matrices. 'auto' picks one from
+# measured solve times (see solver_selection).
+EIGEN_SOLVERS_3D = ('dense', 'eigsh', 'lobpcg')
+
+# Reduced-basis surrogate option (approximate; see modal_surrogate)
+REDUCED_SOLVER_3D = 'reduced'
+
+# Backends for the symmetry-reduced model: LOBPCG and the surrogate need the
+# full mesh (rigid body modes, full mode shapes) and cannot solve one class
+SYMMETRIC_SOLVERS_3D = ('dense', 'eigsh')
+
 
 def gauss_points_3d() -> Tuple[np.ndarray, np.ndarray]:
     """
@@ -161,68 +185,236 @@ def compute_hex8_matrices(
     Returns:
         Tuple of (Ke, Me) - 24x24 stiffness and mass matrices
     """
-    D = elasticity_matrix_3d(E, nu)
+    Ke, Me = compute_hex8_matrices_batch(node_coords[None], E, nu, rho)
+    return Ke[0], Me[0]
 
-    Ke = np.zeros((24, 24))
-    Me = np.zeros((24, 24))
 
+def _hex8_gauss_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Shape functions and natural derivatives at the 2x2x2 Gauss points.
+
+    Returns:
+        Tuple of (N, dN_nat, weights) with shapes (8, 8), (8, 3, 8) and (8,)
+    """
     gauss_pts, gauss_wts = gauss_points_3d()
+    N = np.array([shape_functions_hex8(*gp) for gp in gauss_pts])
+    dN_nat = np.array([shape_function_derivatives_hex8(*gp) for gp in gauss_pts])
+    return N, dN_nat, gauss_wts
+
+
+_HEX8_N, _HEX8_DN_NAT, _HEX8_WEIGHTS = _hex8_gauss_tables()
+
+
+def _hex8_strain_matrices(dN_phys: np.ndarray) -> np.ndarray:
+    """
+    Build strain-displacement matrices from physical shape function derivatives.
+
+    Args:
+        dN_phys: (..., 3, 8) derivatives [dN/dx, dN/dy, dN/dz]
+
+    Returns:
+        (..., 6, 24) B matrices, strain order [xx, yy, zz, xy, yz, xz]
+    """
+    dNdx, dNdy, dNdz = dN_phys[..., 0, :], dN_phys[..., 1, :], dN_phys[..., 2, :]
+    B = np.zeros(dN_phys.shape[:-2] + (6, 24))
+    B[..., 0, 0::3] = dNdx
+    B[..., 1, 1::3] = dNdy
+    B[..., 2, 2::3] = dNdz
+    B[..., 3, 0::3] = dNdy
+    B[..., 3, 1::3] = dNdx
+    B[..., 4, 1::3] = dNdz
+    B[..., 4, 2::3] = dNdy
+    B[..., 5, 0::3] = dNdz
+    B[..., 5, 2::3] = dNdx
+    return B
+
+
+def _box_reference_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reference tables for axis-aligned box elements.
+
+    For a box of size (dx, dy, dz) the Jacobian is diag(dx, dy, dz) / 2, so
+    B = sum_a (2 / d_a) B_a with B_a built from the natural derivative along
+    axis a alone, and N^T N is independent of the size.
+
+    Returns:
+        Tuple of (B_axis, M_ref, node_offsets):
+        - B_axis: (3, 8, 6, 24) per-axis B matrices at each Gauss point
+        - M_ref: (24, 24) sum over Gauss points of N^T N
+        - node_offsets: (8, 3) node positions of the unit box (0 or 1)
+    """
+    B_axis = np.zeros((3, 8, 6, 24))
+    for a in range(3):
+        dN_axis = np.zeros_like(_HEX8_DN_NAT)
+        dN_axis[:, a, :] = _HEX8_DN_NAT[:, a, :]
+        B_axis[a] = _hex8_strain_matrices(dN_axis)
+
+    M_scalar = np.einsum('g,ga,gb->ab', _HEX8_WEIGHTS, _HEX8_N, _HEX8_N)
+    M_ref = np.kron(M_scalar, np.eye(3))
+
+    node_offsets = np.array([
+        [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+        [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],
+    ], dtype=np.float64)
+    return B_axis, M_ref, node_offsets
+
+
+_BOX_B_AXIS, _BOX_M_REF, _BOX_NODE_OFFSETS = _box_reference_tables()
+
+
+def find_box_elements(element_coords: np.ndarray, rtol: float = 1e-10) -> np.ndarray:
+    """
+    Detect axis-aligned rectangular box elements.
+
+    Args:
+        element_coords: (num_elements, 8, 3) array of node coordinates
+        rtol: Tolerance relative to the element size
+
+    Returns:
+        Boolean mask of shape (num_elements,)
+    """
+    origin = element_coords[:, 0, :]
+    dims = element_coords[:, 6, :] - origin
+    expected = origin[:, None, :] + _BOX_NODE_OFFSETS[None, :, :] * dims[:, None, :]
+    scale = np.abs(dims).max(axis=1)
+    deviation = np.abs(element_coords - expected).max(axis=(1, 2))
+    return np.all(dims > 0, axis=1) & (deviation <= rtol * scale)
+
+
+def compute_box_hex8_matrices(
+    dims: np.ndarray,
+    E: float,
+    nu: float,
+    rho: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Closed-form stiffness and mass matrices of axis-aligned box hexahedra.
+
+    Ke is a combination of nine size-independent 24x24 matrices weighted by
+    detJ * (2 / d_a) * (2 / d_b); Me is a fixed matrix scaled by the volume.
+    Equal to 2x2x2 Gauss quadrature on the same element.
+
+    Args:
+        dims: (num_elements, 3) box sizes (dx, dy, dz)
+        E: Young's modulus (Pa)
+        nu: Poisson's ratio
+        rho: Density (kg/m^3)
+
+    Returns:
+        Tuple of (Ke, Me) with shape (num_elements, 24, 24) each
+    """
+    D = elasticity_matrix_3d(E, nu)
+
+    # G[a, b] = sum_g w B_a^T D B_b, as one (3*24, 8*6) @ (8*6, 3*24) product
+    DB = np.matmul(D, _BOX_B_AXIS) * _HEX8_WEIGHTS[None, :, None, None]
+    G = (
+        _BOX_B_AXIS.transpose(0, 3, 1, 2).reshape(72, 48)
+        @ DB.transpose(1, 2, 0, 3).reshape(48, 72)
+    ).reshape(3, 24, 3, 24).transpose(0, 2, 1, 3)
+
+    detJ = np.prod(dims, axis=1) / 8
+    scale = 2.0 / dims
+    coeffs = detJ[:, None, None] * scale[:, :, None] * scale[:, None, :]
+
+    Ke = (coeffs.reshape(-1, 9) @ G.reshape(9, 576)).reshape(-1, 24, 24)
+    Me = (rho * detJ)[:, None, None] * _BOX_M_REF
+    return Ke, Me
+
+
+def compute_hex8_matrices_batch(
+    element_coords: np.ndarray,
+    E: float,
+    nu: float,
+    rho: float,
+    use_box_fast_path: bool = True
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute stiffness and mass matrices for many 8-node hexahedra at once.
+
+    Axis-aligned box elements (most of a bar mesh) use the closed-form
+    compute_box_hex8_matrices; the remaining, distorted elements are
+    integrated numerically by _hex8_matrices_quadrature.
+
+    Args:
+        element_coords: (num_elements, 8, 3) array of node coordinates
+        E: Young's modulus (Pa)
+        nu: Poisson's ratio
+        rho: Density (kg/m^3)
+        use_box_fast_path: Use closed-form matrices for box elements
+
+    Returns:
+        Tuple of (Ke, Me) with shape (num_elements, 24, 24) each
+    """
+    coords = np.asarray(element_coords, dtype=np.float64)
+    if not use_box_fast_path:
+        return _hex8_matrices_quadrature(coords, E, nu, rho)
+
+    is_box = find_box_elements(coords)
+    if is_box.all():
+        return compute_box_hex8_matrices(coords[:, 6, :] - coords[:, 0, :], E, nu, rho)
+
+    Ke = np.empty((len(coords), 24, 24))
+    Me = np.empty((len(coords), 24, 24))
+    if is_box.any():
+        box_coords = coords[is_box]
+        Ke[is_box], Me[is_box] = compute_box_hex8_matrices(
+            box_coords[:, 6, :] - box_coords[:, 0, :], E, nu, rho
+        )
+    Ke[~is_box], Me[~is_box] = _hex8_matrices_quadrature(coords[~is_box], E, nu, rho)
+    return Ke, Me
+
+
+def _hex8_matrices_quadrature(
+    coords: np.ndarray,
+    E: float,
+    nu: float,
+    rho: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hex8 stiffness and mass matrices by 2x2x2 Gauss quadrature, batched.
+
+    Jacobians, strain-displacement matrices and the Gauss sums for all
+    elements are evaluated with batched linear algebra and einsum instead
+    of per-element Python loops. Gauss points with a non-positive Jacobian
+    determinant are skipped, as in the single-element formulation.
+
+    Args:
+        coords: (num_elements, 8, 3) array of node coordinates
+        E: Young's modulus (Pa)
+        nu: Poisson's ratio
+        rho: Density (kg/m^3)
+
+    Returns:
+        Tuple of (Ke, Me) with shape (num_elements, 24, 24) each
+    """
+    num_elements = coords.shape[0]
+    D = elasticity_matrix_3d(E, nu)
+
+    # Jacobians at every Gauss point: J[e, g] = dN_nat[g] @ coords[e]
+    J = np.einsum('gan,enb->egab', _HEX8_DN_NAT, coords)
+    detJ = np.linalg.det(J)
+    valid = detJ > 0
+
+    # Degenerate Gauss points get zero weight (and an invertible stand-in)
+    J[~valid] = np.eye(3)
+    w_detJ = np.where(valid, _HEX8_WEIGHTS * detJ, 0.0)
+
+    # Shape function derivatives w.r.t. physical coordinates: (e, g, 3, 8)
+    dN_phys = np.linalg.solve(J, np.broadcast_to(_HEX8_DN_NAT, J.shape[:2] + (3, 8)))
+
+    # Strain-displacement matrices B: (e, g, 6, 24)
+    B = _hex8_strain_matrices(dN_phys)
+
+    # Ke = sum_g w detJ B^T D B, with the Gauss and strain axes folded into one matmul
+    DB = np.matmul(D, B) * w_detJ[:, :, None, None]
+    Ke = np.matmul(
+        B.reshape(num_elements, 48, 24).transpose(0, 2, 1),
+        DB.reshape(num_elements, 48, 24)
+    )
 
-    for gp in range(8):
-        xi, eta, zeta = gauss_pts[gp]
-        w = gauss_wts[gp]
-
-        # Shape functions and derivatives
-        N = shape_functions_hex8(xi, eta, zeta)
-        dN_nat = shape_function_derivatives_hex8(xi, eta, zeta)
-
-        # Jacobian matrix: J = dN/d(xi,eta,zeta) @ coords
-        J = dN_nat @ node_coords  # 3x3
-        detJ = np.linalg.det(J)
-
-        if detJ <= 0:
-            # Degenerate element, skip
-            continue
-
-        J_inv = np.linalg.inv(J)
-
-        # Shape function derivatives w.r.t. physical coordinates
-        dN_phys = J_inv @ dN_nat  # 3x8: [dN/dx, dN/dy, dN/dz]
-
-        # Build strain-displacement matrix B (6x24)
-        B = np.zeros((6, 24))
-        for i in range(8):
-            col = 3 * i
-            dNdx, dNdy, dNdz = dN_phys[:, i]
-
-            # epsilon_xx = du/dx
-            B[0, col] = dNdx
-            # epsilon_yy = dv/dy
-            B[1, col + 1] = dNdy
-            # epsilon_zz = dw/dz
-            B[2, col + 2] = dNdz
-            # gamma_xy = du/dy + dv/dx
-            B[3, col] = dNdy
-            B[3, col + 1] = dNdx
-            # gamma_yz = dv/dz + dw/dy
-            B[4, col + 1] = dNdz
-            B[4, col + 2] = dNdy
-            # gamma_xz = du/dz + dw/dx
-            B[5, col] = dNdz
-            B[5, col + 2] = dNdx
-
-        # Stiffness contribution
-        Ke += w * detJ * (B.T @ D @ B)
-
-        # Mass matrix - build N matrix (3x24)
-        N_mat = np.zeros((3, 24))
-        for i in range(8):
-            col = 3 * i
-            N_mat[0, col] = N[i]
-            N_mat[1, col + 1] = N[i]
-            N_mat[2, col + 2] = N[i]
-
-        Me += w * detJ * rho * (N_mat.T @ N_mat)
+    # Me = sum_g w detJ rho N^T N, with N^T N = (n n^T) kron I3
+    M_scalar = rho * np.einsum('eg,ga,gb->eab', w_detJ, _HEX8_N, _HEX8_N)
+    Me = np.einsum('eab,ij->eaibj', M_scalar, np.eye(3)).reshape(num_elements, 24, 24)
 
     return Ke, Me
 
@@ -262,72 +454,10 @@ def generate_bar_mesh_3d(
     # Ensure nx matches element_heights
     nx = len(element_heights)
 
-    # Element sizes
-    dx = length / nx
-    dy = width / ny
-
-    # Node grid dimensions
-    nnx = nx + 1
-    nny = ny + 1
-    nnz = nz + 1
-
-    nodes_list = []
-    node_index = {}  # (ix, iy, iz) -> node index
-
-    # Generate nodes - the z coordinates vary based on the undercut profile
-    for ix in range(nnx):
-        x = ix * dx
-
-        # Determine height at this x position
-        if ix == 0:
-            h = element_heights[0]
-        elif ix == nx:
-            h = element_heights[-1]
-        else:
-            # Average of adjacent elements
-            h = (element_heights[ix - 1] + element_heights[ix]) / 2
-
-        dz = h / nz
-
-        for iy in range(nny):
-            y = iy * dy
-
-            for iz in range(nnz):
-                # z goes from 0 to h (undercut is from bottom)
-                z = iz * dz
-
-                node_idx = len(nodes_list)
-                node_index[(ix, iy, iz)] = node_idx
-                nodes_list.append([x, y, z])
-
-    nodes = np.array(nodes_list)
-
-    # Generate elements
-    elements_list = []
-    heights_list = []
-
-    for ix in range(nx):
-        h = element_heights[ix]
-
-        for iy in range(ny):
-            for iz in range(nz):
-                # 8 nodes of hexahedron (following standard numbering)
-                n0 = node_index[(ix, iy, iz)]
-                n1 = node_index[(ix + 1, iy, iz)]
-                n2 = node_index[(ix + 1, iy + 1, iz)]
-                n3 = node_index[(ix, iy + 1, iz)]
-                n4 = node_index[(ix, iy, iz + 1)]
-                n5 = node_index[(ix + 1, iy, iz + 1)]
-                n6 = node_index[(ix + 1, iy + 1, iz + 1)]
-                n7 = node_index[(ix, iy + 1, iz + 1)]
+    mesh = BarMesh3D(nx, ny, nz)
+    mesh.update_geometry(length, width, element_heights)
 
-                elements_list.append([n0, n1, n2, n3, n4, n5, n6, n7])
-                heights_list.append(h)
-
-    elements = np.array(elements_list)
-    heights_per_element = np.array(heights_list)
-
-    return nodes, elements, heights_per_element
+    return mesh.nodes.copy(), mesh.elements.copy(), mesh.heights_per_element.copy()
 
 
 def generate_bar_mesh_3d_adaptive(
@@ -426,6 +556,89 @@ def generate_bar_mesh_3d_adaptive(
     return nodes, elements, heights_per_element
 
 
+class AssemblyPattern3D:
+    """
+    CSR sparsity pattern of a hex8 mesh plus the element-to-CSR scatter map.
+
+    Depends only on the mesh topology (element connectivity), so it is built
+    once and reused for every assembly on meshes with the same connectivity;
+    assembly then reduces to one bincount over all element matrix entries.
+    """
+
+    def __init__(self, elements: np.ndarray, num_dof: int):
+        """
+        Args:
+            elements: (num_elements, 8) array of node indices
+            num_dof: Number of global DOFs (3 per node)
+        """
+        elements = np.asarray(elements, dtype=np.int64)
+        num_elements = len(elements)
+
+        # DOF mapping: node n -> [3n, 3n+1, 3n+2]
+        dof_map = (3 * elements[:, :, None] + np.arange(3)).reshape(num_elements, 24)
+
+        # COO coordinates of every element matrix entry, in Ke.ravel() order
+        rows = np.repeat(dof_map, 24, axis=1).ravel()
+        cols = np.tile(dof_map, (1, 24)).ravel()
+
+        # Duplicate (row, col) pairs are summed: scatter maps entries to CSR slots
+        unique_keys, self.scatter = np.unique(rows * num_dof + cols, return_inverse=True)
+        self.scatter = self.scatter.ravel()
+        self.indices = (unique_keys % num_dof).astype(np.int32)
+        row_counts = np.bincount(unique_keys // num_dof, minlength=num_dof)
+        self.indptr = np.concatenate([[0], np.cumsum(row_counts)]).astype(np.int32)
+        self.num_dof = num_dof
+        self.dof_map = dof_map
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored entries in the assembled matrices."""
+        return len(self.indices)
+
+    def assemble(self, element_matrices: np.ndarray) -> csr_matrix:
+        """
+        Sum (num_elements, 24, 24) element matrices into a global CSR matrix.
+        """
+        data = np.bincount(self.scatter, weights=element_matrices.ravel(), minlength=self.nnz)
+        return csr_matrix((data, self.indices, self.indptr), shape=(self.num_dof, self.num_dof))
+
+
+# Patterns of recently used mesh topologies, keyed on connectivity
+_PATTERN_CACHE_SIZE = 8
+_pattern_cache: 'OrderedDict[tuple, AssemblyPattern3D]' = OrderedDict()
+_pattern_lock = threading.Lock()
+
+
+def get_assembly_pattern_3d(elements: np.ndarray, num_dof: int) -> AssemblyPattern3D:
+    """
+    Get the (cached) assembly pattern for a mesh topology.
+
+    Args:
+        elements: (num_elements, 8) array of node indices
+        num_dof: Number of global DOFs
+
+    Returns:
+        AssemblyPattern3D for this connectivity
+    """
+    elements = np.ascontiguousarray(elements, dtype=np.int64)
+    key = (num_dof, elements.shape, elements.tobytes())
+
+    with _pattern_lock:
+        pattern = _pattern_cache.get(key)
+        if pattern is not None:
+            _pattern_cache.move_to_end(key)
+            return pattern
+
+    pattern = AssemblyPattern3D(elements, num_dof)
+
+    with _pattern_lock:
+        _pattern_cache[key] = pattern
+        while len(_pattern_cache) > _PATTERN_CACHE_SIZE:
+            _pattern_cache.popitem(last=False)
+
+    return pattern
+
+
 def assemble_global_matrices_3d(
     nodes: np.ndarray,
     elements: np.ndarray,
@@ -437,6 +650,9 @@ def assemble_global_matrices_3d(
     """
     Assemble global stiffness and mass matrices from 3D mesh.
 
+    Element matrices are computed in one batched pass and summed into CSR
+    storage through the cached sparsity pattern of the mesh topology.
+
     Args:
         nodes: (num_nodes, 3) array of node coordinates
         elements: (num_elements, 8) array of node indices
@@ -448,46 +664,416 @@ def assemble_global_matrices_3d(
     Returns:
         Tuple of (K_global, M_global) matrices
     """
-    num_nodes = len(nodes)
-    num_dof = 3 * num_nodes
-    num_elements = len(elements)
+    num_dof = 3 * len(nodes)
+    pattern = get_assembly_pattern_3d(elements, num_dof)
 
-    if use_sparse:
-        K_global = lil_matrix((num_dof, num_dof), dtype=np.float64)
-        M_global = lil_matrix((num_dof, num_dof), dtype=np.float64)
+    # Element matrices for the whole mesh in one batched pass
+    Ke_all, Me_all = compute_hex8_matrices_batch(nodes[elements], E, nu, rho)
+
+    K_global = pattern.assemble(Ke_all)
+    M_global = pattern.assemble(Me_all)
+
+    if not use_sparse:
+        K_global = K_global.toarray()
+        M_global = M_global.toarray()
+
+    return K_global, M_global
+
+
+class BarMesh3D:
+    """
+    Structured hex8 mesh of an undercut bar with fixed topology.
+
+    Node numbering, element connectivity, DOF maps and the CSR assembly
+    pattern depend only on (nx, ny, nz). Only node coordinates change
+    between designs, so a mesh is built once and its geometry and matrix
+    data are rewritten in place for every new set of element heights.
+    Use get_bar_mesh_3d() to obtain a cached instance.
+    """
+
+    def __init__(self, nx: int, ny: int = 2, nz: int = 2):
+        """
+        Args:
+            nx: Number of elements in x-direction (length)
+            ny: Number of elements in y-direction (width)
+            nz: Number of elements in z-direction (thickness)
+        """
+        self.nx, self.ny, self.nz = nx, ny, nz
+
+        # Node grid, numbered x-major then y then z: (ix * nny + iy) * nnz + iz
+        nnx, nny, nnz = nx + 1, ny + 1, nz + 1
+        self._ix, self._iy, self._iz = (
+            idx.ravel() for idx in np.meshgrid(
+                np.arange(nnx), np.arange(nny), np.arange(nnz), indexing='ij'
+            )
+        )
+
+        def node_id(ix, iy, iz):
+            return (ix * nny + iy) * nnz + iz
+
+        # 8 nodes of each hexahedron (standard numbering), elements x-major
+        ex, ey, ez = (
+            idx.ravel() for idx in np.meshgrid(
+                np.arange(nx), np.arange(ny), np.arange(nz), indexing='ij'
+            )
+        )
+        self.elements = np.stack([
+            node_id(ex, ey, ez),
+            node_id(ex + 1, ey, ez),
+            node_id(ex + 1, ey + 1, ez),
+            node_id(ex, ey + 1, ez),
+            node_id(ex, ey, ez + 1),
+            node_id(ex + 1, ey, ez + 1),
+            node_id(ex + 1, ey + 1, ez + 1),
+            node_id(ex, ey + 1, ez + 1),
+        ], axis=1)
+
+        self.num_nodes = nnx * nny * nnz
+        self.num_dof = 3 * self.num_nodes
+        self.nodes = np.zeros((self.num_nodes, 3))
+        self.heights_per_element = np.zeros(len(self.elements))
+        self._pattern: Optional[AssemblyPattern3D] = None
+        self._K: Optional[csr_matrix] = None
+        self._M: Optional[csr_matrix] = None
+        self._warm_starts: Dict[Hashable, 'ShiftInvertWarmStart'] = {}
+        self._surrogate = None
+
+    def warm_start(self, key: Hashable = None) -> 'ShiftInvertWarmStart':
+        """
+        Shift-invert warm start for eigenproblems on this mesh.
+
+        Args:
+            key: Separate state per problem size (e.g. a symmetry class)
+
+        Returns:
+            Persistent ShiftInvertWarmStart for the key
+        """
+        state = self._warm_starts.get(key)
+        if state is None:
+            state = self._warm_starts[key] = ShiftInvertWarmStart()
+        return state
+
+    def modal_surrogate(self) -> 'ModalSurrogate3D':
+        """Reduced-basis surrogate for designs on this mesh (created on first use)."""
+        if self._surrogate is None:
+            from .modal_surrogate import ModalSurrogate3D
+            self._surrogate = ModalSurrogate3D()
+        return self._surrogate
+
+    @property
+    def pattern(self) -> AssemblyPattern3D:
+        """CSR assembly pattern of the mesh (built on first use)."""
+        if self._pattern is None:
+            self._pattern = AssemblyPattern3D(self.elements, self.num_dof)
+        return self._pattern
+
+    @property
+    def dof_map(self) -> np.ndarray:
+        """(num_elements, 24) global DOF indices of each element."""
+        return self.pattern.dof_map
+
+    def mirror_node_map(self, axis: int) -> np.ndarray:
+        """
+        Node index of the mirror image of every node about the mid-plane
+        x = L/2 (axis 0) or y = b/2 (axis 1).
+        """
+        nny, nnz = self.ny + 1, self.nz + 1
+        ix, iy = self._ix, self._iy
+        if axis == 0:
+            ix = self.nx - ix
+        elif axis == 1:
+            iy = self.ny - iy
+        else:
+            raise ValueError("Mirror axis must be 0 (x) or 1 (y)")
+        return (ix * nny + iy) * nnz + self._iz
+
+    def update_dimensions(self, length: float, width: float) -> None:
+        """Rewrite x and y coordinates for a new bar length and width."""
+        self.nodes[:, 0] = self._ix * (length / self.nx)
+        self.nodes[:, 1] = self._iy * (width / self.ny)
+
+    def update_heights(self, element_heights: List[float]) -> None:
+        """
+        Rewrite z coordinates for new element heights.
+
+        Node heights are the element heights at the bar ends and the
+        average of the two adjacent elements elsewhere; z runs from 0
+        (undercut side) to the local height.
+        """
+        h = np.asarray(element_heights, dtype=np.float64)
+        node_h = np.empty(self.nx + 1)
+        node_h[0] = h[0]
+        node_h[-1] = h[-1]
+        node_h[1:-1] = (h[:-1] + h[1:]) / 2
+
+        self.nodes[:, 2] = self._iz * (node_h / self.nz)[self._ix]
+        self.heights_per_element = np.repeat(h, self.ny * self.nz)
+
+    def update_geometry(self, length: float, width: float, element_heights: List[float]) -> None:
+        """Rewrite all node coordinates (length, width and element heights)."""
+        self.update_dimensions(length, width)
+        self.update_heights(element_heights)
+
+    def assemble(self, E: float, nu: float, rho: float) -> Tuple[csr_matrix, csr_matrix]:
+        """
+        Assemble global K and M for the current geometry.
+
+        The returned CSR matrices are owned by the mesh: their data arrays
+        are refilled in place by the next call.
+
+        Returns:
+            Tuple of (K_global, M_global) sparse matrices
+        """
+        Ke_all, Me_all = compute_hex8_matrices_batch(self.nodes[self.elements], E, nu, rho)
+
+        if self._K is None:
+            self._K = self.pattern.assemble(Ke_all)
+            self._M = self.pattern.assemble(Me_all)
+        else:
+            scatter, nnz = self.pattern.scatter, self.pattern.nnz
+            self._K.data[:] = np.bincount(scatter, weights=Ke_all.ravel(), minlength=nnz)
+            self._M.data[:] = np.bincount(scatter, weights=Me_all.ravel(), minlength=nnz)
+
+        return self._K, self._M
+
+
+# Meshes are mutated in place, so each thread keeps its own cache
+_MESH_CACHE_SIZE = 8
+_mesh_cache = threading.local()
+
+
+def get_bar_mesh_3d(nx: int, ny: int = 2, nz: int = 2) -> BarMesh3D:
+    """
+    Get the calling thread's cached BarMesh3D for (nx, ny, nz).
+
+    Args:
+        nx: Number of elements in x-direction
+        ny: Number of elements in y-direction
+        nz: Number of elements in z-direction
+
+    Returns:
+        BarMesh3D with fixed topology (geometry is whatever was set last)
+    """
+    meshes = getattr(_mesh_cache, 'meshes', None)
+    if meshes is None:
+        meshes = _mesh_cache.meshes = OrderedDict()
+
+    key = (nx, ny, nz)
+    mesh = meshes.get(key)
+    if mesh is None:
+        mesh = meshes[key] = BarMesh3D(nx, ny, nz)
+        while len(meshes) > _MESH_CACHE_SIZE:
+            meshes.popitem(last=False)
     else:
-        K_global = np.zeros((num_dof, num_dof), dtype=np.float64)
-        M_global = np.zeros((num_dof, num_dof), dtype=np.float64)
+        meshes.move_to_end(key)
+    return mesh
 
-    for e in range(num_elements):
-        elem_nodes = elements[e]
-        node_coords = nodes[elem_nodes]
 
-        Ke, Me = compute_hex8_matrices(node_coords, E, nu, rho)
+def _assemble_bar_3d(
+    element_heights: List[float],
+    length: float,
+    width: float,
+    E: float,
+    rho: float,
+    nu: float,
+    ny: int,
+    nz: int,
+    num_modes: int,
+    solver: str = 'auto'
+) -> Tuple[BarMesh3D, np.ndarray, np.ndarray, str]:
+    """
+    Update the cached mesh for a bar and assemble K and M.
+
+    Returns:
+        Tuple of (mesh, K, M, solver) with the resolved solver name; K and
+        M are dense arrays for the 'dense' solver
+    """
+    mesh = get_bar_mesh_3d(len(element_heights), ny, nz)
+    mesh.update_geometry(length, width, element_heights)
+    solver = resolve_solver_3d(solver, mesh.num_dof, num_modes)
 
-        # DOF mapping
-        dof_map = []
-        for n in elem_nodes:
-            dof_map.extend([3 * n, 3 * n + 1, 3 * n + 2])
+    K, M = mesh.assemble(E, nu, rho)
+    if solver == 'dense':
+        K = K.toarray()
+        M = M.toarray()
 
-        for i in range(24):
-            for j in range(24):
-                gi, gj = dof_map[i], dof_map[j]
-                K_global[gi, gj] += Ke[i, j]
-                M_global[gi, gj] += Me[i, j]
+    return mesh, K, M, solver
 
-    if use_sparse:
-        K_global = csr_matrix(K_global)
-        M_global = csr_matrix(M_global)
 
-    return K_global, M_global
+def resolve_solver_3d(solver: str, num_dof: int, num_modes: int) -> str:
+    """
+    Resolve a 3D solver option to a backend name.
+
+    Args:
+        solver: 'auto', 'reduced' or one of EIGEN_SOLVERS_3D
+        num_dof: Number of degrees of freedom of the model
+        num_modes: Number of modes requested
+
+    Returns:
+        Backend name from EIGEN_SOLVERS_3D, or 'reduced'
+    """
+    if solver == 'auto':
+        from .solver_selection import choose_solver_3d
+        return choose_solver_3d(num_dof, num_modes)
+    if solver not in EIGEN_SOLVERS_3D and solver != REDUCED_SOLVER_3D:
+        raise ValueError(f"Unknown 3D eigen-solver: {solver}")
+    return solver
+
+
+def _solve_bar_3d(
+    mesh: BarMesh3D,
+    K,
+    M,
+    num_modes: int,
+    solver: str,
+    warm_start: bool = True
+) -> Tuple[List[float], np.ndarray]:
+    """
+    Solve the assembled bar model with a resolved backend.
+
+    Returns:
+        Tuple of (frequencies in Hz, mode_shapes array)
+    """
+    if solver == 'dense':
+        return solve_eigenvalue_3d_with_vectors(K, M, num_modes, use_sparse=False)
+    if solver == 'lobpcg':
+        return solve_eigenvalue_3d_lobpcg(K, M, num_modes, mesh.nodes, mesh.warm_start('lobpcg'))
+    if solver == REDUCED_SOLVER_3D:
+        return mesh.modal_surrogate().solve(mesh, K, M, num_modes)
+    return solve_eigenvalue_3d_with_vectors(
+        K, M, num_modes, True, mesh.warm_start() if warm_start else None
+    )
+
+
+# Shift used before any solution is known (omega^2, rad^2/s^2): below every
+# audible mode, and far enough from the rigid body modes at 0 for an accurate
+# factorization of K - sigma*M
+INITIAL_WARM_SHIFT = -1.0e3
+
+# omega^2 threshold separating rigid body modes from elastic modes
+RIGID_MODE_THRESHOLD = 100.0
+
+
+class ShiftInvertWarmStart:
+    """
+    State carried between successive shift-invert solves of similar models.
+
+    The shift is placed just below the spectrum, at minus the lowest elastic
+    eigenvalue of the previous solution: K - sigma*M is then positive
+    definite and well conditioned, and the eigenvalues nearest sigma are the
+    lowest ones in order. The normalized sum of the previous elastic mode
+    shapes is the ARPACK start vector, which for a nearby geometry already
+    lies mostly in the wanted subspace. The mode shapes themselves are kept
+    as the initial block for the LOBPCG backend.
+    """
+
+    def __init__(self):
+        self.sigma = INITIAL_WARM_SHIFT
+        self.v0: Optional[np.ndarray] = None
+        self.modes: Optional[np.ndarray] = None
+
+    def start_vector(self, n: int) -> Optional[np.ndarray]:
+        """Start vector for a problem of size n, or None if unavailable."""
+        if self.v0 is None or len(self.v0) != n:
+            return None
+        return self.v0
+
+    def update(self, eigenvalues: np.ndarray, eigenvectors: np.ndarray) -> None:
+        """Record a converged solution for the next solve."""
+        elastic = eigenvalues > RIGID_MODE_THRESHOLD
+        if not np.any(elastic):
+            return
+        self.sigma = -float(np.min(eigenvalues[elastic]))
+        order = np.argsort(eigenvalues[elastic])
+        self.modes = eigenvectors[:, elastic][:, order]
+        v0 = self.modes.sum(axis=1)
+        norm = np.linalg.norm(v0)
+        self.v0 = v0 / norm if norm > 0 else None
+
+    def reset(self) -> None:
+        """Forget the previous solution."""
+        self.sigma = INITIAL_WARM_SHIFT
+        self.v0 = None
+        self.modes = None
+
+
+def _eigsh_shift_invert(
+    K,
+    M,
+    num_modes: int,
+    num_extra: int,
+    warm_start: Optional[ShiftInvertWarmStart] = None,
+    factor=None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lowest eigenpairs of a sparse model with ARPACK in shift-invert mode.
+
+    Without a warm start the historical fixed shift sigma = 1.0 and a random
+    start vector are used, and num_extra modes are requested on top of
+    num_modes to make up for the unordered spectrum around that shift. With
+    a warm start the shift lies below the spectrum, so only the 6 rigid body
+    modes plus a small margin are needed, and a smaller Lanczos basis
+    suffices once a start vector is available.
+
+    A caller that keeps the factorization of K - sigma*M (sigma from the
+    warm start) passes it as factor, and ARPACK uses it instead of
+    factorizing again.
+    """
+    n = K.shape[0]
+    ncv = None
+    OPinv = None
+    if warm_start is None:
+        sigma, v0 = 1.0, None
+        num_request = min(num_modes + num_extra, n - 2)
+    else:
+        sigma, v0 = warm_start.sigma, warm_start.start_vector(n)
+        num_request = min(num_modes + 8, n - 2)
+        if v0 is not None:
+            ncv = min(num_request + 8, n - 1)
+        if factor is not None:
+            OPinv = LinearOperator((n, n), matvec=factor.solve, dtype=np.float64)
+
+    try:
+        eigenvalues, eigenvectors = eigsh(
+            K, k=num_request, M=M, sigma=sigma, which='LM', v0=v0, ncv=ncv, OPinv=OPinv
+        )
+    except Exception:
+        # Fallback: add regularization and use the default Lanczos basis
+        M_reg = M + 1e-10 * identity(n, format='csr')
+        eigenvalues, eigenvectors = eigsh(K, k=num_request, M=M_reg, sigma=sigma, which='LM', v0=v0)
+
+    if warm_start is not None:
+        warm_start.update(eigenvalues, eigenvectors)
+    return eigenvalues, eigenvectors
+
+
+def _eigh_dense_partial(K: np.ndarray, M: np.ndarray, num_modes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lowest eigenpairs of a dense model with the LAPACK subset driver.
+
+    Only the 6 rigid body modes, the requested modes and a margin of 2 are
+    computed (?sygvx), instead of the full spectrum.
+    """
+    n = K.shape[0]
+    num_request = min(num_modes + 8, n)
+
+    # Regularize M
+    M_reg = M.copy()
+    M_reg[np.diag_indices(n)] += 1e-12 * np.maximum(np.abs(np.diag(M)), 1e-20)
+
+    try:
+        return linalg.eigh(K, M_reg, subset_by_index=[0, num_request - 1], driver='gvx')
+    except linalg.LinAlgError:
+        M_reg[np.diag_indices(n)] += 1e-8
+        return linalg.eigh(K, M_reg, subset_by_index=[0, num_request - 1], driver='gvx')
 
 
 def solve_eigenvalue_3d(
     K: np.ndarray,
     M: np.ndarray,
     num_modes: int,
-    use_sparse: bool = True
+    use_sparse: bool = True,
+    warm_start: Optional[ShiftInvertWarmStart] = None
 ) -> List[float]:
     """
     Solve generalized eigenvalue problem for 3D FEM.
@@ -499,6 +1085,8 @@ def solve_eigenvalue_3d(
         K: Global stiffness matrix
         M: Global mass matrix
         num_modes: Number of modes to extract
+        use_sparse: Whether matrices are sparse
+        warm_start: Shift and start vector from a previous solve (sparse only)
 
     Returns:
         List of natural frequencies in Hz
@@ -506,47 +1094,16 @@ def solve_eigenvalue_3d(
     if use_sparse:
         # Use sparse eigenvalue solver
         # Request more eigenvalues to filter rigid body modes
-        num_request = min(num_modes + 10, K.shape[0] - 2)
-
-        # Add small shift to avoid singularity issues
-        sigma = 1.0  # Small shift
-
-        try:
-            eigenvalues, _ = eigsh(K, k=num_request, M=M, sigma=sigma, which='LM')
-        except Exception:
-            # Fallback: add regularization
-            n = K.shape[0]
-            M_reg = M + 1e-10 * csr_matrix(np.eye(n))
-            eigenvalues, _ = eigsh(K, k=num_request, M=M_reg, sigma=sigma, which='LM')
+        eigenvalues, _ = _eigsh_shift_invert(K, M, num_modes, 10, warm_start)
     else:
-        # Dense solver
-        n = K.shape[0]
-
-        # Regularize M
-        M_reg = M.copy()
-        for i in range(n):
-            M_reg[i, i] += 1e-12 * max(abs(M[i, i]), 1e-20)
-
-        try:
-            L = linalg.cholesky(M_reg, lower=True)
-            L_inv = linalg.solve_triangular(L, np.eye(n), lower=True)
-            K_tilde = L_inv @ K @ L_inv.T
-            K_tilde = (K_tilde + K_tilde.T) / 2
-            eigenvalues, _ = linalg.eigh(K_tilde)
-        except linalg.LinAlgError:
-            for i in range(n):
-                M_reg[i, i] += 1e-8
-            L = linalg.cholesky(M_reg, lower=True)
-            L_inv = linalg.solve_triangular(L, np.eye(n), lower=True)
-            K_tilde = L_inv @ K @ L_inv.T
-            K_tilde = (K_tilde + K_tilde.T) / 2
-            eigenvalues, _ = linalg.eigh(K_tilde)
+        # Dense solver (lowest modes only)
+        eigenvalues, _ = _eigh_dense_partial(K, M, num_modes)
 
     # Sort and filter
     eigenvalues = np.sort(eigenvalues)
 
     # Filter rigid body modes (6 for 3D: 3 translations + 3 rotations)
-    threshold = 100.0  # omega^2 threshold
+    threshold = RIGID_MODE_THRESHOLD  # omega^2 threshold
     elastic_modes = [ev for ev in eigenvalues if ev > threshold]
 
     # Convert to frequencies
@@ -555,6 +1112,119 @@ def solve_eigenvalue_3d(
     return frequencies
 
 
+def rigid_body_modes_3d(nodes: np.ndarray) -> np.ndarray:
+    """
+    Rigid body displacement fields of a free 3D body.
+
+    Args:
+        nodes: (num_nodes, 3) node coordinates
+
+    Returns:
+        (3 * num_nodes, 6) array: translations in x, y, z and rotations
+        about the z, x and y axes through the centroid
+    """
+    c = nodes - nodes.mean(axis=0)
+    modes = np.zeros((3 * len(nodes), 6))
+    for axis in range(3):
+        modes[axis::3, axis] = 1.0
+    modes[0::3, 3], modes[1::3, 3] = -c[:, 1], c[:, 0]
+    modes[1::3, 4], modes[2::3, 4] = -c[:, 2], c[:, 1]
+    modes[2::3, 5], modes[0::3, 5] = -c[:, 0], c[:, 2]
+    return modes
+
+
+def _lobpcg_preconditioner(A: csr_matrix, near_null_space: np.ndarray) -> LinearOperator:
+    """
+    Approximate inverse of the SPD matrix A for LOBPCG.
+
+    Smoothed-aggregation AMG with the rigid body modes as near null space
+    when pyamg is installed, incomplete LU otherwise.
+    """
+    if HAS_PYAMG:
+        ml = pyamg.smoothed_aggregation_solver(A, B=near_null_space)
+        return ml.aspreconditioner(cycle='V')
+
+    ilu = spilu(A.tocsc(), drop_tol=1e-4, fill_factor=10)
+    return LinearOperator(A.shape, matvec=ilu.solve, matmat=ilu.solve, dtype=np.float64)
+
+
+def solve_eigenvalue_3d_lobpcg(
+    K: csr_matrix,
+    M: csr_matrix,
+    num_modes: int,
+    nodes: np.ndarray,
+    warm_start: ShiftInvertWarmStart,
+    tol: float = 1e-3,
+    max_iterations: int = 60
+) -> Tuple[List[float], np.ndarray]:
+    """
+    Solve the sparse 3D eigenproblem with preconditioned LOBPCG.
+
+    The rigid body modes are passed as constraints, so the block only holds
+    elastic modes (num_modes + 2 vectors, the extra ones speed up the
+    convergence of the highest wanted mode). The problem is scaled by the
+    mass diagonal and the previous lowest eigenvalue, so eigenvalues are
+    O(1) and tol applies to the scaled residual norms. The preconditioner
+    approximates (K - sigma*M)^-1 with the warm-start shift.
+
+    The converged block is stored in warm_start and seeds the next solve,
+    which suits a population of similar geometries. Without a previous
+    block (first solve on a mesh), or if LOBPCG does not converge, the
+    shift-invert path is used instead.
+
+    Args:
+        K: Sparse global stiffness matrix
+        M: Sparse global mass matrix
+        num_modes: Number of modes to extract
+        nodes: (num_nodes, 3) node coordinates (for the rigid body modes)
+        warm_start: Previous solution on this mesh, updated in place
+        tol: Residual tolerance of the scaled problem
+        max_iterations: Maximum number of LOBPCG iterations
+
+    Returns:
+        Tuple of (frequencies in Hz, mode_shapes array)
+    """
+    n = K.shape[0]
+    block_size = min(num_modes + 2, n // 5)
+    if warm_start.modes is None or warm_start.modes.shape[0] != n:
+        return solve_eigenvalue_3d_with_vectors(K, M, num_modes, True, warm_start)
+
+    # Symmetric scaling: M gets a unit diagonal, K eigenvalues of order one
+    scale = 1.0 / np.sqrt(M.diagonal())
+    lam_ref = -warm_start.sigma
+    D = diags(scale)
+    K_s = ((D @ K @ D) / lam_ref).tocsr()
+    M_s = (D @ M @ D).tocsr()
+
+    rigid = rigid_body_modes_3d(nodes) / scale[:, None]
+    preconditioner = _lobpcg_preconditioner(K_s + M_s, rigid)
+
+    # Previous elastic modes as initial block, padded with random vectors
+    X = warm_start.modes[:, :block_size] / scale[:, None]
+    if X.shape[1] < block_size:
+        rng = np.random.default_rng(0)
+        X = np.hstack([X, rng.standard_normal((n, block_size - X.shape[1]))])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        eigenvalues, eigenvectors, residual_history = lobpcg(
+            K_s, X, B=M_s, M=preconditioner, Y=rigid,
+            largest=False, tol=tol, maxiter=max_iterations,
+            retResidualNormsHistory=True
+        )
+    if np.max(residual_history[-1]) > tol:
+        return solve_eigenvalue_3d_with_vectors(K, M, num_modes, True, warm_start)
+
+    eigenvalues = eigenvalues * lam_ref
+    eigenvectors = eigenvectors * scale[:, None]
+
+    warm_start.update(eigenvalues, eigenvectors)
+
+    order = np.argsort(eigenvalues)[:num_modes]
+    frequencies = [math.sqrt(abs(ev)) / (2.0 * math.pi) for ev in eigenvalues[order]]
+    return frequencies, eigenvectors[:, order]
+
+
 def compute_frequencies_3d(
     element_heights: List[float],
     length: float,
@@ -564,12 +1234,17 @@ def compute_frequencies_3d(
     nu: float,
     num_modes: int,
     ny: int = 2,
-    nz: int = 2
+    nz: int = 2,
+    warm_start: bool = True,
+    solver: str = 'auto'
 ) -> List[float]:
     """
     Compute natural frequencies using 3D FEM analysis.
 
-    This is the main entry point for 3D frequency computation.
+    This is the main entry point for 3D frequency computation. With
+    warm_start, the sparse solve is seeded from the previous solution on
+    the same cached mesh (see ShiftInvertWarmStart), which suits the
+    successive nearby geometries of the EA and the length search.
 
     Args:
         element_heights: Height of each element along bar length (m)
@@ -581,26 +1256,23 @@ def compute_frequencies_3d(
         num_modes: Number of modes to extract
         ny: Number of elements in width direction
         nz: Number of elements in thickness direction
+        warm_start: Reuse shift and start vector from the previous solve
+        solver: 'auto' (calibrated choice by model size), 'dense' (LAPACK
+            subset driver), 'eigsh' (shift-invert ARPACK), 'lobpcg'
+            (preconditioned block solver, always warm-started) or 'reduced'
+            (projection onto the mode shapes of a nearby design, with a
+            full solve when the residual check fails)
 
     Returns:
         List of natural frequencies in Hz
     """
-    nx = len(element_heights)
-
-    # Generate mesh
-    nodes, elements, _ = generate_bar_mesh_3d(
-        length, width, element_heights, nx, ny, nz
+    # Cached mesh topology; only the geometry is rewritten
+    mesh, K, M, solver = _assemble_bar_3d(
+        element_heights, length, width, E, rho, nu, ny, nz, num_modes, solver
     )
 
-    # Determine if we should use sparse matrices
-    num_dof = 3 * len(nodes)
-    use_sparse = num_dof > 1000
-
-    # Assemble matrices
-    K, M = assemble_global_matrices_3d(nodes, elements, E, nu, rho, use_sparse)
-
     # Solve eigenvalue problem
-    frequencies = solve_eigenvalue_3d(K, M, num_modes, use_sparse)
+    frequencies, _ = _solve_bar_3d(mesh, K, M, num_modes, solver, warm_start)
 
     return frequencies
 
@@ -734,7 +1406,8 @@ def solve_eigenvalue_3d_with_vectors(
     K: np.ndarray,
     M: np.ndarray,
     num_modes: int,
-    use_sparse: bool = True
+    use_sparse: bool = True,
+    warm_start: Optional[ShiftInvertWarmStart] = None
 ) -> Tuple[List[float], np.ndarray]:
     """
     Solve generalized eigenvalue problem and return both frequencies and mode shapes.
@@ -744,42 +1417,15 @@ def solve_eigenvalue_3d_with_vectors(
         M: Global mass matrix
         num_modes: Number of modes to extract
         use_sparse: Whether matrices are sparse
+        warm_start: Shift and start vector from a previous solve (sparse only)
 
     Returns:
         Tuple of (frequencies in Hz, mode_shapes array)
     """
     if use_sparse:
-        num_request = min(num_modes + 12, K.shape[0] - 2)
-        sigma = 1.0
-
-        try:
-            eigenvalues, eigenvectors = eigsh(K, k=num_request, M=M, sigma=sigma, which='LM')
-        except Exception:
-            n = K.shape[0]
-            M_reg = M + 1e-10 * csr_matrix(np.eye(n))
-            eigenvalues, eigenvectors = eigsh(K, k=num_request, M=M_reg, sigma=sigma, which='LM')
+        eigenvalues, eigenvectors = _eigsh_shift_invert(K, M, num_modes, 12, warm_start)
     else:
-        n = K.shape[0]
-        M_reg = M.copy()
-        for i in range(n):
-            M_reg[i, i] += 1e-12 * max(abs(M[i, i]), 1e-20)
-
-        try:
-            L = linalg.cholesky(M_reg, lower=True)
-            L_inv = linalg.solve_triangular(L, np.eye(n), lower=True)
-            K_tilde = L_inv @ K @ L_inv.T
-            K_tilde = (K_tilde + K_tilde.T) / 2
-            eigenvalues, eigenvectors_tilde = linalg.eigh(K_tilde)
-            eigenvectors = L_inv.T @ eigenvectors_tilde
-        except linalg.LinAlgError:
-            for i in range(n):
-                M_reg[i, i] += 1e-8
-            L = linalg.cholesky(M_reg, lower=True)
-            L_inv = linalg.solve_triangular(L, np.eye(n), lower=True)
-            K_tilde = L_inv @ K @ L_inv.T
-            K_tilde = (K_tilde + K_tilde.T) / 2
-            eigenvalues, eigenvectors_tilde = linalg.eigh(K_tilde)
-            eigenvectors = L_inv.T @ eigenvectors_tilde
+        eigenvalues, eigenvectors = _eigh_dense_partial(K, M, num_modes)
 
     # Sort by eigenvalue
     sort_idx = np.argsort(eigenvalues)
@@ -787,7 +1433,7 @@ def solve_eigenvalue_3d_with_vectors(
     eigenvectors = eigenvectors[:, sort_idx]
 
     # Filter rigid body modes
-    threshold = 100.0
+    threshold = RIGID_MODE_THRESHOLD
     elastic_mask = eigenvalues > threshold
     elastic_eigenvalues = eigenvalues[elastic_mask]
     elastic_eigenvectors = eigenvectors[:, elastic_mask]
@@ -808,7 +1454,9 @@ def compute_frequencies_3d_classified(
     nu: float,
     num_modes: int = 10,
     ny: int = 2,
-    nz: int = 2
+    nz: int = 2,
+    warm_start: bool = True,
+    solver: str = 'auto'
 ) -> Tuple[List[float], dict, np.ndarray]:
     """
     Compute natural frequencies using 3D FEM with mode classification.
@@ -825,6 +1473,8 @@ def compute_frequencies_3d_classified(
         num_modes: Number of modes to extract (request more for classification)
         ny: Number of elements in width direction
         nz: Number of elements in thickness direction
+        warm_start: Reuse shift and start vector from the previous solve
+        solver: 'auto', 'dense', 'eigsh', 'lobpcg' or 'reduced' (see compute_frequencies_3d)
 
     Returns:
         Tuple of:
@@ -832,22 +1482,14 @@ def compute_frequencies_3d_classified(
         - classified: Dict with modes organized by type
         - nodes: Node coordinates for visualization
     """
-    nx = len(element_heights)
-
-    # Generate mesh
-    nodes, elements, _ = generate_bar_mesh_3d(
-        length, width, element_heights, nx, ny, nz
+    # Cached mesh topology; only the geometry is rewritten
+    mesh, K, M, solver = _assemble_bar_3d(
+        element_heights, length, width, E, rho, nu, ny, nz, num_modes, solver
     )
-
-    # Determine if we should use sparse matrices
-    num_dof = 3 * len(nodes)
-    use_sparse = num_dof > 1000
-
-    # Assemble matrices
-    K, M = assemble_global_matrices_3d(nodes, elements, E, nu, rho, use_sparse)
+    nodes = mesh.nodes.copy()
 
     # Solve eigenvalue problem with mode shapes
-    frequencies, mode_shapes = solve_eigenvalue_3d_with_vectors(K, M, num_modes, use_sparse)
+    frequencies, mode_shapes = _solve_bar_3d(mesh, K, M, num_modes, solver, warm_start)
 
     # Classify modes
     classified = classify_all_modes(frequencies, mode_shapes, nodes)
@@ -864,13 +1506,16 @@ def get_bending_frequencies_3d(
     nu: float,
     num_bending_modes: int = 3,
     ny: int = 2,
-    nz: int = 2
+    nz: int = 2,
+    use_symmetry: bool = False
 ) -> List[float]:
     """
     Compute only vertical bending frequencies from 3D FEM analysis.
 
     This filters out torsional, lateral, and axial modes to return
     only the vertical bending modes comparable to 2D beam analysis.
+    With use_symmetry, only the two symmetry classes that can contain
+    vertical bending (symmetric about the mid-width plane) are solved.
 
     Args:
         element_heights: Height of each element along bar length (m)
@@ -882,6 +1527,7 @@ def get_bending_frequencies_3d(
         num_bending_modes: Number of bending modes to return
         ny: Number of elements in width direction
         nz: Number of elements in thickness direction
+        use_symmetry: Solve the bending symmetry classes only
 
     Returns:
         List of vertical bending frequencies in Hz
@@ -889,10 +1535,16 @@ def get_bending_frequencies_3d(
     # Request more modes to ensure we find enough bending modes
     num_request = num_bending_modes * 4 + 6
 
-    _, classified, _ = compute_frequencies_3d_classified(
-        element_heights, length, width, E, rho, nu,
-        num_request, ny, nz
-    )
+    if use_symmetry:
+        _, classified, _ = compute_frequencies_3d_symmetric_classified(
+            element_heights, length, width, E, rho, nu,
+            num_request, ny, nz, BENDING_SYMMETRY_CLASSES
+        )
+    else:
+        _, classified, _ = compute_frequencies_3d_classified(
+            element_heights, length, width, E, rho, nu,
+            num_request, ny, nz
+        )
 
     # Extract vertical bending frequencies
     bending_modes = classified['vertical_bending']
@@ -943,9 +1595,9 @@ def compute_frequencies_3d_adaptive(
         length, width, x_positions, element_heights, ny, nz
     )
 
-    # Determine if we should use sparse matrices
+    # Dense subset driver or sparse shift-invert, whichever is faster at this size
     num_dof = 3 * len(nodes)
-    use_sparse = num_dof > 1000
+    use_sparse = resolve_solver_3d('auto', num_dof, num_modes) != 'dense'
 
     # Assemble matrices
     K, M = assemble_global_matrices_3d(nodes, elements, E, nu, rho, use_sparse)
@@ -957,3 +1609,256 @@ def compute_frequencies_3d_adaptive(
     classified = classify_all_modes(frequencies, mode_shapes, nodes)
 
     return frequencies, classified, nodes, elements
+
+
+# =============================================================================
+# Symmetry-reduced analysis (mirror planes x = L/2 and y = b/2)
+# =============================================================================
+
+# (sx, sy): +1 = symmetric, -1 = antisymmetric about the x / y mid-plane
+SYMMETRY_CLASSES = ((1, 1), (-1, 1), (1, -1), (-1, -1))
+
+# Vertical bending (and axial) modes are symmetric about the mid-width plane;
+# torsional and lateral modes are antisymmetric about it
+BENDING_SYMMETRY_CLASSES = ((1, 1), (-1, 1))
+
+_symmetry_basis_cache: 'OrderedDict[tuple, csr_matrix]' = OrderedDict()
+_symmetry_basis_lock = threading.Lock()
+
+
+def symmetry_basis_3d(mesh: BarMesh3D, sx: int, sy: int) -> csr_matrix:
+    """
+    Orthonormal basis of the displacement fields of one symmetry class.
+
+    A field u is in class (sx, sy) if mirroring the bar about x = L/2 maps
+    it to sx * u and mirroring about y = b/2 maps it to sy * u (mirroring
+    flips the displacement component normal to the plane). Each basis
+    vector combines the mirror images of one DOF, so the class has about a
+    quarter of the DOFs; normal displacements on a symmetry plane vanish in
+    the symmetric class and in-plane ones in the antisymmetric class.
+
+    Args:
+        mesh: Bar mesh (only its topology is used)
+        sx: +1 or -1 for the x mid-plane
+        sy: +1 or -1 for the y mid-plane
+
+    Returns:
+        (num_dof, num_class_dof) sparse basis T with T^T T = I
+    """
+    key = (mesh.nx, mesh.ny, mesh.nz, sx, sy)
+    with _symmetry_basis_lock:
+        T = _symmetry_basis_cache.get(key)
+        if T is not None:
+            _symmetry_basis_cache.move_to_end(key)
+            return T
+
+    nodes = np.arange(mesh.num_nodes)
+    mirror_x = mesh.mirror_node_map(0)
+    mirror_y = mesh.mirror_node_map(1)
+    mirror_xy = mirror_x[mirror_y]
+
+    # One representative node per orbit of the mirror group
+    reps = nodes[(nodes <= mirror_x) & (nodes <= mirror_y) & (nodes <= mirror_xy)]
+    cols = np.arange(3 * len(reps)).reshape(-1, 3)
+
+    # Group element: (node map, displacement component signs, class character)
+    group = (
+        (nodes, np.array([1, 1, 1]), 1),
+        (mirror_x, np.array([-1, 1, 1]), sx),
+        (mirror_y, np.array([1, -1, 1]), sy),
+        (mirror_xy, np.array([-1, -1, 1]), sx * sy),
+    )
+    rows = np.concatenate([(3 * node_map[reps])[:, None] + np.arange(3) for node_map, _, _ in group])
+    vals = np.concatenate([np.broadcast_to(chi * signs, (len(reps), 3)) for _, signs, chi in group])
+
+    # Duplicates (DOFs on a symmetry plane) are summed and may cancel
+    T = coo_matrix(
+        (vals.ravel().astype(np.float64), (rows.ravel(), np.tile(cols, (4, 1)).ravel())),
+        shape=(mesh.num_dof, cols.size)
+    ).tocsc()
+    T.eliminate_zeros()
+
+    norms = np.sqrt(np.asarray(T.multiply(T).sum(axis=0)).ravel())
+    keep = norms > 0
+    T = (T[:, keep] @ diags(1.0 / norms[keep])).tocsr()
+
+    with _symmetry_basis_lock:
+        _symmetry_basis_cache[key] = T
+        while len(_symmetry_basis_cache) > 4 * _MESH_CACHE_SIZE:
+            _symmetry_basis_cache.popitem(last=False)
+
+    return T
+
+
+def _reduced_class_matrices(
+    mesh: BarMesh3D,
+    K: csr_matrix,
+    M: csr_matrix,
+    sx: int,
+    sy: int,
+    num_modes: int,
+    solver: str = 'auto'
+) -> Tuple[csr_matrix, np.ndarray, np.ndarray, bool]:
+    """
+    Project K and M onto one symmetry class.
+
+    Args:
+        solver: 'auto' (calibrated choice by class size), 'dense' or 'eigsh'
+
+    Returns:
+        Tuple of (T, K_class, M_class, use_sparse)
+    """
+    T = symmetry_basis_3d(mesh, sx, sy)
+    K_r = (T.T @ K @ T).tocsr()
+    M_r = (T.T @ M @ T).tocsr()
+    K_r = (K_r + K_r.T) / 2
+    M_r = (M_r + M_r.T) / 2
+
+    use_sparse = resolve_solver_3d(solver, K_r.shape[0], num_modes) != 'dense'
+    if not use_sparse:
+        K_r = K_r.toarray()
+        M_r = M_r.toarray()
+    return T, K_r, M_r, use_sparse
+
+
+def _solve_class_eigenproblem(
+    K_r,
+    M_r,
+    num_modes: int,
+    use_sparse: bool,
+    warm_start: Optional[ShiftInvertWarmStart] = None
+) -> Tuple[List[float], np.ndarray]:
+    """
+    Lowest elastic modes of one symmetry class.
+
+    A class holds at most 6 rigid body modes of its own, so the usual rigid
+    mode filtering applies.
+
+    Returns:
+        Tuple of (frequencies in Hz, mode_shapes array)
+    """
+    return solve_eigenvalue_3d_with_vectors(K_r, M_r, num_modes, use_sparse, warm_start)
+
+
+def compute_frequencies_3d_symmetric(
+    element_heights: List[float],
+    length: float,
+    width: float,
+    E: float,
+    rho: float,
+    nu: float,
+    num_modes: int,
+    ny: int = 2,
+    nz: int = 2,
+    classes: Tuple[Tuple[int, int], ...] = SYMMETRY_CLASSES,
+    solver: str = 'auto'
+) -> List[float]:
+    """
+    Compute natural frequencies with the symmetry-reduced 3D model.
+
+    The bar is mirror-symmetric about x = L/2 and y = b/2, so its spectrum
+    is the union of the spectra of the four symmetry classes, each solved
+    with about a quarter of the DOFs. Falls back to compute_frequencies_3d
+    for a profile that is not symmetric.
+
+    Args:
+        element_heights: Height of each element along bar length (m)
+        length: Bar length (m)
+        width: Bar width (m)
+        E: Young's modulus (Pa)
+        rho: Density (kg/m^3)
+        nu: Poisson's ratio
+        num_modes: Number of modes to extract
+        ny: Number of elements in width direction
+        nz: Number of elements in thickness direction
+        classes: Symmetry classes (sx, sy) to solve
+        solver: 'auto', 'dense' or 'eigsh' for every class; 'lobpcg' and
+            'reduced' work on the full mesh and are rejected
+
+    Returns:
+        List of natural frequencies in Hz (merged over classes)
+    """
+    if solver not in ('auto',) + SYMMETRIC_SOLVERS_3D:
+        raise ValueError(f"3D eigen-solver not supported by the symmetry-reduced model: {solver}")
+    if not is_mirror_symmetric(element_heights):
+        return compute_frequencies_3d(
+            element_heights, length, width, E, rho, nu, num_modes, ny, nz, solver=solver
+        )
+
+    mesh = get_bar_mesh_3d(len(element_heights), ny, nz)
+    mesh.update_geometry(length, width, element_heights)
+    K, M = mesh.assemble(E, nu, rho)
+
+    frequencies: List[float] = []
+    for sx, sy in classes:
+        _, K_r, M_r, use_sparse = _reduced_class_matrices(mesh, K, M, sx, sy, num_modes, solver)
+        class_freqs, _ = _solve_class_eigenproblem(
+            K_r, M_r, num_modes, use_sparse, mesh.warm_start((sx, sy))
+        )
+        frequencies.extend(class_freqs)
+
+    return sorted(frequencies)[:num_modes]
+
+
+def compute_frequencies_3d_symmetric_classified(
+    element_heights: List[float],
+    length: float,
+    width: float,
+    E: float,
+    rho: float,
+    nu: float,
+    num_modes: int = 10,
+    ny: int = 2,
+    nz: int = 2,
+    classes: Tuple[Tuple[int, int], ...] = SYMMETRY_CLASSES
+) -> Tuple[List[float], dict, np.ndarray]:
+    """
+    Symmetry-reduced counterpart of compute_frequencies_3d_classified.
+
+    Mode shapes of each class are expanded back to the full mesh before
+    Soares classification, so the result has the same form. Falls back to
+    the full model for a profile that is not symmetric.
+
+    Args:
+        element_heights: Height of each element along bar length (m)
+        length: Bar length (m)
+        width: Bar width (m)
+        E: Young's modulus (Pa)
+        rho: Density (kg/m^3)
+        nu: Poisson's ratio
+        num_modes: Number of modes to extract per class
+        ny: Number of elements in width direction
+        nz: Number of elements in thickness direction
+        classes: Symmetry classes (sx, sy) to solve
+
+    Returns:
+        Tuple of (all_frequencies, classified, nodes)
+    """
+    if not is_mirror_symmetric(element_heights):
+        return compute_frequencies_3d_classified(
+            element_heights, length, width, E, rho, nu, num_modes, ny, nz
+        )
+
+    mesh = get_bar_mesh_3d(len(element_heights), ny, nz)
+    mesh.update_geometry(length, width, element_heights)
+    K, M = mesh.assemble(E, nu, rho)
+    nodes = mesh.nodes.copy()
+
+    frequencies: List[float] = []
+    shapes: List[np.ndarray] = []
+    for sx, sy in classes:
+        T, K_r, M_r, use_sparse = _reduced_class_matrices(mesh, K, M, sx, sy, num_modes)
+        class_freqs, class_shapes = _solve_class_eigenproblem(
+            K_r, M_r, num_modes, use_sparse, mesh.warm_start((sx, sy))
+        )
+        frequencies.extend(class_freqs)
+        shapes.append(T @ class_shapes)
+
+    order = np.argsort(frequencies, kind='stable')
+    frequencies = [frequencies[i] for i in order]
+    mode_shapes = np.hstack(shapes)[:, order]
+
+    classified = classify_all_modes(frequencies, mode_shapes, nodes)
+
+    return frequencies, classified, nodes
+
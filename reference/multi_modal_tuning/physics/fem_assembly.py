@@ -10,58 +10,113 @@ import numpy as np
 from scipy import linalg
 import math
 
-from .timoshenko import compute_element_stiffness, compute_element_mass
+from .timoshenko import compute_element_matrices_batch
 
 
-def assemble_global_matrices(
-    element_heights: List[float],
-    le: float,
+# Half-bandwidth of the beam matrices: element e couples global DOFs 2e..2e+3
+BEAM_BANDWIDTH = 3
+
+# Rows per block of the blocked substitution in solve_generalized_eigenvalue_batch
+SUBSTITUTION_BLOCK_SIZE = 16
+
+
+def assemble_banded_matrices(
+    element_heights,
+    le,
     b: float,
     E: float,
     rho: float,
     nu: float
 ) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Assemble global stiffness and mass matrices from element matrices.
+    Assemble global stiffness and mass matrices in lower banded storage.
+
+    All element matrices are computed in one vectorized pass and scattered
+    directly into LAPACK lower band form (as used by scipy.linalg.eig_banded):
+    band[d, j] = A[j + d, j] for d = 0..BEAM_BANDWIDTH.
+
+    Leading dimensions of `element_heights` are treated as a batch, so a
+    (P, Ne) height matrix yields (P, 4, 2*Ne + 2) band arrays.
 
     Args:
-        element_heights: Height of each element (m)
-        le: Element length (m)
+        element_heights: Height of each element (m), shape (..., Ne)
+        le: Element length (m), scalar or array of shape (...) for batches
         b: Bar width (m)
         E: Young's modulus (Pa)
         rho: Density (kg/m^3)
         nu: Poisson's ratio
 
     Returns:
-        Tuple of (K_global, M_global) matrices
+        Tuple of (K_band, M_band) arrays of shape (..., 4, 2*Ne + 2)
     """
-    Ne = len(element_heights)
+    heights = np.asarray(element_heights, dtype=np.float64)
+    le = np.asarray(le, dtype=np.float64)[..., None]
+    Ke, Me = compute_element_matrices_batch(heights, le, b, E, rho, nu)
+
+    Ne = heights.shape[-1]
     num_dof = 2 * (Ne + 1)
+    band_shape = heights.shape[:-1] + (BEAM_BANDWIDTH + 1, num_dof)
 
-    K_global = np.zeros((num_dof, num_dof), dtype=np.float64)
-    M_global = np.zeros((num_dof, num_dof), dtype=np.float64)
+    K_band = np.zeros(band_shape, dtype=np.float64)
+    M_band = np.zeros(band_shape, dtype=np.float64)
 
-    G = E / (2.0 * (1.0 + nu))  # Shear modulus
+    # Element e maps local DOF j to global DOF 2e + j, so for a fixed local
+    # (i, j) pair every element writes to a distinct column of the band.
+    for i in range(4):
+        for j in range(i + 1):
+            cols = slice(j, j + 2 * Ne, 2)
+            K_band[..., i - j, cols] += Ke[..., i, j]
+            M_band[..., i - j, cols] += Me[..., i, j]
 
-    for e in range(Ne):
-        h = element_heights[e]
-        A = b * h  # Cross-sectional area
-        I = b * h**3 / 12.0  # Second moment of area
+    return K_band, M_band
 
-        Ke = compute_element_stiffness(le, E, I, G, A)
-        Me = compute_element_mass(le, rho, A, I, E, G)
 
-        # DOF mapping: element DOFs [0,1,2,3] -> global DOFs [2e, 2e+1, 2e+2, 2e+3]
-        dof_map = [2*e, 2*e+1, 2*(e+1), 2*(e+1)+1]
+def banded_to_dense(band: np.ndarray) -> np.ndarray:
+    """
+    Expand lower banded storage into full symmetric matrices.
 
-        for i in range(4):
-            for j in range(4):
-                gi = dof_map[i]
-                gj = dof_map[j]
-                K_global[gi, gj] += Ke[i, j]
-                M_global[gi, gj] += Me[i, j]
+    Args:
+        band: Array of shape (..., bandwidth + 1, n) in lower band form
 
-    return K_global, M_global
+    Returns:
+        Dense symmetric array of shape (..., n, n)
+    """
+    n = band.shape[-1]
+    dense = np.zeros(band.shape[:-2] + (n, n), dtype=band.dtype)
+    idx = np.arange(n)
+    for d in range(band.shape[-2]):
+        rows = idx[d:]
+        cols = idx[:n - d]
+        dense[..., rows, cols] = band[..., d, :n - d]
+        if d > 0:
+            dense[..., cols, rows] = band[..., d, :n - d]
+    return dense
+
+
+def assemble_global_matrices(
+    element_heights: List[float],
+    le: float,
+    b: float,
+    E: float,
+    rho: float,
+    nu: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assemble global stiffness and mass matrices from element matrices.
+
+    Args:
+        element_heights: Height of each element (m)
+        le: Element length (m)
+        b: Bar width (m)
+        E: Young's modulus (Pa)
+        rho: Density (kg/m^3)
+        nu: Poisson's ratio
+
+    Returns:
+        Tuple of (K_global, M_global) matrices
+    """
+    K_band, M_band = assemble_banded_matrices(element_heights, le, b, E, rho, nu)
+    return banded_to_dense(K_band), banded_to_dense(M_band)
 
 
 def solve_generalized_eigenvalue(
@@ -127,3 +182,359 @@ def solve_generalized_eigenvalue(
     frequencies = [math.sqrt(ev) / (2.0 * math.pi) for ev in elastic_modes[:num_modes]]
 
     return frequencies
+
+
+def solve_generalized_eigenvalue_subset(
+    K_band: np.ndarray,
+    M_band: np.ndarray,
+    num_modes: int,
+    num_rigid: int = 2
+) -> List[float]:
+    """
+    Solve K*phi = lambda*M*phi for only the lowest modes of a beam model.
+
+    K and M arrive in lower band storage but are expanded to dense matrices
+    and handed to LAPACK's dense generalized subset driver (?sygvx), which
+    extracts just the lowest num_modes + num_rigid eigenvalues: the
+    zero-frequency modes plus the requested elastic modes. The band is not
+    exploited by the solve itself; scipy does not expose the banded
+    generalized driver ?sbgvx.
+
+    Args:
+        K_band: Stiffness matrix in lower banded storage (bandwidth + 1, n)
+        M_band: Mass matrix in lower banded storage (bandwidth + 1, n)
+        num_modes: Number of elastic modes to extract
+        num_rigid: Number of zero-frequency modes to skip (2 for a free-free beam)
+
+    Returns:
+        List of natural frequencies in Hz
+    """
+    n = K_band.shape[-1]
+    num_request = min(num_modes + num_rigid, n)
+
+    # Add small regularization to M for numerical stability
+    M_band = M_band.copy()
+    M_band[0] += 1e-12 * np.maximum(np.abs(M_band[0]), 1e-20)
+
+    K = banded_to_dense(K_band)
+    M_reg = banded_to_dense(M_band)
+
+    try:
+        eigenvalues = linalg.eigh(
+            K, M_reg, subset_by_index=[0, num_request - 1],
+            eigvals_only=True, driver='gvx'
+        )
+    except linalg.LinAlgError:
+        # Fallback: add more regularization
+        M_reg[np.diag_indices(n)] += 1e-8
+        eigenvalues = linalg.eigh(
+            K, M_reg, subset_by_index=[0, num_request - 1],
+            eigvals_only=True, driver='gvx'
+        )
+
+    # Filter out rigid body modes (very small or negative eigenvalues)
+    threshold = 1.0  # omega^2 = 1 rad^2/s^2 -> f = 0.16 Hz
+    elastic_modes = [ev for ev in np.sort(eigenvalues) if ev > threshold]
+
+    return [math.sqrt(ev) / (2.0 * math.pi) for ev in elastic_modes[:num_modes]]
+
+
+def is_mirror_symmetric(element_heights, rtol: float = 1e-9) -> np.ndarray:
+    """
+    Check which height profiles are symmetric about the bar centre.
+
+    Args:
+        element_heights: Height of each element (m), shape (..., Ne)
+        rtol: Tolerance relative to the largest height of the profile
+
+    Returns:
+        Boolean array of shape (...)
+    """
+    h = np.asarray(element_heights, dtype=np.float64)
+    scale = np.max(np.abs(h), axis=-1)
+    return np.all(np.abs(h - h[..., ::-1]) <= rtol * scale[..., None], axis=-1)
+
+
+def assemble_half_banded_matrices(
+    element_heights,
+    le,
+    b: float,
+    E: float,
+    rho: float,
+    nu: float,
+    symmetric: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assemble the half-beam model of one symmetry class in lower band form.
+
+    For a profile symmetric about the bar centre, every mode is either
+    symmetric (w(L-x) = w(x), odd modes f1, f3, ...) or antisymmetric
+    (w(L-x) = -w(x), even modes f2, f4, ...). Each class is fully described
+    by the left half of the beam, so its stiffness and mass are those of
+    the left half with a centre condition:
+
+    - even Ne: the centre node is constrained (theta = 0 for symmetric,
+      w = 0 for antisymmetric). The constrained DOF is decoupled with zero
+      stiffness, so it shows up as one extra zero-frequency mode.
+    - odd Ne: the centre element is split; half of its energy for the
+      mirrored end displacements is added to the last node.
+
+    Both classes have Ne + 2 (even) or Ne + 1 (odd) DOFs, so they can be
+    stacked into one batched solve. Leading dimensions of `element_heights`
+    are treated as a batch like in assemble_banded_matrices.
+
+    Args:
+        element_heights: Height of each element over the full length (m), shape (..., Ne)
+        le: Element length (m), scalar or array of shape (...) for batches
+        b: Bar width (m)
+        E: Young's modulus (Pa)
+        rho: Density (kg/m^3)
+        nu: Poisson's ratio
+        symmetric: Symmetric (True) or antisymmetric (False) class
+
+    Returns:
+        Tuple of (K_band, M_band) arrays of shape (..., 4, n_half)
+    """
+    heights = np.asarray(element_heights, dtype=np.float64)
+    Ne = heights.shape[-1]
+    half = Ne // 2
+
+    K_band, M_band = assemble_banded_matrices(heights[..., :half], le, b, E, rho, nu)
+    centre = 2 * half  # w DOF of the last node of the half model
+
+    if Ne % 2 == 0:
+        # Decouple the constrained centre DOF; a unit mass keeps M positive definite
+        dof = centre + 1 if symmetric else centre
+        for band in (K_band, M_band):
+            for d in range(BEAM_BANDWIDTH + 1):
+                if dof - d >= 0:
+                    band[..., d, dof - d] = 0.0
+                band[..., d, dof] = 0.0
+        M_band[..., 0, dof] = 1.0
+    else:
+        # Centre element DOFs [w1, theta1, w2, theta2] in terms of the last node's (w, theta)
+        sign = 1.0 if symmetric else -1.0
+        T = np.array([[1.0, 0.0], [0.0, 1.0], [sign, 0.0], [0.0, -sign]])
+        le = np.asarray(le, dtype=np.float64)
+        Ke, Me = compute_element_matrices_batch(heights[..., half], le, b, E, rho, nu)
+        for band, Ae in ((K_band, Ke), (M_band, Me)):
+            A_half = 0.5 * (T.T @ Ae @ T)
+            band[..., 0, centre] += A_half[..., 0, 0]
+            band[..., 1, centre] += A_half[..., 1, 0]
+            band[..., 0, centre + 1] += A_half[..., 1, 1]
+
+    return K_band, M_band
+
+
+def solve_half_beam(
+    element_heights,
+    le: float,
+    b: float,
+    E: float,
+    rho: float,
+    nu: float,
+    num_modes: int
+) -> Tuple[List[float], List[bool]]:
+    """
+    Solve a mirror-symmetric beam as two half-beam problems.
+
+    The symmetric and antisymmetric classes are solved separately with the
+    banded subset driver and their spectra are interleaved. Each class has
+    one rigid body mode (translation / rotation); for even Ne it also has
+    the zero-frequency constrained centre DOF, removed by the same filter.
+
+    Args:
+        element_heights: Symmetric height profile over the full length (m)
+        le: Element length (m)
+        b: Bar width (m)
+        E: Young's modulus (Pa)
+        rho: Density (kg/m^3)
+        nu: Poisson's ratio
+        num_modes: Number of elastic modes to extract
+
+    Returns:
+        Tuple of (frequencies in Hz, is_symmetric flag for each mode)
+    """
+    modes = []
+    for symmetric in (True, False):
+        K_band, M_band = assemble_half_banded_matrices(element_heights, le, b, E, rho, nu, symmetric)
+        class_freqs = solve_generalized_eigenvalue_subset(K_band, M_band, num_modes, num_rigid=2)
+        modes.extend((f, symmetric) for f in class_freqs)
+
+    modes.sort(key=lambda mode: mode[0])
+    modes = modes[:num_modes]
+    return [f for f, _ in modes], [symmetric for _, symmetric in modes]
+
+
+def solve_half_beam_batch(
+    element_heights: np.ndarray,
+    le,
+    b: float,
+    E: float,
+    rho: float,
+    nu: float,
+    num_modes: int
+) -> np.ndarray:
+    """
+    Batched counterpart of solve_half_beam for a (P, Ne) stack of symmetric profiles.
+
+    Both symmetry classes of all profiles are stacked into a single
+    (2P, 4, n_half) problem for solve_generalized_eigenvalue_batch, which
+    then works on matrices of half the size.
+
+    Args:
+        element_heights: Symmetric height profiles (m), shape (P, Ne)
+        le: Element length (m), scalar or array of shape (P,)
+        b: Bar width (m)
+        E: Young's modulus (Pa)
+        rho: Density (kg/m^3)
+        nu: Poisson's ratio
+        num_modes: Number of elastic modes to extract
+
+    Returns:
+        (P, num_modes) array of frequencies in Hz (NaN where the solve failed)
+    """
+    heights = np.asarray(element_heights, dtype=np.float64)
+    num_profiles = heights.shape[0]
+
+    bands = [
+        assemble_half_banded_matrices(heights, le, b, E, rho, nu, symmetric)
+        for symmetric in (True, False)
+    ]
+    K_band = np.concatenate([K for K, _ in bands])
+    M_band = np.concatenate([M for _, M in bands])
+
+    frequencies = solve_generalized_eigenvalue_batch(K_band, M_band, num_modes)
+
+    # Interleave the two classes of each profile (NaN sorts last)
+    merged = np.sort(
+        np.concatenate([frequencies[:num_profiles], frequencies[num_profiles:]], axis=-1),
+        axis=-1
+    )
+    return merged[:, :num_modes]
+
+
+def _cholesky_batch(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cholesky factors of a stack of SPD matrices with one batched LAPACK call.
+
+    numpy rejects the whole stack if any matrix is not positive definite;
+    only then are the matrices factored one by one to find the failures.
+
+    Args:
+        A: Array of shape (P, n, n)
+
+    Returns:
+        Tuple of (lower factors of shape (P, n, n), boolean mask of the
+        matrices that failed; their factor is the identity)
+    """
+    failed = np.zeros(A.shape[0], dtype=bool)
+    try:
+        return np.linalg.cholesky(A), failed
+    except np.linalg.LinAlgError:
+        pass
+
+    L = np.empty_like(A)
+    for p in range(A.shape[0]):
+        try:
+            L[p] = np.linalg.cholesky(A[p])
+        except np.linalg.LinAlgError:
+            L[p] = np.eye(A.shape[-1])
+            failed[p] = True
+    return L, failed
+
+
+def _forward_substitute_blocked(
+    L: np.ndarray,
+    B: np.ndarray,
+    block_inverses: List[np.ndarray],
+    bandwidth: int
+) -> np.ndarray:
+    """
+    Solve L @ X = B for a stack of banded lower-triangular factors, block by block.
+
+    Each block of rows is solved with the precomputed inverse of its
+    diagonal block. Because L is banded, only the first `bandwidth` rows
+    of a block depend on the previous block, through a bandwidth x
+    bandwidth corner of L.
+
+    Args:
+        L: Dense lower factors of shape (P, n, n) with the given bandwidth
+        B: Right-hand sides of shape (P, n, m)
+        block_inverses: Inverses of the diagonal blocks of L, in order
+        bandwidth: Half-bandwidth of L
+
+    Returns:
+        Solution X of shape (P, n, m)
+    """
+    X = B.copy()
+    start = 0
+    for block_inverse in block_inverses:
+        stop = start + block_inverse.shape[-1]
+        if start > 0:
+            coupled = slice(start, min(start + bandwidth, stop))
+            X[:, coupled] -= L[:, coupled, start - bandwidth:start] @ X[:, start - bandwidth:start]
+        X[:, start:stop] = block_inverse @ X[:, start:stop]
+        start = stop
+    return X
+
+
+def solve_generalized_eigenvalue_batch(
+    K_band: np.ndarray,
+    M_band: np.ndarray,
+    num_modes: int
+) -> np.ndarray:
+    """
+    Solve K*phi = lambda*M*phi for a whole stack of beam models at once.
+
+    Every step works on the whole stack with batched LAPACK/BLAS calls: M
+    is factored with numpy.linalg.cholesky, K is reduced to standard form
+    L^{-1} K L^{-T} by blocked substitution (batched inverses of the
+    diagonal blocks of L and matrix products; the band of L limits the
+    coupling between blocks), and all reduced problems are diagonalized
+    with one numpy.linalg.eigvalsh call. Python only loops over blocks of
+    SUBSTITUTION_BLOCK_SIZE rows, not over individuals, DOFs or band offsets.
+
+    Args:
+        K_band: Stiffness matrices in lower band form, shape (P, w + 1, n)
+        M_band: Mass matrices in lower band form, shape (P, w + 1, n)
+        num_modes: Number of elastic modes to extract
+
+    Returns:
+        (P, num_modes) array of natural frequencies in Hz. Rows whose
+        factorization failed or that have too few elastic modes contain NaN.
+    """
+    n = K_band.shape[-1]
+
+    # Add small regularization to M for numerical stability
+    M_band = M_band.copy()
+    M_band[..., 0, :] += 1e-12 * np.maximum(np.abs(M_band[..., 0, :]), 1e-20)
+
+    bandwidth = M_band.shape[-2] - 1
+    L, failed = _cholesky_batch(banded_to_dense(M_band))
+    block_inverses = [
+        np.linalg.inv(L[:, i:i + SUBSTITUTION_BLOCK_SIZE, i:i + SUBSTITUTION_BLOCK_SIZE])
+        for i in range(0, n, SUBSTITUTION_BLOCK_SIZE)
+    ]
+    Y = _forward_substitute_blocked(L, banded_to_dense(K_band), block_inverses, bandwidth)
+    K_tilde = _forward_substitute_blocked(L, np.swapaxes(Y, -1, -2), block_inverses, bandwidth)
+
+    # Symmetrize to remove numerical errors
+    K_tilde = (K_tilde + np.swapaxes(K_tilde, -1, -2)) / 2
+
+    # Rows that failed to factor are solved as zero matrices and masked below
+    failed |= ~np.all(np.isfinite(K_tilde), axis=(-2, -1))
+    K_tilde[failed] = 0.0
+    eigenvalues = np.linalg.eigvalsh(K_tilde)
+
+    # Filter out rigid body modes: skip everything at or below the threshold
+    threshold = 1.0  # omega^2 = 1 rad^2/s^2 -> f = 0.16 Hz
+    first_elastic = np.sum(eigenvalues <= threshold, axis=-1)
+    cols = first_elastic[..., None] + np.arange(num_modes)
+    valid = cols < n
+    elastic = np.take_along_axis(eigenvalues, np.minimum(cols, n - 1), axis=-1)
+
+    frequencies = np.sqrt(np.abs(elastic)) / (2.0 * math.pi)
+    frequencies[~valid] = np.nan
+    frequencies[failed] = np.nan
+    return frequencies
@@ -6,15 +6,28 @@ using the FEM model. Supports both 2D Timoshenko beam and 3D solid
 element analysis.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union, Literal
+from dataclasses import dataclass
 import math
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import os
+import numpy as np
 
 from ..types import BarParameters, Material, AnalysisMode
-from .bar_profile import genes_to_cuts
-from .fem_assembly import assemble_global_matrices, solve_generalized_eigenvalue
-from .fem_3d import compute_frequencies_3d
+from .bar_profile import genes_to_element_heights
+from .fem_assembly import (
+    assemble_banded_matrices,
+    solve_generalized_eigenvalue_batch,
+    solve_generalized_eigenvalue_subset,
+    is_mirror_symmetric,
+    solve_half_beam,
+    solve_half_beam_batch,
+)
+from .fem_3d import (
+    compute_frequencies_3d, compute_frequencies_3d_symmetric, EIGEN_SOLVERS_3D, SYMMETRIC_SOLVERS_3D
+)
+from .frequency_cache import FrequencyCache, get_frequency_cache
+from .solver_selection import get_solver_calibration
 
 
 def compute_frequencies(
@@ -27,7 +40,8 @@ def compute_frequencies(
     num_modes: int,
     analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D,
     ny: int = 2,
-    nz: int = 2
+    nz: int = 2,
+    solver_3d: str = 'auto'
 ) -> List[float]:
     """
     Compute natural frequencies for a bar with given element heights.
@@ -40,9 +54,11 @@ def compute_frequencies(
         rho: Density (kg/m^3)
         nu: Poisson's ratio
         num_modes: Number of modes to extract
-        analysis_mode: BEAM_2D (fast) or SOLID_3D (accurate)
+        analysis_mode: BEAM_2D (fast), SOLID_3D (accurate) or SOLID_3D_SYMMETRIC
         ny: Number of elements in width direction (3D only)
         nz: Number of elements in thickness direction (3D only)
+        solver_3d: 3D eigen-solver, 'auto', 'dense', 'eigsh', 'lobpcg' or 'reduced'
+            (SOLID_3D); 'auto', 'dense' or 'eigsh' (SOLID_3D_SYMMETRIC)
 
     Returns:
         List of natural frequencies in Hz
@@ -51,12 +67,21 @@ def compute_frequencies(
         # 3D solid element analysis
         length = le * len(element_heights)
         return compute_frequencies_3d(
-            element_heights, length, b, E, rho, nu, num_modes, ny, nz
+            element_heights, length, b, E, rho, nu, num_modes, ny, nz, solver=solver_3d
+        )
+    elif analysis_mode == AnalysisMode.SOLID_3D_SYMMETRIC:
+        # 3D solid analysis split into mirror-symmetry classes
+        length = le * len(element_heights)
+        return compute_frequencies_3d_symmetric(
+            element_heights, length, b, E, rho, nu, num_modes, ny, nz, solver=solver_3d
         )
     else:
-        # 2D Timoshenko beam analysis (default)
-        K, M = assemble_global_matrices(element_heights, le, b, E, rho, nu)
-        return solve_generalized_eigenvalue(K, M, num_modes)
+        # 2D Timoshenko beam analysis (default); symmetric profiles use the half model
+        if is_mirror_symmetric(element_heights):
+            frequencies, _ = solve_half_beam(element_heights, le, b, E, rho, nu, num_modes)
+            return frequencies
+        K_band, M_band = assemble_banded_matrices(element_heights, le, b, E, rho, nu)
+        return solve_generalized_eigenvalue_subset(K_band, M_band, num_modes)
 
 
 def compute_frequencies_from_genes(
@@ -68,11 +93,14 @@ def compute_frequencies_from_genes(
     num_cuts: int = 0,
     analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D,
     ny: int = 2,
-    nz: int = 2
+    nz: int = 2,
+    use_cache: bool = True,
+    solver_3d: str = 'auto'
 ) -> List[float]:
     """
     Compute frequencies directly from cut parameters (genes).
     Combines profile generation and frequency computation.
+    Results are memoized in the shared frequency cache.
 
     Args:
         genes: Flat array [lambda_1, h_1, lambda_2, h_2, ..., length_adjust?]
@@ -81,45 +109,34 @@ def compute_frequencies_from_genes(
         num_modes: Number of modes to extract
         num_elements: Number of finite elements
         num_cuts: Number of cuts (for determining length adjustment gene)
-        analysis_mode: BEAM_2D (fast) or SOLID_3D (accurate)
+        analysis_mode: BEAM_2D (fast), SOLID_3D (accurate) or SOLID_3D_SYMMETRIC
         ny: Number of elements in width direction (3D only)
         nz: Number of elements in thickness direction (3D only)
+        use_cache: Look up and store the result in the shared cache
+        solver_3d: 3D eigen-solver, 'auto', 'dense', 'eigsh', 'lobpcg' or 'reduced'
+            (SOLID_3D); 'auto', 'dense' or 'eigsh' (SOLID_3D_SYMMETRIC)
 
     Returns:
         List of natural frequencies in Hz
     """
-    # Handle length adjustment if present
-    bar_length = bar.L
-    if num_cuts > 0 and len(genes) > num_cuts * 2:
-        length_adjust = genes[num_cuts * 2]
-        bar_length = bar.L - 2 * length_adjust
-
-    # Parse genes into cuts
-    cut_genes = genes[:num_cuts * 2] if num_cuts > 0 else genes
-    cuts = genes_to_cuts(cut_genes)
-
-    # Sort by lambda descending (largest first)
-    cuts = sorted(cuts, key=lambda c: c.lambda_, reverse=True)
+    cache = get_frequency_cache() if use_cache else None
+    if cache is not None:
+        key = cache.make_key(
+            genes, bar, material, num_modes, num_elements, num_cuts, analysis_mode, ny, nz,
+            solver_3d
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return list(cached)
 
     # Generate element heights
-    le = bar_length / num_elements
-    center_x = bar_length / 2
-
-    element_heights: List[float] = []
-    for e in range(num_elements):
-        x_mid = (e + 0.5) * le
-        dist_from_center = abs(x_mid - center_x)
-
-        # Find all cuts that contain this point, return the innermost one's height
-        innermost_h = bar.h0
-        for cut in cuts:
-            if cut.lambda_ > 0 and dist_from_center <= cut.lambda_:
-                innermost_h = cut.h
-
-        element_heights.append(innermost_h)
+    element_heights, bar_length = genes_to_element_heights(
+        genes, bar.L, bar.h0, num_elements, num_cuts
+    )
+    le = float(bar_length) / num_elements
 
-    return compute_frequencies(
-        element_heights,
+    frequencies = compute_frequencies(
+        element_heights.tolist(),
         le,
         bar.b,
         material.E,
@@ -128,95 +145,358 @@ def compute_frequencies_from_genes(
         num_modes,
         analysis_mode,
         ny,
-        nz
+        nz,
+        solver_3d
     )
 
+    if cache is not None:
+        cache.put(key, frequencies)
+    return frequencies
 
-def _compute_single_fitness(
-    genes: List[float],
-    bar_length: float,
-    bar_width: float,
-    h0: float,
+
+def batch_compute_frequencies_2d(
+    genes_array,
+    bar: BarParameters,
+    material: Material,
+    num_modes: int,
     num_elements: int,
-    E: float,
-    rho: float,
-    nu: float,
+    num_cuts: int = 0,
+    chunk_size: int = 32
+) -> np.ndarray:
+    """
+    Compute 2D beam frequencies for many individuals with batched linear algebra.
+
+    Genes are turned into a (P, Ne) height matrix in one step, stacked banded
+    K/M matrices are assembled for the whole chunk and solved with a single
+    batched eigenvalue call. Symmetric profiles (all that the gene encoding
+    produces) are solved as two half-beam problems; any others fall back
+    to the full model. Chunks bound the memory held by the stacked
+    (chunk, n, n) reduced matrices.
+
+    Args:
+        genes_array: (P, num_genes) gene matrix or list of gene lists
+        bar: Bar parameters
+        material: Material properties
+        num_modes: Number of modes to extract
+        num_elements: Number of finite elements
+        num_cuts: Number of cuts (for determining length adjustment gene)
+        chunk_size: Maximum number of individuals solved per batched call
+
+    Returns:
+        (P, num_modes) array of frequencies in Hz (NaN where the solve failed)
+    """
+    genes_matrix = np.asarray(genes_array, dtype=np.float64)
+    num_individuals = genes_matrix.shape[0]
+    frequencies = np.full((num_individuals, num_modes), np.nan)
+
+    for start in range(0, num_individuals, max(1, chunk_size)):
+        chunk = genes_matrix[start:start + chunk_size]
+        heights, lengths = genes_to_element_heights(
+            chunk, bar.L, bar.h0, num_elements, num_cuts
+        )
+        le = lengths / num_elements
+        symmetric = is_mirror_symmetric(heights)
+        chunk_freqs = frequencies[start:start + len(chunk)]
+
+        if np.any(symmetric):
+            chunk_freqs[symmetric] = solve_half_beam_batch(
+                heights[symmetric], le[symmetric], bar.b,
+                material.E, material.rho, material.nu, num_modes
+            )
+        if not np.all(symmetric):
+            K_band, M_band = assemble_banded_matrices(
+                heights[~symmetric], le[~symmetric], bar.b, material.E, material.rho, material.nu
+            )
+            chunk_freqs[~symmetric] = solve_generalized_eigenvalue_batch(
+                K_band, M_band, num_modes
+            )
+
+    return frequencies
+
+
+def _fitness_from_frequencies(
+    frequencies: np.ndarray,
     target_frequencies: List[float],
-    f1_priority: float,
-    num_cuts: int,
-    analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D,
-    ny: int = 2,
-    nz: int = 2
-) -> float:
+    f1_priority: float
+) -> np.ndarray:
     """
-    Compute fitness for a single individual.
-    Internal function used by batch_compute_fitness.
+    Weighted tuning error for a (P, num_modes) frequency matrix.
+    Rows with missing modes get inf.
     """
-    # Handle length adjustment if present
-    effective_length = bar_length
-    if num_cuts > 0 and len(genes) > num_cuts * 2:
-        length_adjust = genes[num_cuts * 2]
-        effective_length = bar_length - 2 * length_adjust
+    targets = np.asarray(target_frequencies, dtype=np.float64)
+    weights = np.ones(len(targets))
+    weights[0] = f1_priority
+    total_weight = weights.sum()
+    if total_weight <= 0:
+        return np.full(len(frequencies), np.inf)
+
+    rel_error = (frequencies - targets) / targets
+    fitness = 100.0 * np.sum(weights * rel_error * rel_error, axis=1) / total_weight
+    fitness[~np.isfinite(fitness)] = np.inf
+    return fitness
+
+
+@dataclass(frozen=True)
+class FitnessProblem:
+    """Read-only problem state shared by every fitness evaluation of a run."""
+    bar: BarParameters
+    material: Material
+    target_frequencies: Tuple[float, ...]
+    num_elements: int
+    f1_priority: float = 1.0
+    num_cuts: int = 1
+    analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D
+    ny: int = 2
+    nz: int = 2
+    solver_3d: str = 'auto'
+
+    def __post_init__(self):
+        # The reduced-basis surrogate refreshes on nearly every EA candidate and
+        # is slower than warm eigsh there; it stays a compute_frequencies_3d option
+        if self.solver_3d != 'auto' and self.solver_3d not in EIGEN_SOLVERS_3D:
+            raise ValueError(f"Unknown 3D solver for fitness evaluation: {self.solver_3d}")
+        if (self.analysis_mode == AnalysisMode.SOLID_3D_SYMMETRIC
+                and self.solver_3d not in ('auto',) + SYMMETRIC_SOLVERS_3D):
+            raise ValueError(f"3D solver not supported by the symmetry-reduced model: {self.solver_3d}")
+
+
+def _compute_problem_frequencies(problem: FitnessProblem, genes) -> np.ndarray:
+    """Frequencies of one individual, NaN-padded to the number of targets."""
+    num_modes = len(problem.target_frequencies)
+    row = np.full(num_modes, np.nan)
+    try:
+        frequencies = compute_frequencies_from_genes(
+            list(genes),
+            problem.bar,
+            problem.material,
+            num_modes,
+            problem.num_elements,
+            problem.num_cuts,
+            problem.analysis_mode,
+            problem.ny,
+            problem.nz,
+            use_cache=False,
+            solver_3d=problem.solver_3d
+        )
+    except Exception:
+        return row
+    count = min(len(frequencies), num_modes)
+    row[:count] = frequencies[:count]
+    return row
+
+
+def _compute_frequencies_serial(problem: FitnessProblem, genes_array) -> np.ndarray:
+    """(P, num_modes) frequencies for a batch of genes in the calling thread."""
+    num_modes = len(problem.target_frequencies)
+    if len(genes_array) == 0:
+        return np.empty((0, num_modes))
+
+    # 2D beam models are evaluated as one batched linear-algebra problem
+    # (gene vectors must share a length to be stacked into a matrix)
+    if problem.analysis_mode == AnalysisMode.BEAM_2D and len({len(g) for g in genes_array}) == 1:
+        return batch_compute_frequencies_2d(
+            genes_array, problem.bar, problem.material, num_modes,
+            problem.num_elements, problem.num_cuts
+        )
 
-    # Parse genes into cuts
-    cut_genes = genes[:num_cuts * 2] if num_cuts > 0 else genes
-    cuts = genes_to_cuts(cut_genes)
-    cuts = sorted(cuts, key=lambda c: c.lambda_, reverse=True)
+    return np.array([_compute_problem_frequencies(problem, genes) for genes in genes_array])
 
-    # Generate element heights
-    le = effective_length / num_elements
-    center_x = effective_length / 2
 
-    element_heights: List[float] = []
-    for e in range(num_elements):
-        x_mid = (e + 0.5) * le
-        dist_from_center = abs(x_mid - center_x)
+def _compute_frequencies_chunk(problem: FitnessProblem, genes_chunk) -> np.ndarray:
+    """Process pool task: frequencies for a chunk of genes of one problem."""
+    return _compute_frequencies_serial(problem, genes_chunk)
 
-        innermost_h = h0
-        for cut in cuts:
-            if cut.lambda_ > 0 and dist_from_center <= cut.lambda_:
-                innermost_h = cut.h
 
-        element_heights.append(innermost_h)
+def _resolve_max_workers(max_workers: int) -> int:
+    """Resolve a max_workers setting (0 = auto) to a worker count."""
+    return max_workers if max_workers > 0 else (os.cpu_count() or 4)
 
-    # Compute frequencies
-    try:
-        frequencies = compute_frequencies(
-            element_heights,
-            le,
-            bar_width,
-            E,
-            rho,
-            nu,
-            len(target_frequencies),
-            analysis_mode,
-            ny,
-            nz
-        )
-    except Exception:
-        return float('inf')
-
-    # Compute weighted tuning error
-    num_modes = len(target_frequencies)
-    if len(frequencies) < num_modes:
-        return float('inf')
-
-    weighted_sum_sq_error = 0.0
-    total_weight = 0.0
-    for m in range(num_modes):
-        weight = f1_priority if m == 0 else 1.0
-        rel_error = (frequencies[m] - target_frequencies[m]) / target_frequencies[m]
-        weighted_sum_sq_error += weight * rel_error * rel_error
-        total_weight += weight
-
-    if total_weight > 0:
-        return 100.0 * weighted_sum_sq_error / total_weight
-    else:
-        return float('inf')
+
+class Evaluator:
+    """
+    Pool-lifetime fitness evaluator.
+
+    Owns the worker pool used by batch_compute_fitness so that it can be
+    reused across generations, optimization runs and notes instead of being
+    created and torn down for every population batch. The pool is started
+    lazily on first use and released by close() or on leaving a with block:
+
+        with Evaluator('process') as evaluator:
+            run_evolutionary_algorithm(EAConfig(..., evaluator=evaluator))
+
+    Problem state (bar, material, targets, FEM settings) is passed per
+    batch, so one evaluator serves any number of different problems.
+    Designs already in the frequency cache are not sent to the workers.
+    """
+
+    def __init__(
+        self,
+        executor: Literal['thread', 'process', 'serial'] = 'thread',
+        max_workers: int = 0,
+        cache: Optional[FrequencyCache] = None,
+        use_cache: bool = True
+    ):
+        """
+        Args:
+            executor: 'thread', 'process' or 'serial'
+            max_workers: Number of worker threads/processes (0 = auto)
+            cache: Frequency cache to use (default: the shared cache)
+            use_cache: Set to False to always solve every individual
+        """
+        if executor not in ('thread', 'process', 'serial'):
+            raise ValueError(f"Unknown executor: {executor}")
+        self.executor = executor
+        self.max_workers = _resolve_max_workers(max_workers)
+        self.cache = (cache or get_frequency_cache()) if use_cache else None
+        self._pool = None
+
+    def __enter__(self) -> 'Evaluator':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool (a later evaluate() starts a new one)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            if self.executor == 'process':
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    def evaluate(self, problem: FitnessProblem, genes_array) -> List[float]:
+        """
+        Evaluate fitness for a batch of genes.
+
+        Args:
+            problem: Problem state for this batch
+            genes_array: List of gene arrays, one per individual
+
+        Returns:
+            List of fitness values for each individual
+        """
+        fitness_values, _ = self.evaluate_with_frequencies(problem, genes_array)
+        return fitness_values
+
+    def evaluate_with_frequencies(
+        self,
+        problem: FitnessProblem,
+        genes_array
+    ) -> Tuple[List[float], np.ndarray]:
+        """
+        Evaluate fitness for a batch of genes, keeping the frequency vectors.
+
+        Args:
+            problem: Problem state for this batch
+            genes_array: List of gene arrays, one per individual
+
+        Returns:
+            Tuple of (fitness values, (P, num_modes) frequencies in Hz with
+            NaN where the solve failed)
+        """
+        num_modes = len(problem.target_frequencies)
+        frequencies = np.full((len(genes_array), num_modes), np.nan)
+
+        # Cache lookup; identical designs within the batch are solved once
+        pending = {}
+        for idx, genes in enumerate(genes_array):
+            key = idx
+            if self.cache is not None:
+                key = self.cache.make_key(
+                    genes, problem.bar, problem.material, num_modes, problem.num_elements,
+                    problem.num_cuts, problem.analysis_mode, problem.ny, problem.nz,
+                    problem.solver_3d
+                )
+                if key not in pending:
+                    cached = self.cache.get(key)
+                    if cached is not None:
+                        frequencies[idx] = cached
+                        continue
+            pending.setdefault(key, []).append(idx)
+
+        if pending:
+            first_indices = [indices[0] for indices in pending.values()]
+            solved = self.compute_frequencies(problem, [genes_array[i] for i in first_indices])
+            for (key, indices), row in zip(pending.items(), solved):
+                frequencies[indices] = row
+                if self.cache is not None and np.all(np.isfinite(row)):
+                    self.cache.put(key, row)
+
+        fitness_values = _fitness_from_frequencies(
+            frequencies, list(problem.target_frequencies), problem.f1_priority
+        ).tolist()
+        return fitness_values, frequencies
+
+    def compute_frequencies(self, problem: FitnessProblem, genes_array) -> np.ndarray:
+        """
+        Solve frequencies for a batch of genes on the worker pool (no cache).
+
+        - 'serial': everything in the calling thread
+        - 'thread': 3D individuals on the thread pool (2D runs batched in-line)
+        - 'process': gene chunks on the process pool, one chunk per worker
+
+        Args:
+            problem: Problem state for this batch
+            genes_array: List of gene arrays, one per individual
+
+        Returns:
+            (P, num_modes) array of frequencies in Hz (NaN where the solve failed)
+        """
+        num_modes = len(problem.target_frequencies)
+        if len(genes_array) == 0:
+            return np.empty((0, num_modes))
+
+        uniform_genes = len({len(g) for g in genes_array}) == 1
+
+        if self.executor == 'process':
+            # Load the calibration once here, before the workers fork
+            if problem.analysis_mode != AnalysisMode.BEAM_2D and problem.solver_3d == 'auto':
+                get_solver_calibration()
+            num_chunks = min(self.max_workers, len(genes_array))
+            bounds = np.linspace(0, len(genes_array), num_chunks + 1).astype(int)
+            # Uniform genes travel as compact float64 matrices
+            chunks = [
+                np.asarray(genes_array[lo:hi], dtype=np.float64) if uniform_genes
+                else [list(g) for g in genes_array[lo:hi]]
+                for lo, hi in zip(bounds[:-1], bounds[1:])
+            ]
+            results = self._get_pool().map(
+                _compute_frequencies_chunk, [problem] * num_chunks, chunks
+            )
+            return np.concatenate(list(results))
+
+        if self.executor == 'serial' or (problem.analysis_mode == AnalysisMode.BEAM_2D and uniform_genes):
+            return _compute_frequencies_serial(problem, genes_array)
+
+        # Use multithreading for parallel frequency computation
+        frequencies = np.full((len(genes_array), num_modes), np.nan)
+        thread_pool = self._get_pool()
+
+        # Submit all tasks
+        future_to_idx = {
+            thread_pool.submit(_compute_problem_frequencies, problem, genes): idx
+            for idx, genes in enumerate(genes_array)
+        }
+
+        # Collect results
+        for future in as_completed(future_to_idx):
+            idx = future_to_idx[future]
+            try:
+                frequencies[idx] = future.result()
+            except Exception:
+                pass
+
+        return frequencies
 
 
 def batch_compute_fitness(
-    genes_array: List[List[float]],
+    genes_array: Union[List[List[float]], np.ndarray],
     bar: BarParameters,
     material: Material,
     target_frequencies: List[float],
@@ -226,62 +506,67 @@ def batch_compute_fitness(
     max_workers: int = 0,
     analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D,
     ny: int = 2,
-    nz: int = 2
-) -> List[float]:
+    nz: int = 2,
+    executor: Literal['thread', 'process', 'serial'] = 'thread',
+    evaluator: Optional[Evaluator] = None,
+    return_frequencies: bool = False,
+    solver_3d: str = 'auto'
+) -> Union[List[float], Tuple[List[float], np.ndarray]]:
     """
-    Batch compute fitness for entire population using multithreading.
+    Batch compute fitness for entire population.
+
+    2D beam analysis is evaluated with the batched frequency engine
+    (batch_compute_frequencies_2d). The batch is spread over the worker
+    pool of the given Evaluator; without one, a temporary Evaluator is
+    created from executor and max_workers for this call only.
 
     Args:
-        genes_array: List of gene arrays, one per individual
+        genes_array: List of gene arrays, one per individual, or (P, G) gene matrix
         bar: Bar parameters
         material: Material properties
         target_frequencies: Target frequencies (Hz)
         num_elements: Number of FEM elements
         f1_priority: Weight multiplier for f1 (>1 prioritizes f1)
         num_cuts: Number of cuts per individual
-        max_workers: Maximum number of worker threads (0 = auto)
-        analysis_mode: BEAM_2D (fast) or SOLID_3D (accurate)
+        max_workers: Maximum number of worker threads/processes (0 = auto)
+        analysis_mode: BEAM_2D (fast), SOLID_3D (accurate) or SOLID_3D_SYMMETRIC
         ny: Number of elements in width direction (3D only)
         nz: Number of elements in thickness direction (3D only)
+        executor: 'thread', 'process' or 'serial' (ignored with an evaluator)
+        evaluator: Persistent Evaluator whose pool is reused
+        return_frequencies: Also return the computed frequency vectors
+        solver_3d: 3D eigen-solver, 'auto', 'dense', 'eigsh' or 'lobpcg' (SOLID_3D);
+            'auto', 'dense' or 'eigsh' (SOLID_3D_SYMMETRIC)
 
     Returns:
-        List of fitness values for each individual
+        List of fitness values for each individual, or a tuple of
+        (fitness values, (P, num_modes) frequencies with NaN where the
+        solve failed) if return_frequencies is set
     """
-    if max_workers <= 0:
-        max_workers = min(os.cpu_count() or 4, len(genes_array))
-
-    # Use multithreading for parallel fitness evaluation
-    fitness_values = [float('inf')] * len(genes_array)
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_idx = {
-            executor.submit(
-                _compute_single_fitness,
-                genes,
-                bar.L,
-                bar.b,
-                bar.h0,
-                num_elements,
-                material.E,
-                material.rho,
-                material.nu,
-                target_frequencies,
-                f1_priority,
-                num_cuts,
-                analysis_mode,
-                ny,
-                nz
-            ): idx
-            for idx, genes in enumerate(genes_array)
-        }
+    if len(genes_array) == 0:
+        return ([], np.empty((0, len(target_frequencies)))) if return_frequencies else []
+
+    problem = FitnessProblem(
+        bar=bar,
+        material=material,
+        target_frequencies=tuple(target_frequencies),
+        num_elements=num_elements,
+        f1_priority=f1_priority,
+        num_cuts=num_cuts,
+        analysis_mode=analysis_mode,
+        ny=ny,
+        nz=nz,
+        solver_3d=solver_3d
+    )
 
-        # Collect results
-        for future in as_completed(future_to_idx):
-            idx = future_to_idx[future]
-            try:
-                fitness_values[idx] = future.result()
-            except Exception:
-                fitness_values[idx] = float('inf')
+    if evaluator is not None:
+        fitness_values, frequencies = evaluator.evaluate_with_frequencies(problem, genes_array)
+    else:
+        with Evaluator(executor, max_workers) as temporary_evaluator:
+            fitness_values, frequencies = temporary_evaluator.evaluate_with_frequencies(
+                problem, genes_array
+            )
 
+    if return_frequencies:
+        return fitness_values, frequencies
     return fitness_values
@@ -0,0 +1,136 @@
+"""
+Frequency Cache Module
+
+LRU cache of computed natural frequencies keyed on quantized genes and the
+FEM settings they were solved with. Elites, re-evaluated parents and
+mutants clamped to the same bounds all map to the same key, so each
+distinct design is solved only once.
+"""
+
+from typing import Optional, Sequence, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+import numpy as np
+
+from ..types import BarParameters, Material, AnalysisMode
+
+# Genes closer than this (m) are treated as the same design
+GENE_TOLERANCE = 1e-12
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+@dataclass
+class CacheStats:
+    """Frequency cache statistics."""
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+class FrequencyCache:
+    """Thread-safe LRU cache of frequency vectors."""
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE, gene_tolerance: float = GENE_TOLERANCE):
+        """
+        Args:
+            max_size: Maximum number of entries (0 disables caching)
+            gene_tolerance: Quantization step for genes (m)
+        """
+        self.max_size = max_size
+        self.gene_tolerance = gene_tolerance
+        self._entries: 'OrderedDict[tuple, Tuple[float, ...]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def make_key(
+        self,
+        genes: Sequence[float],
+        bar: BarParameters,
+        material: Material,
+        num_modes: int,
+        num_elements: int,
+        num_cuts: int = 0,
+        analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D,
+        ny: int = 2,
+        nz: int = 2,
+        solver_3d: str = 'auto'
+    ) -> tuple:
+        """Build the cache key for one design and its FEM settings."""
+        quantized = np.round(np.asarray(genes, dtype=np.float64) / self.gene_tolerance)
+        return (
+            tuple(quantized.astype(np.int64).tolist()),
+            (bar.L, bar.b, bar.h0),
+            (material.E, material.rho, material.nu),
+            num_modes,
+            num_elements,
+            num_cuts,
+            analysis_mode,
+            ny,
+            nz,
+            solver_3d,
+        )
+
+    def get(self, key: tuple) -> Optional[Tuple[float, ...]]:
+        """Look up frequencies for a key, or None on a miss."""
+        with self._lock:
+            frequencies = self._entries.get(key)
+            if frequencies is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return frequencies
+
+    def put(self, key: tuple, frequencies: Sequence[float]) -> None:
+        """Store frequencies for a key, evicting the least recently used entry."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = tuple(float(f) for f in frequencies)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def resize(self, max_size: int) -> None:
+        """Change the maximum number of entries."""
+        with self._lock:
+            self.max_size = max_size
+            while len(self._entries) > max(max_size, 0):
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current hit/miss statistics."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_size=self.max_size
+            )
+
+
+# Cache shared by batch fitness evaluation, progress reports and detailed evaluation
+_shared_cache = FrequencyCache()
+
+
+def get_frequency_cache() -> FrequencyCache:
+    """Get the process-wide shared frequency cache."""
+    return _shared_cache
@@ -0,0 +1,254 @@
+"""
+Modal Surrogate Module
+
+Reduced-basis (Rayleigh-Ritz) re-evaluation of 3D bar models. For nearby
+geometries the low mode shapes barely change, so a full 3D solve of a
+reference design provides a Ritz basis of its lowest mode shapes. A candidate
+design is then evaluated by projecting its K and M onto that basis and
+solving a small dense eigenproblem.
+
+Two details make this work for undercut bars:
+
+- Changing the element heights or the bar length moves the mesh nodes, so
+  the reference shapes are first carried to the new node positions with
+  their x and z gradients (u + du/dx dx + du/dz dz). Without this, nodes of
+  an element whose height changed keep the displacement of their old
+  position, and the projected model is far too stiff.
+- Moving a cut edge by one element still leaves an error of the order of
+  1%. The residuals R of the Ritz pairs are therefore preconditioned with
+  the factorization of the reference model, kept from the full solve, and
+  P^-1 R is added to the basis (a Davidson correction step, no new
+  factorization).
+
+The same preconditioned residuals give the error estimate
+r^T P^-1 r / (lambda x^T M x) of each eigenvalue. When it stays above the
+tolerance after the correction steps, the current design is solved in full
+and becomes a new reference. A few references are kept, and the one whose
+node coordinates are closest to the candidate is used, so that a few
+neighbouring designs do not replace the reference at every evaluation.
+
+The surrogate is selected with solver='reduced' in compute_frequencies_3d
+and is the default of the SOLID_3D length search (find_optimal_length), whose
+later steps change the length by well under 1%. EA populations are too
+spread out for it: nearly every candidate needs a full solve, which is
+slower than warm-started eigsh.
+"""
+
+from typing import List, Optional, Tuple
+from dataclasses import dataclass
+import math
+import numpy as np
+from scipy import linalg
+from scipy.sparse.linalg import splu
+
+# Elastic reference mode shapes kept in the basis
+DEFAULT_BASIS_MODES = 30
+
+# Largest accepted estimated relative eigenvalue error (frequency error is half)
+DEFAULT_ERROR_TOLERANCE = 1e-6
+
+# Davidson correction steps before falling back to a full solve
+DEFAULT_CORRECTION_STEPS = 2
+
+# Projections with a larger estimated error go straight to a full solve
+MAX_CORRECTABLE_ERROR = 1e-2
+
+# Fully solved reference designs kept per mesh (nearest one is used)
+DEFAULT_MAX_REFERENCES = 8
+
+
+@dataclass
+class ModalReference:
+    """A fully solved design: elastic mode shapes, node coordinates and factorization."""
+    modes: np.ndarray
+    nodes: np.ndarray
+    factor: object
+
+
+@dataclass
+class SurrogateStats:
+    """Reduced-basis surrogate statistics."""
+    evaluations: int
+    refreshes: int
+    references: int
+
+    @property
+    def refresh_rate(self) -> float:
+        """Fraction of evaluations that needed a full solve."""
+        return self.refreshes / self.evaluations if self.evaluations > 0 else 0.0
+
+
+class ModalSurrogate3D:
+    """
+    Ritz bases of fully solved reference designs for one 3D mesh.
+
+    References are kept in least recently used order; a projected solution
+    that fails the error check triggers a full solve of the candidate,
+    which then becomes a reference. All references are dropped when the
+    model size changes.
+    """
+
+    def __init__(
+        self,
+        num_basis_modes: int = DEFAULT_BASIS_MODES,
+        error_tolerance: float = DEFAULT_ERROR_TOLERANCE,
+        correction_steps: int = DEFAULT_CORRECTION_STEPS,
+        max_references: int = DEFAULT_MAX_REFERENCES
+    ):
+        """
+        Args:
+            num_basis_modes: Elastic mode shapes kept from a full solve
+            error_tolerance: Largest accepted estimated relative eigenvalue error
+            correction_steps: Davidson steps before a full solve
+            max_references: Fully solved designs kept
+        """
+        self.num_basis_modes = num_basis_modes
+        self.error_tolerance = error_tolerance
+        self.correction_steps = correction_steps
+        self.max_references = max_references
+        self.references: List[ModalReference] = []
+        self._evaluations = 0
+        self._refreshes = 0
+
+    def solve(self, mesh, K, M, num_modes: int) -> Tuple[List[float], np.ndarray]:
+        """
+        Lowest elastic modes of an assembled model of the mesh.
+
+        Args:
+            mesh: BarMesh3D the model was assembled on
+            K: Sparse global stiffness matrix
+            M: Sparse global mass matrix
+            num_modes: Number of modes to extract
+
+        Returns:
+            Tuple of (frequencies in Hz, mode_shapes array)
+        """
+        self._evaluations += 1
+        reference = self.nearest_reference(mesh)
+        if reference is not None:
+            frequencies, mode_shapes, error = self.project(reference, mesh, K, M, num_modes)
+            if error <= self.error_tolerance:
+                return frequencies, mode_shapes
+        return self.refresh(mesh, K, M, num_modes)
+
+    def nearest_reference(self, mesh) -> Optional[ModalReference]:
+        """Reference closest to the current geometry of the mesh (None if there is none)."""
+        if self.references and self.references[0].nodes.shape != mesh.nodes.shape:
+            self.references.clear()
+        if not self.references:
+            return None
+        distances = [np.sum((ref.nodes - mesh.nodes) ** 2) for ref in self.references]
+        reference = self.references.pop(int(np.argmin(distances)))
+        self.references.append(reference)
+        return reference
+
+    def project(
+        self,
+        reference: ModalReference,
+        mesh,
+        K,
+        M,
+        num_modes: int
+    ) -> Tuple[List[float], np.ndarray, float]:
+        """
+        Rayleigh-Ritz solution in the basis of a reference, with correction steps.
+
+        Returns:
+            Tuple of (frequencies in Hz, mode_shapes array, largest estimated
+            relative eigenvalue error of the returned modes)
+        """
+        from .fem_3d import rigid_body_modes_3d, RIGID_MODE_THRESHOLD
+
+        V = np.hstack([rigid_body_modes_3d(mesh.nodes), self.transfer(reference, mesh)])
+        for step in range(self.correction_steps + 1):
+            V, _ = np.linalg.qr(V)
+            KV = K @ V
+            MV = M @ V
+            K_r = V.T @ KV
+            M_r = V.T @ MV
+            eigenvalues, Y = linalg.eigh((K_r + K_r.T) / 2, (M_r + M_r.T) / 2)
+
+            elastic = np.flatnonzero(eigenvalues > RIGID_MODE_THRESHOLD)[:num_modes]
+            if len(elastic) < num_modes:
+                return [], np.empty((K.shape[0], 0)), math.inf
+            eigenvalues = eigenvalues[elastic]
+            Y = Y[:, elastic]
+
+            MX = MV @ Y
+            R = KV @ Y - MX * eigenvalues
+            W = reference.factor.solve(R)
+            error = float(np.max(
+                np.abs(np.einsum('ij,ij->j', R, W))
+                / (eigenvalues * np.einsum('ij,ij->j', V @ Y, MX))
+            ))
+            if (error <= self.error_tolerance or error > MAX_CORRECTABLE_ERROR
+                    or step == self.correction_steps):
+                break
+            V = np.hstack([V, W])
+
+        frequencies = [math.sqrt(ev) / (2.0 * math.pi) for ev in eigenvalues]
+        return frequencies, V @ Y, error
+
+    @staticmethod
+    def transfer(reference: ModalReference, mesh) -> np.ndarray:
+        """
+        Reference mode shapes moved to the current node positions of the mesh.
+
+        Returns:
+            (num_dof, num_basis_modes) array
+        """
+        shape = (mesh.nx + 1, mesh.ny + 1, mesh.nz + 1)
+        U = reference.modes.reshape(shape + (3, -1))
+        result = U.copy()
+        for axis in (0, 2):
+            x_ref = reference.nodes[:, axis].reshape(shape)
+            dx = mesh.nodes[:, axis].reshape(shape) - x_ref
+            if not np.any(dx):
+                continue
+            gradient = np.gradient(U, axis=axis) / np.gradient(x_ref, axis=axis)[..., None, None]
+            result += gradient * dx[..., None, None]
+        return result.reshape(reference.modes.shape)
+
+    def refresh(self, mesh, K, M, num_modes: int) -> Tuple[List[float], np.ndarray]:
+        """
+        Full solve of the current design, which becomes a reference.
+
+        Returns:
+            Tuple of (frequencies in Hz, mode_shapes array)
+        """
+        from .fem_3d import _eigsh_shift_invert, RIGID_MODE_THRESHOLD
+
+        self._refreshes += 1
+        warm_start = mesh.warm_start('surrogate')
+        factor = splu((K - warm_start.sigma * M).tocsc())
+        eigenvalues, eigenvectors = _eigsh_shift_invert(
+            K, M, max(self.num_basis_modes, num_modes), 0, warm_start, factor
+        )
+
+        order = np.argsort(eigenvalues)
+        elastic = order[eigenvalues[order] > RIGID_MODE_THRESHOLD]
+        self.references.append(ModalReference(
+            modes=eigenvectors[:, elastic[:self.num_basis_modes]],
+            nodes=mesh.nodes.copy(),
+            factor=factor
+        ))
+        while len(self.references) > max(self.max_references, 1):
+            self.references.pop(0)
+
+        frequencies = [math.sqrt(ev) / (2.0 * math.pi) for ev in eigenvalues[elastic[:num_modes]]]
+        return frequencies, eigenvectors[:, elastic[:num_modes]]
+
+    def reset(self) -> None:
+        """Drop the references and the statistics."""
+        self.references.clear()
+        self._evaluations = 0
+        self._refreshes = 0
+
+    @property
+    def stats(self) -> SurrogateStats:
+        """Current evaluation/refresh statistics."""
+        return SurrogateStats(
+            evaluations=self._evaluations,
+            refreshes=self._refreshes,
+            references=len(self.references)
+        )
@@ -0,0 +1,302 @@
+"""
+Solver Selection Module
+
+Chooses the 3D eigen-solver backend ('dense', 'eigsh' or 'lobpcg') by model
+size and number of requested modes. The choice is based on solve times
+measured on this machine by an explicit calibration step
+(run_solver_calibration, or benchmark_3d_solvers.py --calibrate), stored in
+a JSON file that later processes (and process pool workers) only read.
+Without a calibration for the current numerical libraries and machine,
+and for models larger than the calibrated meshes, eigsh is used.
+
+The calibration file defaults to
+~/.cache/multi_modal_tuning/solver_calibration_3d.json and can be moved with
+the MULTI_MODAL_TUNING_SOLVER_CALIBRATION environment variable.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, asdict
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+import numpy as np
+import scipy
+
+CALIBRATION_VERSION = 1
+
+CALIBRATION_ENV_VAR = 'MULTI_MODAL_TUNING_SOLVER_CALIBRATION'
+
+DEFAULT_CALIBRATION_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'multi_modal_tuning', 'solver_calibration_3d.json'
+)
+
+# Calibration meshes (nx, ny, nz), from about 100 to 2700 DOF
+CALIBRATION_MESHES = ((8, 1, 1), (10, 2, 2), (20, 2, 3), (40, 2, 3), (60, 2, 4))
+
+CALIBRATION_MODE_COUNTS = (4, 12)
+
+# A solver slower than this (s) and this many times slower than the fastest
+# is not timed on larger meshes
+MIN_CALIBRATION_SKIP_TIME = 0.05
+MAX_CALIBRATION_SLOWDOWN = 2.0
+
+# Shift-invert ARPACK is the reference backend; another backend is chosen
+# only if its predicted time is below this fraction of the eigsh time
+PREFERENCE_MARGIN = 0.8
+
+# Dense matrices above this size are never built during calibration
+MAX_DENSE_CALIBRATION_DOF = 3000
+
+
+@dataclass
+class SolverTiming:
+    """Measured mean solve time of one backend on one model size."""
+    solver: str
+    num_dof: int
+    num_modes: int
+    seconds: float
+
+
+@dataclass
+class SolverCalibration:
+    """Solve times of the 3D backends and the environment they were measured in."""
+    timings: List[SolverTiming]
+    environment: Dict[str, object]
+
+    def choose(self, num_dof: int, num_modes: int) -> str:
+        """
+        Fastest backend for a model size.
+
+        Times are interpolated log-log in the DOF count, using the
+        calibrated mode count closest to num_modes. Above the largest
+        calibrated model eigsh is returned: the times of the few largest
+        meshes are too noisy to extrapolate. Below the smallest, its times
+        are used. eigsh is kept unless another backend is predicted to be
+        clearly faster.
+
+        Args:
+            num_dof: Number of degrees of freedom
+            num_modes: Number of modes requested
+
+        Returns:
+            Backend name
+        """
+        mode_counts = sorted({t.num_modes for t in self.timings})
+        if not mode_counts:
+            return 'eigsh'
+        nearest = min(mode_counts, key=lambda m: abs(math.log(m / max(num_modes, 1))))
+        if num_dof > max(t.num_dof for t in self.timings if t.num_modes == nearest):
+            return 'eigsh'
+
+        predicted = {}
+        for solver in {t.solver for t in self.timings}:
+            points = sorted(
+                (t.num_dof, t.seconds) for t in self.timings
+                if t.solver == solver and t.num_modes == nearest
+            )
+            predicted[solver] = _interpolate_log_log(points, num_dof)
+
+        reference = predicted.get('eigsh', math.inf)
+        best = min(predicted, key=predicted.get)
+        if best != 'eigsh' and predicted[best] < PREFERENCE_MARGIN * reference:
+            return best
+        return 'eigsh'
+
+
+def _interpolate_log_log(points: Sequence[Tuple[int, float]], x: float) -> float:
+    """
+    Piecewise linear interpolation of log(y) over log(x). Below the first
+    point its y is returned; above the last (a backend that was not timed
+    on larger meshes) there is no prediction (inf).
+    """
+    if not points or x > points[-1][0]:
+        return math.inf
+    if x <= points[0][0]:
+        return points[0][1]
+    log_x = np.log([p[0] for p in points])
+    log_y = np.log([p[1] for p in points])
+    return math.exp(float(np.interp(math.log(x), log_x, log_y)))
+
+
+def calibration_environment() -> Dict[str, object]:
+    """Fingerprint of everything the solve times depend on."""
+    from .fem_3d import HAS_PYAMG
+    return {
+        'version': CALIBRATION_VERSION,
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'cpu_count': os.cpu_count(),
+        'pyamg': HAS_PYAMG,
+    }
+
+
+def calibration_path() -> str:
+    """Location of the calibration file."""
+    return os.environ.get(CALIBRATION_ENV_VAR) or DEFAULT_CALIBRATION_PATH
+
+
+def calibrate_solvers_3d(
+    meshes: Sequence[Tuple[int, int, int]] = CALIBRATION_MESHES,
+    mode_counts: Sequence[int] = CALIBRATION_MODE_COUNTS,
+    repeats: int = 3,
+    seed: int = 0
+) -> SolverCalibration:
+    """
+    Time the 3D backends on a range of uniform bar meshes.
+
+    Each backend solves a short sequence of slightly perturbed designs
+    after one priming solve, as in an EA generation, so the warm-started
+    backends are timed the way they are used.
+
+    Args:
+        meshes: (nx, ny, nz) meshes, smallest first
+        mode_counts: Numbers of requested modes to time
+        repeats: Timed solves per backend, mesh and mode count
+        seed: Seed for the design perturbations
+
+    Returns:
+        SolverCalibration for the current environment
+    """
+    from .fem_3d import EIGEN_SOLVERS_3D, BarMesh3D, _solve_bar_3d
+
+    rng = np.random.default_rng(seed)
+    timings = []
+    too_slow = set()
+
+    for nx, ny, nz in meshes:
+        mesh = BarMesh3D(nx, ny, nz)
+        designs = [
+            0.02 * (1.0 + 0.02 * rng.standard_normal(nx)) for _ in range(repeats + 1)
+        ]
+        for num_modes in mode_counts:
+            measured = {}
+            for solver in EIGEN_SOLVERS_3D:
+                if solver in too_slow:
+                    continue
+                if solver == 'dense' and mesh.num_dof > MAX_DENSE_CALIBRATION_DOF:
+                    continue
+
+                elapsed = 0.0
+                for i, heights in enumerate(designs):
+                    start = time.perf_counter()
+                    mesh.update_geometry(0.35, 0.03, heights)
+                    K, M = mesh.assemble(1.2e10, 0.3, 640.0)
+                    if solver == 'dense':
+                        K, M = K.toarray(), M.toarray()
+                    _solve_bar_3d(mesh, K, M, num_modes, solver)
+                    if i > 0:
+                        elapsed += time.perf_counter() - start
+
+                measured[solver] = elapsed / repeats
+                timings.append(SolverTiming(solver, mesh.num_dof, num_modes, measured[solver]))
+
+            fastest = min(measured.values())
+            for solver, seconds in measured.items():
+                if seconds > max(MIN_CALIBRATION_SKIP_TIME, MAX_CALIBRATION_SLOWDOWN * fastest):
+                    too_slow.add(solver)
+
+    return SolverCalibration(timings, calibration_environment())
+
+
+def load_calibration(path: Optional[str] = None) -> Optional[SolverCalibration]:
+    """
+    Read a calibration file.
+
+    Returns:
+        The stored calibration, or None if the file is missing, unreadable
+        or was measured in a different environment
+    """
+    try:
+        with open(path or calibration_path()) as f:
+            data = json.load(f)
+        calibration = SolverCalibration(
+            [SolverTiming(**t) for t in data['timings']], data['environment']
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if calibration.environment != calibration_environment():
+        return None
+    return calibration
+
+
+def save_calibration(calibration: SolverCalibration, path: Optional[str] = None) -> bool:
+    """
+    Write a calibration file atomically.
+
+    Returns:
+        True if the file was written
+    """
+    path = path or calibration_path()
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({
+                'environment': calibration.environment,
+                'timings': [asdict(t) for t in calibration.timings],
+            }, f, indent=1)
+        os.replace(tmp_path, path)
+    except OSError:
+        return False
+    return True
+
+
+_calibration: Optional[SolverCalibration] = None
+_calibration_lock = threading.Lock()
+
+
+def get_solver_calibration() -> SolverCalibration:
+    """
+    Get the process-wide calibration, loading it on first use.
+
+    No benchmark is run here; without a valid calibration file an empty
+    calibration is used, which always chooses eigsh.
+    """
+    global _calibration
+    with _calibration_lock:
+        if _calibration is None:
+            _calibration = load_calibration() or SolverCalibration([], calibration_environment())
+        return _calibration
+
+
+def run_solver_calibration(path: Optional[str] = None, **kwargs) -> SolverCalibration:
+    """
+    Measure the 3D backends, save the calibration and use it in this process.
+
+    Takes a few seconds; run it once per machine, not from parallel workers.
+
+    Args:
+        path: Calibration file (default: calibration_path())
+        **kwargs: Passed on to calibrate_solvers_3d
+
+    Returns:
+        The new calibration
+    """
+    calibration = calibrate_solvers_3d(**kwargs)
+    save_calibration(calibration, path)
+    set_solver_calibration(calibration)
+    return calibration
+
+
+def set_solver_calibration(calibration: Optional[SolverCalibration]) -> None:
+    """Replace the process-wide calibration (None reloads it on next use)."""
+    global _calibration
+    with _calibration_lock:
+        _calibration = calibration
+
+
+def choose_solver_3d(num_dof: int, num_modes: int) -> str:
+    """
+    Calibrated choice of 3D eigen-solver backend.
+
+    Args:
+        num_dof: Number of degrees of freedom
+        num_modes: Number of modes requested
+
+    Returns:
+        'dense', 'eigsh' or 'lobpcg'
+    """
+    return get_solver_calibration().choose(num_dof, num_modes)
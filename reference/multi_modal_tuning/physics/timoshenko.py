@@ -8,6 +8,7 @@ The Timoshenko beam model accounts for shear deformation, which is
 important for thick bars used in percussion instruments.
 """
 
+from typing import Tuple, Union
 import numpy as np
 from ..data.materials import KAPPA
 
@@ -101,3 +102,80 @@ def compute_element_mass(
         [m * (c2 - r1),     m * (c4 - r3),      m * (c1 + r1),     m * (-c3 - r3)],
         [m * (-c4 + r3),    m * (-c6 + r4),     m * (-c3 - r3),    m * (c5 + r2_term)],
     ], dtype=np.float64)
+
+
+def compute_element_matrices_batch(
+    heights: np.ndarray,
+    le: Union[float, np.ndarray],
+    b: float,
+    E: float,
+    rho: float,
+    nu: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute Timoshenko stiffness and mass matrices for many elements at once.
+
+    Vectorized equivalent of calling compute_element_stiffness and
+    compute_element_mass for every element. Leading dimensions of
+    `heights` are preserved, so a (P, Ne) height matrix yields
+    (P, Ne, 4, 4) element matrices.
+
+    Args:
+        heights: Array of element heights (m), any shape
+        le: Element length (m), scalar or array broadcastable against heights
+        b: Bar width (m)
+        E: Young's modulus (Pa)
+        rho: Density (kg/m^3)
+        nu: Poisson's ratio
+
+    Returns:
+        Tuple of (Ke, Me) arrays with shape heights.shape + (4, 4)
+    """
+    h = np.asarray(heights, dtype=np.float64)
+    le = np.asarray(le, dtype=np.float64)
+    h, le = np.broadcast_arrays(h, le)
+
+    G = E / (2.0 * (1.0 + nu))
+    A = b * h
+    I = b * h**3 / 12.0
+
+    # Stiffness terms (see compute_element_stiffness)
+    phi = 12.0 * E * I / (KAPPA * G * A * le * le)
+    denom = (1.0 + phi) * le * le * le
+
+    k11 = 12.0 * E * I / denom
+    k12 = 6.0 * E * I * le / denom
+    k22 = (4.0 + phi) * E * I * le * le / denom
+    k23 = (2.0 - phi) * E * I * le * le / denom
+
+    Ke = np.empty(h.shape + (4, 4), dtype=np.float64)
+    Ke[..., 0, :] = np.stack([k11, k12, -k11, k12], axis=-1)
+    Ke[..., 1, :] = np.stack([k12, k22, -k12, k23], axis=-1)
+    Ke[..., 2, :] = np.stack([-k11, -k12, k11, -k12], axis=-1)
+    Ke[..., 3, :] = np.stack([k12, k23, -k12, k22], axis=-1)
+
+    # Mass terms (see compute_element_mass)
+    denom = (1.0 + phi) ** 2
+    m = rho * A * le
+    r_scale = (I / A) / (le * le)
+
+    c1 = (13.0/35.0 + 7.0*phi/10.0 + phi*phi/3.0) / denom
+    c2 = (9.0/70.0 + 3.0*phi/10.0 + phi*phi/6.0) / denom
+    c3 = (11.0/210.0 + 11.0*phi/120.0 + phi*phi/24.0) * le / denom
+    c4 = (13.0/420.0 + 3.0*phi/40.0 + phi*phi/24.0) * le / denom
+    c5 = (1.0/105.0 + phi/60.0 + phi*phi/120.0) * le * le / denom
+    c6 = (1.0/140.0 + phi/60.0 + phi*phi/120.0) * le * le / denom
+
+    r1 = (6.0/5.0) / denom * r_scale
+    r2_term = (2.0/15.0 + phi/6.0 + phi*phi/3.0) * le * le / denom * r_scale
+    r3 = (1.0/10.0 - phi/2.0) * le / denom * r_scale
+    r4 = (-1.0/30.0 - phi/6.0 + phi*phi/6.0) * le * le / denom * r_scale
+
+    Me = np.empty(h.shape + (4, 4), dtype=np.float64)
+    Me[..., 0, :] = np.stack([c1 + r1, c3 + r3, c2 - r1, -c4 + r3], axis=-1)
+    Me[..., 1, :] = np.stack([c3 + r3, c5 + r2_term, c4 - r3, -c6 + r4], axis=-1)
+    Me[..., 2, :] = np.stack([c2 - r1, c4 - r3, c1 + r1, -c3 - r3], axis=-1)
+    Me[..., 3, :] = np.stack([-c4 + r3, -c6 + r4, -c3 - r3, c5 + r2_term], axis=-1)
+    Me *= m[..., None, None]
+
+    return Ke, Me
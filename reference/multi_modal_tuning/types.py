@@ -14,6 +14,7 @@ class AnalysisMode(Enum):
     """FEM analysis mode selection."""
     BEAM_2D = "2d"      # Timoshenko beam elements (fast, good for slender bars)
     SOLID_3D = "3d"     # 3D hexahedral elements (accurate, slower)
+    SOLID_3D_SYMMETRIC = "3d-sym"  # 3D solid solved per mirror-symmetry class (same spectrum, fewer DOFs)
 
 
 @dataclass
@@ -69,12 +70,18 @@ class EAParameters:
     max_cut_depth: float = 0.0        # Maximum cut depth (h0 - h) (m), 0 = no limit
     max_length_trim: float = 0.0      # Max trim from each end (m), 0 = no trimming
     max_length_extend: float = 0.0    # Max extension from each end (m), 0 = no extension
-    max_workers: int = 0              # Max worker threads (0 = auto)
+    max_workers: int = 0              # Max worker threads/processes (0 = auto)
+    # Fitness evaluation backend: 'thread', 'process' (persistent pool per run) or 'serial'
+    executor: Literal['thread', 'process', 'serial'] = 'thread'
     # Analysis mode selection
     analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D
     # 3D mesh parameters (only used when analysis_mode is SOLID_3D)
     num_elements_y: int = 2           # Elements in width direction
     num_elements_z: int = 2           # Elements in thickness direction
+    # Eigen-solver for SOLID_3D: 'auto' = calibrated choice ('lobpcg' not with SOLID_3D_SYMMETRIC)
+    solver_3d: Literal['auto', 'dense', 'eigsh', 'lobpcg'] = 'auto'
+    # Seed of the operators' numpy Generator (None = drawn from the random module)
+    random_seed: Optional[int] = None
     # Frequency offset for 2D/3D calibration (e.g., 0.05 = target 5% higher)
     # Applied as: effective_target = target * (1 + offset)
     frequency_offset: float = 0.0
@@ -86,6 +93,7 @@ class Individual:
     genes: List[float]                # [lambda_1, h_1, lambda_2, h_2, ..., length_adjust?]
     fitness: float = math.inf
     sigmas: Optional[List[float]] = None  # For self-adaptive Gaussian mutation
+    frequencies: Optional[List[float]] = None  # Computed frequencies (Hz) from the last evaluation
 
 
 @dataclass
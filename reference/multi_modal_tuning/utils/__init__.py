@@ -18,12 +18,20 @@ from .note_utils import (
 
 from .bar_length_finder import (
     compute_f1_for_uniform_bar,
+    compute_f1_for_uniform_bars,
     find_optimal_length,
+    interpolate_lengths,
     find_lengths_for_notes,
     estimate_length_from_theory,
     LengthSearchResult,
 )
 
+from .result_store import (
+    ResultStore,
+    StoredResult,
+    result_store_path,
+)
+
 __all__ = [
     # Note utils
     "NOTE_NAMES",
@@ -41,8 +49,14 @@ __all__ = [
     "ScaleType",
     # Bar length finder
     "compute_f1_for_uniform_bar",
+    "compute_f1_for_uniform_bars",
     "find_optimal_length",
+    "interpolate_lengths",
     "find_lengths_for_notes",
     "estimate_length_from_theory",
     "LengthSearchResult",
+    # Result store
+    "ResultStore",
+    "StoredResult",
+    "result_store_path",
 ]
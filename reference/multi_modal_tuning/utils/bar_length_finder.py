@@ -1,20 +1,32 @@
 """
 Bar Length Finder Utility
 
-Uses binary search to find optimal bar length for a target fundamental frequency.
+Finds the optimal bar length for a target fundamental frequency.
 The physics relationship: f1 is proportional to h/L^2 for a uniform bar.
 Longer bars -> lower frequencies, shorter bars -> higher frequencies.
+The default search starts from the Euler-Bernoulli length and takes secant
+steps on that relationship; binary search is kept as an alternative.
+For whole note ranges (2D only), interpolate_lengths sweeps f1 over a grid
+of lengths in one batched solve and inverts the curve by interpolation.
 
 Supports both 2D Timoshenko beam analysis (fast) and 3D solid element analysis (accurate).
 """
 
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
 from dataclasses import dataclass
 import math
+import numpy as np
+from scipy.interpolate import PchipInterpolator
 
 from ..types import Material, BarParameters, AnalysisMode
 from ..physics.frequencies import compute_frequencies_from_genes
-from ..physics.fem_3d import compute_frequencies_3d_classified
+from ..physics.fem_assembly import assemble_half_banded_matrices, solve_generalized_eigenvalue_batch
+from ..physics.fem_3d import (
+    compute_frequencies_3d_classified,
+    compute_frequencies_3d_symmetric_classified,
+    BENDING_SYMMETRY_CLASSES,
+    REDUCED_SOLVER_3D,
+)
 from ..physics.bar_profile import generate_element_heights
 from .note_utils import NoteInfo, frequency_error_cents
 
@@ -50,7 +62,8 @@ def compute_f1_for_uniform_bar(
     num_elements: int = 80,
     analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D,
     ny: int = 2,
-    nz: int = 3
+    nz: int = 3,
+    solver_3d: str = 'auto'
 ) -> float:
     """
     Compute f1 for a uniform bar (no cuts) at given length.
@@ -61,9 +74,10 @@ def compute_f1_for_uniform_bar(
         thickness: Bar thickness in mm
         material: Material properties
         num_elements: Number of FEM elements (default: 80)
-        analysis_mode: BEAM_2D (fast) or SOLID_3D (accurate)
+        analysis_mode: BEAM_2D (fast), SOLID_3D (accurate) or SOLID_3D_SYMMETRIC
         ny: Number of elements in width direction (3D only)
         nz: Number of elements in thickness direction (3D only)
+        solver_3d: 3D eigen-solver (SOLID_3D only, see compute_frequencies_3d)
 
     Returns:
         Fundamental frequency f1 in Hz
@@ -80,7 +94,28 @@ def compute_f1_for_uniform_bar(
         hMin=h0_m / 10  # 10% of thickness
     )
 
-    if analysis_mode == AnalysisMode.SOLID_3D:
+    if analysis_mode == AnalysisMode.SOLID_3D_SYMMETRIC:
+        # Uniform bar is symmetric: only the bending symmetry classes are solved
+        element_heights = [h0_m] * num_elements
+
+        _, classified, _ = compute_frequencies_3d_symmetric_classified(
+            element_heights,
+            L_m,
+            b_m,
+            material.E,
+            material.rho,
+            material.nu,
+            num_modes=5,
+            ny=ny,
+            nz=nz,
+            classes=BENDING_SYMMETRY_CLASSES
+        )
+
+        bending_modes = classified.get('vertical_bending', [])
+        if bending_modes:
+            return bending_modes[0]['frequency']
+        return 0.0
+    elif analysis_mode == AnalysisMode.SOLID_3D:
         # Generate uniform element heights for 3D analysis
         element_heights = [h0_m] * num_elements
 
@@ -94,7 +129,8 @@ def compute_f1_for_uniform_bar(
             material.nu,
             num_modes=10,
             ny=ny,
-            nz=nz
+            nz=nz,
+            solver=solver_3d
         )
 
         # Return first vertical bending mode
@@ -118,6 +154,16 @@ def compute_f1_for_uniform_bar(
         return frequencies[0] if frequencies else 0.0
 
 
+# Length search methods of find_optimal_length
+LENGTH_SEARCH_METHODS = ('secant', 'bisect')
+
+# Search stops when the length changes by less than this (mm)
+LENGTH_PRECISION = 0.01
+
+# Grid lengths of the batched f1 sweep in interpolate_lengths
+DEFAULT_GRID_LENGTHS = 64
+
+
 def find_optimal_length(
     target_frequency: float,
     width: float,
@@ -131,14 +177,19 @@ def find_optimal_length(
     analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D,
     frequency_offset: float = 0.0,
     ny: int = 2,
-    nz: int = 3
+    nz: int = 3,
+    method: str = 'secant',
+    initial_length: Optional[float] = None,
+    solver_3d: str = REDUCED_SOLVER_3D
 ) -> LengthSearchResult:
     """
-    Find optimal bar length for a target frequency using binary search.
+    Find optimal bar length for a target frequency.
 
-    Uses the fact that f1 decreases monotonically with length:
-    - If computed f1 is too high, need a longer bar (search upper half)
-    - If computed f1 is too low, need a shorter bar (search lower half)
+    Uses the fact that f1 decreases monotonically with length. Two methods:
+    - 'secant': start from initial_length (default: the Euler-Bernoulli
+      estimate) and step in log-log space, where f1 ~ 1/L^p with p close
+      to 2. Usually 2-4 FEM solves.
+    - 'bisect': binary search between min_length and max_length.
 
     Args:
         target_frequency: Target fundamental frequency in Hz
@@ -150,18 +201,133 @@ def find_optimal_length(
         tolerance_cents: Stop search when within this tolerance (cents)
         max_iterations: Maximum search iterations
         num_elements: Number of FEM elements
-        analysis_mode: BEAM_2D (fast) or SOLID_3D (accurate)
+        analysis_mode: BEAM_2D (fast), SOLID_3D (accurate) or SOLID_3D_SYMMETRIC
         frequency_offset: Calibration offset (e.g., -0.05 to aim 5% lower for 3D calibration)
         ny: Number of elements in width direction (3D only)
         nz: Number of elements in thickness direction (3D only)
+        method: 'secant' (default) or 'bisect'
+        initial_length: First length tried by the secant method (mm), e.g.
+            the length found for a neighbouring note scaled by sqrt(f_prev/f)
+        solver_3d: 3D eigen-solver (SOLID_3D only). The default 'reduced'
+            projects the later, nearby lengths of a search onto the mode
+            shapes of earlier solves (see modal_surrogate)
 
     Returns:
         Search result with optimal length and computed frequency
     """
+    if method not in LENGTH_SEARCH_METHODS:
+        raise ValueError(f"Unknown length search method: {method} (expected one of {LENGTH_SEARCH_METHODS})")
+
     # Apply frequency offset for calibration
     # If using 2D with a known 3D offset, adjust target so 3D will hit the actual target
     effective_target = target_frequency * (1 + frequency_offset)
 
+    def f1_at(length: float) -> float:
+        return compute_f1_for_uniform_bar(
+            length, width, thickness, material, num_elements, analysis_mode, ny, nz, solver_3d
+        )
+
+    if method == 'bisect':
+        return _bisect_length(
+            f1_at, target_frequency, effective_target, min_length, max_length, tolerance_cents, max_iterations
+        )
+
+    if initial_length is None:
+        initial_length = estimate_length_from_theory(effective_target, width, thickness, material)
+    return _secant_length(
+        f1_at, target_frequency, effective_target, min_length, max_length, tolerance_cents, max_iterations,
+        initial_length
+    )
+
+
+def _secant_length(
+    f1_at: Callable[[float], float],
+    target_frequency: float,
+    effective_target: float,
+    min_length: float,
+    max_length: float,
+    tolerance_cents: float,
+    max_iterations: int,
+    initial_length: float
+) -> LengthSearchResult:
+    """
+    Secant search on log f1 = c - p log L.
+
+    The first step assumes p = 2 (Euler-Bernoulli); later steps use the
+    exponent measured between the last two solves. Steps that leave the
+    bracket of solved lengths around the target fall back to bisection.
+    """
+    # Longest length known to be too short (f1 above target) and shortest known to be too long
+    low, high = min_length, max_length
+    low_solved = high_solved = False
+
+    best_length = min(max(initial_length, min_length), max_length)
+    best_freq = 0.0
+    best_error = float('inf')
+
+    length = best_length
+    previous: Optional[Tuple[float, float]] = None
+    iterations = 0
+    while iterations < max_iterations:
+        iterations += 1
+        f1 = f1_at(length)
+
+        search_error_cents = frequency_error_cents(f1, effective_target)
+        report_error_cents = frequency_error_cents(f1, target_frequency)
+        if abs(report_error_cents) < abs(best_error):
+            best_length = length
+            best_freq = f1
+            best_error = report_error_cents
+
+        if abs(search_error_cents) <= tolerance_cents or f1 <= 0:
+            break
+
+        if f1 > effective_target:
+            low, low_solved = length, True
+        else:
+            high, high_solved = length, True
+
+        # Target outside [min_length, max_length]: the bound is the best available
+        if (low_solved and low >= max_length) or (high_solved and high <= min_length):
+            break
+
+        exponent = 2.0
+        if previous is not None and previous[0] != length and previous[1] > 0:
+            measured = -math.log(f1 / previous[1]) / math.log(length / previous[0])
+            if 0.5 < measured < 4.0:
+                exponent = measured
+        previous = (length, f1)
+
+        next_length = length * (f1 / effective_target) ** (1.0 / exponent)
+        next_length = min(max(next_length, min_length), max_length)
+        if not low < next_length < high:
+            if low_solved and high_solved:
+                next_length = (low + high) / 2
+            else:
+                # Only one side solved: try the bound on the other side
+                next_length = max_length if low_solved else min_length
+        if abs(next_length - length) < LENGTH_PRECISION or high - low <= LENGTH_PRECISION:
+            break
+        length = next_length
+
+    return LengthSearchResult(
+        length=best_length,
+        computed_freq=best_freq,
+        iterations=iterations,
+        error_cents=best_error
+    )
+
+
+def _bisect_length(
+    f1_at: Callable[[float], float],
+    target_frequency: float,
+    effective_target: float,
+    min_length: float,
+    max_length: float,
+    tolerance_cents: float,
+    max_iterations: int
+) -> LengthSearchResult:
+    """Binary search between min_length and max_length."""
     low = min_length
     high = max_length
     iterations = 0
@@ -170,8 +336,8 @@ def find_optimal_length(
     best_error = float('inf')
 
     # Check bounds first
-    f_at_min = compute_f1_for_uniform_bar(min_length, width, thickness, material, num_elements, analysis_mode, ny, nz)
-    f_at_max = compute_f1_for_uniform_bar(max_length, width, thickness, material, num_elements, analysis_mode, ny, nz)
+    f_at_min = f1_at(min_length)
+    f_at_max = f1_at(max_length)
 
     # f1 decreases with length, so f_at_min > f_at_max
     # Use effective_target for search logic, but report error vs original target
@@ -191,10 +357,10 @@ def find_optimal_length(
         )
 
     # Binary search - search for effective_target, report error vs original target
-    while iterations < max_iterations and high - low > 0.01:  # 0.01mm precision
+    while iterations < max_iterations and high - low > LENGTH_PRECISION:
         iterations += 1
         mid = (low + high) / 2
-        f1 = compute_f1_for_uniform_bar(mid, width, thickness, material, num_elements, analysis_mode, ny, nz)
+        f1 = f1_at(mid)
 
         # Error vs effective_target for search decisions
         search_error_cents = frequency_error_cents(f1, effective_target)
@@ -226,6 +392,101 @@ def find_optimal_length(
     )
 
 
+def compute_f1_for_uniform_bars(
+    lengths,
+    width: float,
+    thickness: float,
+    material: Material,
+    num_elements: int = 80
+) -> np.ndarray:
+    """
+    Compute f1 of uniform bars (no cuts) for many lengths with one batched solve.
+
+    2D Timoshenko beam only. f1 of a uniform free-free bar is its first
+    symmetric mode, so only the symmetric half-beam class is solved.
+
+    Args:
+        lengths: Bar lengths in mm, shape (P,)
+        width: Bar width in mm
+        thickness: Bar thickness in mm
+        material: Material properties
+        num_elements: Number of FEM elements (default: 80)
+
+    Returns:
+        (P,) array of f1 in Hz (NaN where the solve failed)
+    """
+    lengths_m = np.asarray(lengths, dtype=np.float64).reshape(-1) / 1000
+    heights = np.full((len(lengths_m), num_elements), thickness / 1000)
+
+    K_band, M_band = assemble_half_banded_matrices(
+        heights, lengths_m / num_elements, width / 1000, material.E, material.rho, material.nu,
+        symmetric=True
+    )
+    return solve_generalized_eigenvalue_batch(K_band, M_band, 1)[:, 0]
+
+
+def interpolate_lengths(
+    target_frequencies,
+    width: float,
+    thickness: float,
+    material: Material,
+    min_length: float,
+    max_length: float,
+    num_elements: int = 80,
+    frequency_offset: float = 0.0,
+    num_grid_lengths: int = DEFAULT_GRID_LENGTHS
+) -> List[LengthSearchResult]:
+    """
+    Find bar lengths for many target frequencies at once (2D beam only).
+
+    f1 is computed on a log-spaced grid of lengths between min_length and
+    max_length in one batched solve, and the monotone curve log L(log f1)
+    is inverted with a PCHIP interpolant. The lengths found are checked
+    with a second batched solve, which gives the reported frequencies and
+    errors. Targets outside the range of the grid get the nearest bound.
+
+    Args:
+        target_frequencies: Target fundamental frequencies in Hz
+        width: Bar width in mm
+        thickness: Bar thickness in mm
+        material: Material properties
+        min_length: Minimum bar length (mm)
+        max_length: Maximum bar length (mm)
+        num_elements: Number of FEM elements
+        frequency_offset: Calibration offset (e.g., -0.05 to aim 5% lower for 3D calibration)
+        num_grid_lengths: Number of grid lengths (64 interpolates to well below 0.01 cents)
+
+    Returns:
+        Search result for each target frequency (iterations=1: the check solve)
+    """
+    targets = np.asarray(target_frequencies, dtype=np.float64).reshape(-1)
+    if len(targets) == 0:
+        return []
+    effective_targets = targets * (1 + frequency_offset)
+
+    grid = np.geomspace(min_length, max_length, max(num_grid_lengths, 2))
+    grid_f1 = compute_f1_for_uniform_bars(grid, width, thickness, material, num_elements)
+    valid = np.isfinite(grid_f1) & (grid_f1 > 0)
+
+    # f1 decreases with length, so reverse the grid for increasing log f1
+    log_f1 = np.log(grid_f1[valid][::-1])
+    log_length = np.log(grid[valid][::-1])
+    clamped = np.clip(np.log(effective_targets), log_f1[0], log_f1[-1])
+    lengths = np.exp(PchipInterpolator(log_f1, log_length)(clamped))
+    lengths = np.clip(lengths, min_length, max_length)
+
+    computed = compute_f1_for_uniform_bars(lengths, width, thickness, material, num_elements)
+    return [
+        LengthSearchResult(
+            length=float(length),
+            computed_freq=float(f1),
+            iterations=1,
+            error_cents=frequency_error_cents(float(f1), float(target))
+        )
+        for length, f1, target in zip(lengths, computed, targets)
+    ]
+
+
 def find_lengths_for_notes(
     notes: List[NoteInfo],
     width: float,
@@ -239,7 +500,8 @@ def find_lengths_for_notes(
     analysis_mode: AnalysisMode = AnalysisMode.BEAM_2D,
     frequency_offset: float = 0.0,
     ny: int = 2,
-    nz: int = 3
+    nz: int = 3,
+    method: str = 'secant'
 ) -> List[BarLengthResult]:
     """
     Find optimal lengths for all notes in a range.
@@ -254,21 +516,42 @@ def find_lengths_for_notes(
         tolerance_cents: Acceptable frequency error in cents
         num_elements: Number of FEM elements
         on_progress: Callback for progress updates
-        analysis_mode: BEAM_2D (fast) or SOLID_3D (accurate)
+        analysis_mode: BEAM_2D (fast), SOLID_3D (accurate) or SOLID_3D_SYMMETRIC
         frequency_offset: Calibration offset for 2D/3D calibration
         ny: Number of elements in width direction (3D only)
         nz: Number of elements in thickness direction (3D only)
+        method: Length search method, 'secant' (default), 'bisect' or
+            'interpolate'. The secant search of each note starts from the
+            previous note's length; 'interpolate' finds all lengths at once
+            with interpolate_lengths (BEAM_2D only, tolerance_cents unused)
 
     Returns:
         Array of results for each note
     """
+    interpolated: Optional[List[LengthSearchResult]] = None
+    if method == 'interpolate':
+        if analysis_mode != AnalysisMode.BEAM_2D:
+            raise ValueError("Length interpolation supports the 2D beam model only")
+        interpolated = interpolate_lengths(
+            [note.frequency for note in notes], width, thickness, material,
+            min_length, max_length, num_elements, frequency_offset
+        )
+
     results: List[BarLengthResult] = []
+    previous: Optional[LengthSearchResult] = None
 
     for i, note in enumerate(notes):
         if on_progress:
             on_progress(note.name, i, len(notes))
 
-        result = find_optimal_length(
+        # f1 ~ 1/L^2: scale the previous note's length to this note
+        initial_length = None
+        if previous is not None and previous.computed_freq > 0:
+            initial_length = previous.length * math.sqrt(
+                previous.computed_freq / (note.frequency * (1 + frequency_offset))
+            )
+
+        result = interpolated[i] if interpolated is not None else find_optimal_length(
             note.frequency,
             width,
             thickness,
@@ -281,8 +564,11 @@ def find_lengths_for_notes(
             analysis_mode,
             frequency_offset,
             ny,
-            nz
+            nz,
+            method=method,
+            initial_length=initial_length
         )
+        previous = result
 
         results.append(BarLengthResult(
             note_name=note.name,
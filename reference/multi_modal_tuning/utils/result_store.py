@@ -0,0 +1,287 @@
+"""
+Result Store
+
+Local SQLite database of optimized bars, so that re-running a bar or a
+note range can reuse earlier work instead of starting from scratch.
+
+Every result is stored under a kind (e.g. 'ea' for run_evolutionary_algorithm,
+'range_bar' for a bar of the range pipeline), a key describing the bar
+(material, cross-section, targets, number of cuts, ...) and the model
+settings it was computed with. Keys and settings are plain dictionaries,
+stored as canonical JSON so that equal values always give the same text.
+Results are only appended; lookups return the stored result with the
+lowest tuning error.
+
+The database defaults to ~/.cache/multi_modal_tuning/results.sqlite and can
+be moved with the MULTI_MODAL_TUNING_RESULT_STORE environment variable.
+"""
+
+from typing import Dict, List, Optional, Sequence
+from dataclasses import dataclass, field
+from contextlib import closing
+import json
+import math
+import os
+import sqlite3
+import time
+
+from ..types import Material
+
+RESULT_STORE_ENV_VAR = 'MULTI_MODAL_TUNING_RESULT_STORE'
+
+DEFAULT_RESULT_STORE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'multi_modal_tuning', 'results.sqlite'
+)
+
+# Bumped when the table layout changes, together with a migration below
+SCHEMA_VERSION = 1
+
+# Version of the frequency models and solvers, part of every settings dict.
+# Bumped when a change to the physics changes computed frequencies, so that
+# older results are only used as seeds, not returned as finished results.
+MODEL_VERSION = 1
+
+# Significant digits of floats in keys and settings
+KEY_DIGITS = 9
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS results (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT NOT NULL,
+        key TEXT NOT NULL,
+        settings TEXT NOT NULL,
+        genes TEXT NOT NULL,
+        bar_length REAL NOT NULL,
+        target_frequencies TEXT NOT NULL,
+        frequencies TEXT NOT NULL,
+        frequency_offset TEXT NOT NULL,
+        tuning_error REAL NOT NULL,
+        metadata TEXT NOT NULL,
+        created_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS results_lookup ON results (kind, key, settings, tuning_error)",
+)
+
+# Statements that upgrade a database of version v to v + 1, keyed by v.
+# Stored results are kept; a database that cannot be upgraded is not used.
+_MIGRATIONS: Dict[int, Sequence[str]] = {}
+
+
+@dataclass
+class StoredResult:
+    """One stored optimization result."""
+    kind: str
+    key: Dict[str, object]
+    settings: Dict[str, object]
+    genes: List[float]                # Best genes
+    bar_length: float                 # mm
+    target_frequencies: List[float]
+    frequencies: List[float]          # Computed frequencies of the best genes (Hz)
+    tuning_error: float               # %
+    frequency_offset: List[float] = field(default_factory=list)  # 3D - 2D per mode (Hz)
+    metadata: Dict[str, object] = field(default_factory=dict)
+    created_at: float = 0.0           # Unix time
+    id: Optional[int] = None
+
+
+def result_store_path() -> str:
+    """Result database path (environment variable or default)."""
+    return os.environ.get(RESULT_STORE_ENV_VAR) or DEFAULT_RESULT_STORE_PATH
+
+
+def material_key(material: Material) -> Dict[str, object]:
+    """Key fields of a material (name and the properties the model uses)."""
+    return {'material': material.name, 'E': material.E, 'rho': material.rho, 'nu': material.nu}
+
+
+def _canonical(value):
+    """
+    Numbers as floats rounded to KEY_DIGITS significant digits, recursively,
+    so that e.g. 32, 32.0 and numpy.float64(32) give the same text.
+    """
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (bool, str)) or value is None:
+        return value
+    value = float(value)
+    return float(f"{value:.{KEY_DIGITS}g}") if math.isfinite(value) else str(value)
+
+
+def _to_json(value) -> str:
+    return json.dumps(_canonical(value), sort_keys=True, separators=(',', ':'))
+
+
+def _floats(values: Optional[Sequence[float]]) -> List[float]:
+    return [float(v) for v in values or []]
+
+
+class ResultStore:
+    """
+    Append-only SQLite store of optimization results.
+
+    Only the path is kept; every call opens its own connection, so a store
+    can be passed to worker processes and shared between threads. Database
+    errors are not raised: put returns None and lookups find nothing. This
+    includes databases of a newer schema version, which are left untouched.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Database file (default: result_store_path())
+        """
+        self.path = path or result_store_path()
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30.0)
+        try:
+            if conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+                self._upgrade(conn)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    @staticmethod
+    def _upgrade(conn: sqlite3.Connection) -> None:
+        """
+        Create or migrate the table. The version is read again under the
+        write lock, so concurrent connections create or migrate only once.
+
+        Raises:
+            sqlite3.DatabaseError: If the database has a newer or unknown version
+        """
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version == 0:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+            else:
+                if version > SCHEMA_VERSION:
+                    raise sqlite3.DatabaseError(
+                        f"Result store schema version {version} is newer than {SCHEMA_VERSION}"
+                    )
+                for from_version in range(version, SCHEMA_VERSION):
+                    if from_version not in _MIGRATIONS:
+                        raise sqlite3.DatabaseError(
+                            f"No migration of the result store from schema version {from_version}"
+                        )
+                    for statement in _MIGRATIONS[from_version]:
+                        conn.execute(statement)
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def put(
+        self,
+        kind: str,
+        key: Dict[str, object],
+        settings: Dict[str, object],
+        genes: Sequence[float],
+        bar_length: float,
+        target_frequencies: Sequence[float],
+        frequencies: Sequence[float],
+        tuning_error: float,
+        frequency_offset: Optional[Sequence[float]] = None,
+        metadata: Optional[Dict[str, object]] = None
+    ) -> Optional[int]:
+        """
+        Store a result.
+
+        Args:
+            kind: Result kind, e.g. 'ea' or 'range_bar'
+            key: Bar description the result is looked up by
+            settings: Model settings the result was computed with
+            genes: Best genes
+            bar_length: Bar length (mm)
+            target_frequencies: Target frequencies (Hz)
+            frequencies: Computed frequencies of the best genes (Hz)
+            tuning_error: Tuning error (%)
+            frequency_offset: 3D - 2D frequency offset per mode (Hz)
+            metadata: Further JSON-serializable run information
+
+        Returns:
+            Row id of the stored result, or None if it could not be written
+        """
+        try:
+            row = (
+                kind, _to_json(key), _to_json(settings), json.dumps(_floats(genes)), float(bar_length),
+                json.dumps(_floats(target_frequencies)), json.dumps(_floats(frequencies)),
+                json.dumps(_floats(frequency_offset)), float(tuning_error),
+                json.dumps(metadata or {}, default=float), time.time()
+            )
+            with closing(self._connect()) as conn, conn:
+                cursor = conn.execute(
+                    "INSERT INTO results (kind, key, settings, genes, bar_length, target_frequencies, "
+                    "frequencies, frequency_offset, tuning_error, metadata, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row
+                )
+                return cursor.lastrowid
+        except (sqlite3.Error, OSError, ValueError, TypeError):
+            return None
+
+    def best(
+        self,
+        kind: str,
+        key: Dict[str, object],
+        settings: Optional[Dict[str, object]] = None
+    ) -> Optional[StoredResult]:
+        """
+        Stored result with the lowest tuning error (latest on ties).
+
+        Args:
+            kind: Result kind
+            key: Bar description
+            settings: Only results computed with these settings (None = any)
+
+        Returns:
+            The result, or None if there is none
+        """
+        query = "SELECT * FROM results WHERE kind = ? AND key = ?"
+        params = [kind, _to_json(key)]
+        if settings is not None:
+            query += " AND settings = ?"
+            params.append(_to_json(settings))
+        query += " ORDER BY tuning_error ASC, id DESC LIMIT 1"
+        results = self._select(query, params)
+        return results[0] if results else None
+
+    def results(self, kind: Optional[str] = None) -> List[StoredResult]:
+        """All stored results (of one kind), oldest first."""
+        if kind is None:
+            return self._select("SELECT * FROM results ORDER BY id", [])
+        return self._select("SELECT * FROM results WHERE kind = ? ORDER BY id", [kind])
+
+    def _select(self, query: str, params: list) -> List[StoredResult]:
+        try:
+            with closing(self._connect()) as conn:
+                conn.row_factory = sqlite3.Row
+                rows = conn.execute(query, params).fetchall()
+        except (sqlite3.Error, OSError):
+            return []
+        return [
+            StoredResult(
+                kind=row['kind'],
+                key=json.loads(row['key']),
+                settings=json.loads(row['settings']),
+                genes=json.loads(row['genes']),
+                bar_length=row['bar_length'],
+                target_frequencies=json.loads(row['target_frequencies']),
+                frequencies=json.loads(row['frequencies']),
+                tuning_error=row['tuning_error'],
+                frequency_offset=json.loads(row['frequency_offset']),
+                metadata=json.loads(row['metadata']),
+                created_at=row['created_at'],
+                id=row['id']
+            )
+            for row in rows
+        ]
@@ -0,0 +1,41 @@
+"""Evolutionary algorithm runs on a small 2D problem."""
+
+import pytest
+
+from multi_modal_tuning import (
+    BarParameters,
+    EAConfig,
+    EAParameters,
+    MATERIALS,
+    calculate_target_frequencies,
+    get_preset,
+    note_to_frequency,
+    run_evolutionary_algorithm,
+)
+from multi_modal_tuning.optimization.algorithm import run_adaptive_evolution
+
+BAR = BarParameters(L=0.450, b=0.032, h0=0.024, hMin=0.0024)
+MATERIAL = MATERIALS['sapele']
+TARGETS = calculate_target_frequencies(get_preset('1:3:6').ratios, note_to_frequency('F4'))
+
+
+def _run(runner, max_generations, **kwargs):
+    ea_params = EAParameters(
+        population_size=16, max_generations=max_generations, num_elements=60,
+        executor='serial', random_seed=1
+    )
+    return runner(EAConfig(
+        bar=BAR, material=MATERIAL, target_frequencies=TARGETS, num_cuts=2, ea_params=ea_params, **kwargs
+    ))
+
+
+@pytest.mark.parametrize('runner', [run_evolutionary_algorithm, run_adaptive_evolution])
+@pytest.mark.parametrize('option', ['seed_genes', 'seeds'])
+def test_seeds_start_the_population(runner, option):
+    good = _run(runner, 15)
+    genes = list(good.best_individual.genes)
+    seed = {'seed_genes': genes} if option == 'seed_genes' else {'seeds': [genes]}
+
+    # The seed survives as an elite, so one generation is at least as good
+    assert _run(runner, 1, **seed).tuning_error <= good.tuning_error + 1e-12
+    assert _run(runner, 1).tuning_error > good.tuning_error
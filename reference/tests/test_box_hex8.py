@@ -0,0 +1,52 @@
+"""Closed-form box hex8 matrices and the detection of box elements in bar meshes."""
+
+import numpy as np
+
+from multi_modal_tuning import MATERIALS
+from multi_modal_tuning.physics.fem_3d import (
+    _BOX_NODE_OFFSETS,
+    _hex8_matrices_quadrature,
+    compute_box_hex8_matrices,
+    compute_hex8_matrices_batch,
+    find_box_elements,
+    generate_bar_mesh_3d,
+)
+
+MATERIAL = MATERIALS['sapele']
+
+
+def _assert_matrices_close(actual, expected):
+    for A, B in zip(actual, expected):
+        # Per element, relative to its largest entry
+        error = np.abs(A - B).max(axis=(1, 2)) / np.abs(B).max(axis=(1, 2))
+        assert error.max() < 1e-10
+
+
+def test_box_matrices_match_quadrature():
+    rng = np.random.default_rng(0)
+    dims = rng.uniform(1e-4, 2e-2, size=(50, 3))
+    origins = rng.uniform(-0.5, 0.5, size=(50, 3))
+    coords = origins[:, None, :] + _BOX_NODE_OFFSETS[None, :, :] * dims[:, None, :]
+
+    assert find_box_elements(coords).all()
+    _assert_matrices_close(
+        compute_box_hex8_matrices(dims, MATERIAL.E, MATERIAL.nu, MATERIAL.rho),
+        _hex8_matrices_quadrature(coords, MATERIAL.E, MATERIAL.nu, MATERIAL.rho)
+    )
+
+
+def test_height_transitions_fall_back_to_quadrature():
+    heights = [0.024] * 6 + [0.012] * 6 + [0.024] * 6
+    nodes, elements, _ = generate_bar_mesh_3d(0.18, 0.032, heights, len(heights), ny=2, nz=3)
+    coords = nodes[elements]
+
+    # Trapezoids: the z of a node differs from its neighbour across the element in x
+    z = coords[:, :, 2]
+    trapezoid = np.any(np.abs(z[:, [0, 3, 4, 7]] - z[:, [1, 2, 5, 6]]) > 1e-12, axis=1)
+    assert trapezoid.any() and not trapezoid.all()
+
+    np.testing.assert_array_equal(find_box_elements(coords), ~trapezoid)
+    _assert_matrices_close(
+        compute_hex8_matrices_batch(coords, MATERIAL.E, MATERIAL.nu, MATERIAL.rho),
+        compute_hex8_matrices_batch(coords, MATERIAL.E, MATERIAL.nu, MATERIAL.rho, use_box_fast_path=False)
+    )
@@ -0,0 +1,90 @@
+"""Half-beam solves of mirror-symmetric 2D profiles against the full banded model."""
+
+import numpy as np
+import pytest
+
+from multi_modal_tuning import BarParameters, MATERIALS
+from multi_modal_tuning.physics import frequencies as frequencies_module
+from multi_modal_tuning.physics.fem_assembly import (
+    assemble_banded_matrices,
+    solve_generalized_eigenvalue_subset,
+    solve_half_beam,
+    solve_half_beam_batch,
+)
+
+LENGTH = 0.45
+WIDTH = 0.032
+HEIGHT = 0.024
+MATERIAL = MATERIALS['sapele']
+NUM_MODES = 5
+
+
+def _symmetric_profiles(rng, num_profiles, num_elements):
+    """Random profiles mirrored about the bar centre, shape (P, Ne)."""
+    half = rng.uniform(0.3 * HEIGHT, HEIGHT, size=(num_profiles, (num_elements + 1) // 2))
+    mirrored = half[:, :num_elements // 2][:, ::-1]
+    return np.concatenate([half, mirrored], axis=1)
+
+
+def _full_model(heights, le):
+    K_band, M_band = assemble_banded_matrices(heights, le, WIDTH, MATERIAL.E, MATERIAL.rho, MATERIAL.nu)
+    return solve_generalized_eigenvalue_subset(K_band, M_band, NUM_MODES)
+
+
+@pytest.mark.parametrize('num_elements', [40, 41])
+def test_half_beam_matches_full_model(num_elements):
+    rng = np.random.default_rng(num_elements)
+    le = LENGTH / num_elements
+    for heights in _symmetric_profiles(rng, 5, num_elements):
+        expected = _full_model(heights, le)
+        frequencies, symmetric = solve_half_beam(
+            heights, le, WIDTH, MATERIAL.E, MATERIAL.rho, MATERIAL.nu, NUM_MODES
+        )
+        np.testing.assert_allclose(frequencies, expected, rtol=1e-8)
+        # Bending modes alternate between the symmetry classes, starting with f1
+        assert symmetric[:3] == [True, False, True]
+
+
+@pytest.mark.parametrize('num_elements', [40, 41])
+def test_half_beam_batch_matches_full_model(num_elements):
+    rng = np.random.default_rng(100 + num_elements)
+    heights = _symmetric_profiles(rng, 6, num_elements)
+    # Per-profile element lengths, as for length-adjusted individuals
+    le = rng.uniform(0.9, 1.1, size=len(heights)) * LENGTH / num_elements
+
+    frequencies = solve_half_beam_batch(
+        heights, le, WIDTH, MATERIAL.E, MATERIAL.rho, MATERIAL.nu, NUM_MODES
+    )
+    expected = np.array([_full_model(h, l) for h, l in zip(heights, le)])
+    np.testing.assert_allclose(frequencies, expected, rtol=1e-8)
+
+
+def test_asymmetric_profiles_use_full_model(monkeypatch):
+    num_elements = 40
+    bar = BarParameters(L=LENGTH, b=WIDTH, h0=HEIGHT, hMin=HEIGHT / 10)
+    rng = np.random.default_rng(7)
+    heights = _symmetric_profiles(rng, 4, num_elements)
+    heights[1, 3] *= 0.8
+    heights[3, -5] *= 0.7
+    lengths = np.full(len(heights), LENGTH)
+
+    # Gene encodings only produce symmetric profiles, so inject the heights directly
+    monkeypatch.setattr(
+        frequencies_module, 'genes_to_element_heights', lambda *args: (heights.copy(), lengths.copy())
+    )
+    half_beam_rows = []
+    original = frequencies_module.solve_half_beam_batch
+
+    def spy(element_heights, *args):
+        half_beam_rows.extend(map(tuple, element_heights))
+        return original(element_heights, *args)
+
+    monkeypatch.setattr(frequencies_module, 'solve_half_beam_batch', spy)
+
+    frequencies = frequencies_module.batch_compute_frequencies_2d(
+        np.zeros((len(heights), 4)), bar, MATERIAL, NUM_MODES, num_elements, num_cuts=2
+    )
+
+    assert half_beam_rows == [tuple(heights[0]), tuple(heights[2])]
+    expected = np.array([_full_model(h, LENGTH / num_elements) for h in heights])
+    np.testing.assert_allclose(frequencies, expected, rtol=1e-8)
@@ -0,0 +1,68 @@
+"""Reduced-basis 3D surrogate against full solves."""
+
+import numpy as np
+import pytest
+
+from multi_modal_tuning import MATERIALS, AnalysisMode
+from multi_modal_tuning.physics.fem_3d import BarMesh3D, _solve_bar_3d, get_bar_mesh_3d
+from multi_modal_tuning.physics.modal_surrogate import ModalSurrogate3D
+from multi_modal_tuning.utils.bar_length_finder import find_optimal_length
+
+MATERIAL = MATERIALS['sapele']
+NX, NY, NZ = 30, 2, 2
+NUM_MODES = 8
+
+
+def _assemble(mesh, length, heights):
+    mesh.update_geometry(length, 0.032, heights)
+    return mesh.assemble(MATERIAL.E, MATERIAL.nu, MATERIAL.rho)
+
+
+def test_nearby_designs_match_dense_solve():
+    rng = np.random.default_rng(0)
+    mesh = BarMesh3D(NX, NY, NZ)
+    surrogate = ModalSurrogate3D()
+    surrogate.solve(mesh, *_assemble(mesh, 0.35, np.full(NX, 0.024)), NUM_MODES)
+
+    for _ in range(4):
+        length = 0.35 * (1 + 0.005 * rng.standard_normal())
+        heights = 0.024 * (1 - 0.01 * rng.random(NX))
+        heights = (heights + heights[::-1]) / 2
+        K, M = _assemble(mesh, length, heights)
+
+        frequencies, _ = surrogate.solve(mesh, K, M, NUM_MODES)
+        expected, _ = _solve_bar_3d(mesh, K.toarray(), M.toarray(), NUM_MODES, 'dense')
+        np.testing.assert_allclose(frequencies, expected, rtol=1e-6)
+
+    # Only the first design needed a full solve
+    assert surrogate.stats.refreshes == 1
+    assert surrogate.stats.evaluations == 5
+
+
+def test_distant_design_is_solved_in_full():
+    mesh = BarMesh3D(NX, NY, NZ)
+    surrogate = ModalSurrogate3D()
+    surrogate.solve(mesh, *_assemble(mesh, 0.35, np.full(NX, 0.024)), NUM_MODES)
+
+    heights = np.full(NX, 0.024)
+    heights[10:20] = 0.012
+    K, M = _assemble(mesh, 0.35, heights)
+    frequencies, _ = surrogate.solve(mesh, K, M, NUM_MODES)
+    expected, _ = _solve_bar_3d(mesh, K.toarray(), M.toarray(), NUM_MODES, 'dense')
+
+    np.testing.assert_allclose(frequencies, expected, rtol=1e-8)
+    assert surrogate.stats.refreshes == 2
+
+
+def test_length_search_matches_eigsh():
+    def search(solver_3d):
+        return find_optimal_length(
+            440.0, 32, 24, MATERIAL, 100, 600, tolerance_cents=0.1, num_elements=NX,
+            analysis_mode=AnalysisMode.SOLID_3D, ny=NY, nz=NZ, solver_3d=solver_3d
+        )
+
+    expected = search('eigsh')
+    result = search('reduced')
+    assert result.length == pytest.approx(expected.length, rel=1e-6)
+    assert result.computed_freq == pytest.approx(expected.computed_freq, rel=1e-6)
+    assert get_bar_mesh_3d(NX, NY, NZ).modal_surrogate().stats.evaluations == result.iterations
@@ -0,0 +1,99 @@
+"""Array-backed Population and IndividualView."""
+
+import math
+
+import numpy as np
+import pytest
+
+from multi_modal_tuning import Individual
+from multi_modal_tuning.optimization import Population, select_elite
+
+
+def _individuals():
+    return [
+        Individual([0.1, 0.02], 3.0, sigmas=[0.01, 0.001], frequencies=[350.0, 1050.0]),
+        Individual([0.2, 0.01], 1.0, sigmas=None, frequencies=None),
+        Individual([0.3, 0.015], 2.0, sigmas=[0.02, 0.002], frequencies=[349.0, 1040.0, 2100.0]),
+    ]
+
+
+def test_from_individuals_with_missing_sigmas_and_frequencies():
+    population = Population.from_individuals(_individuals())
+
+    np.testing.assert_array_equal(population.fitness, [3.0, 1.0, 2.0])
+    # One individual has no sigmas, so none are kept
+    assert population.sigmas is None
+    assert population.frequencies.shape == (3, 3)
+    assert population[0].frequencies is None  # NaN-padded to three modes
+    assert population[1].frequencies is None
+    assert population[2].frequencies == [349.0, 1040.0, 2100.0]
+    assert population[2].to_individual() == Individual([0.3, 0.015], 2.0, None, [349.0, 1040.0, 2100.0])
+
+
+def test_from_individuals_keeps_complete_sigmas():
+    individuals = [ind for ind in _individuals() if ind.sigmas is not None]
+    population = Population.from_individuals(individuals)
+
+    np.testing.assert_array_equal(population.sigmas, [[0.01, 0.001], [0.02, 0.002]])
+    assert population.to_individuals()[0].sigmas == [0.01, 0.001]
+
+
+def test_concatenate_pads_frequencies_and_drops_partial_sigmas():
+    with_sigmas = Population(
+        [[0.1, 0.02]], [1.0], sigmas=[[0.01, 0.001]], frequencies=[[350.0, 1050.0]]
+    )
+    without = Population([[0.2, 0.01], [0.3, 0.015]], [2.0, 3.0])
+    wider = Population([[0.4, 0.012]], [4.0], sigmas=[[0.03, 0.003]], frequencies=[[1.0, 2.0, 3.0]])
+
+    population = Population.concatenate([with_sigmas, Population(np.empty((0, 2))), without, wider])
+
+    assert len(population) == 4
+    np.testing.assert_array_equal(population.fitness, [1.0, 2.0, 3.0, 4.0])
+    assert population.sigmas is None
+    np.testing.assert_array_equal(
+        population.frequencies,
+        [[350.0, 1050.0, np.nan], [np.nan] * 3, [np.nan] * 3, [1.0, 2.0, 3.0]]
+    )
+    assert Population.concatenate([with_sigmas, wider]).sigmas.shape == (2, 2)
+
+
+def test_take_copies_rows():
+    population = Population.from_individuals(_individuals())
+
+    for subset in (population.take([2, 0]), population[::2], population[np.array([True, False, True])]):
+        assert len(subset) == 2
+        subset.genes[0, 0] = -1.0
+        subset[0].fitness = -1.0
+    np.testing.assert_array_equal(population.genes[:, 0], [0.1, 0.2, 0.3])
+    np.testing.assert_array_equal(population.fitness, [3.0, 1.0, 2.0])
+
+    taken = population.take([2, 0])
+    np.testing.assert_array_equal(taken.genes, [[0.3, 0.015], [0.1, 0.02]])
+    assert taken[1].frequencies is None
+    assert taken[0].frequencies == [349.0, 1040.0, 2100.0]
+
+
+def test_view_writes_through_and_checks_bounds():
+    population = Population.from_individuals(_individuals())
+    view = population[-1]
+
+    view.fitness = 0.5
+    view.genes[1] = 0.011
+    assert population.fitness[2] == 0.5
+    assert population.genes[2, 1] == 0.011
+    with pytest.raises(IndexError):
+        population[3]
+
+
+def test_select_elite_on_a_population():
+    population = Population.from_individuals(_individuals())
+    population.fitness[0] = math.inf
+
+    elite = select_elite(population, 2)
+
+    assert isinstance(elite, Population)
+    np.testing.assert_array_equal(elite.fitness, [1.0, 2.0])
+    np.testing.assert_array_equal(elite.genes, [[0.2, 0.01], [0.3, 0.015]])
+    elite.genes[0, 0] = -1.0
+    assert population.genes[1, 0] == 0.2
+    assert [ind.fitness for ind in select_elite(_individuals(), 2)] == list(elite.fitness)
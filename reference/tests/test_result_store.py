@@ -0,0 +1,83 @@
+"""Schema creation and upgrades of the result store, and the settings results are stored under."""
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+from multi_modal_tuning import MATERIALS
+from multi_modal_tuning.optimization import range_pipeline
+from multi_modal_tuning.optimization.range_pipeline import RangePipelineConfig
+from multi_modal_tuning.utils import result_store
+from multi_modal_tuning.utils.result_store import ResultStore, SCHEMA_VERSION
+
+KEY = {'note': 'C5'}
+
+
+def _put(store, tuning_error=1.0):
+    return store.put('ea', KEY, {}, [0.1, 0.2], 300.0, [523.3], [523.0], tuning_error)
+
+
+def _user_version(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def test_concurrent_first_use_creates_the_table_once(tmp_path):
+    store = ResultStore(str(tmp_path / 'results.sqlite'))
+    with ThreadPoolExecutor(4) as pool:
+        ids = list(pool.map(lambda error: _put(store, error), range(8)))
+
+    assert None not in ids
+    assert len(store.results()) == 8
+    assert store.best('ea', KEY).tuning_error == 0
+    assert _user_version(store.path) == SCHEMA_VERSION
+
+
+def test_newer_schema_is_left_untouched(tmp_path):
+    store = ResultStore(str(tmp_path / 'results.sqlite'))
+    _put(store)
+    with sqlite3.connect(store.path) as conn:
+        conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION + 1}')
+
+    assert _put(store) is None
+    assert store.best('ea', KEY) is None
+    assert _user_version(store.path) == SCHEMA_VERSION + 1
+    with sqlite3.connect(store.path) as conn:
+        assert conn.execute('SELECT COUNT(*) FROM results').fetchone()[0] == 1
+
+
+def test_older_schema_is_migrated(tmp_path, monkeypatch):
+    store = ResultStore(str(tmp_path / 'results.sqlite'))
+    _put(store)
+
+    monkeypatch.setattr(result_store, 'SCHEMA_VERSION', SCHEMA_VERSION + 1)
+    monkeypatch.setattr(result_store, '_MIGRATIONS', {
+        SCHEMA_VERSION: ["ALTER TABLE results ADD COLUMN note TEXT NOT NULL DEFAULT ''"]
+    })
+    assert _put(store) is not None
+    assert len(store.results()) == 2
+    assert _user_version(store.path) == SCHEMA_VERSION + 1
+
+
+def test_missing_migration_keeps_the_data(tmp_path, monkeypatch):
+    store = ResultStore(str(tmp_path / 'results.sqlite'))
+    _put(store)
+
+    monkeypatch.setattr(result_store, 'SCHEMA_VERSION', SCHEMA_VERSION + 1)
+    assert store.results() == []
+
+    monkeypatch.undo()
+    assert len(store.results()) == 1
+    assert _user_version(store.path) == SCHEMA_VERSION
+
+
+def test_range_settings_cover_f1_priority_and_model_version(monkeypatch):
+    def settings(**kwargs):
+        config = RangePipelineConfig(
+            width_mm=32, height_mm=24, material=MATERIALS['sapele'], ratios=[1, 3, 6], **kwargs
+        )
+        return range_pipeline._result_store_settings(config)
+
+    assert settings(f1_priority=1.5) != settings(f1_priority=1.0)
+    before = settings()
+    monkeypatch.setattr(range_pipeline, 'MODEL_VERSION', result_store.MODEL_VERSION + 1)
+    assert settings() != before
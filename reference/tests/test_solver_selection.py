@@ -0,0 +1,68 @@
+"""Calibrated choice of the 3D eigen-solver backend."""
+
+import pytest
+
+from multi_modal_tuning.physics import solver_selection
+from multi_modal_tuning.physics.solver_selection import (
+    SolverCalibration,
+    SolverTiming,
+    calibration_environment,
+    get_solver_calibration,
+    set_solver_calibration,
+)
+
+
+def _calibration():
+    seconds = {
+        'dense': {100: 0.002, 300: 0.01, 750: 0.09},
+        'eigsh': {100: 0.008, 300: 0.015, 750: 0.030, 1500: 0.060, 2700: 0.120},
+        'lobpcg': {100: 0.008, 300: 0.015, 750: 0.028, 1500: 0.040, 2700: 0.060},
+    }
+    timings = [
+        SolverTiming(solver, num_dof, num_modes, time)
+        for solver, points in seconds.items()
+        for num_dof, time in points.items()
+        for num_modes in (4, 12)
+    ]
+    return SolverCalibration(timings, calibration_environment())
+
+
+@pytest.fixture
+def no_calibration_file(tmp_path, monkeypatch):
+    monkeypatch.setenv(solver_selection.CALIBRATION_ENV_VAR, str(tmp_path / 'calibration.json'))
+    set_solver_calibration(None)
+    yield
+    set_solver_calibration(None)
+
+
+def test_choose_within_the_calibrated_range():
+    calibration = _calibration()
+    assert calibration.choose(100, 4) == 'dense'
+    assert calibration.choose(50, 4) == 'dense'
+    assert calibration.choose(2000, 10) == 'lobpcg'
+    # Dense was not timed this large, so it is never predicted to win
+    assert calibration.choose(2000, 4) != 'dense'
+
+
+def test_no_extrapolation_above_the_largest_mesh():
+    calibration = _calibration()
+    for num_modes in (4, 10, 12):
+        assert calibration.choose(27225, num_modes) == 'eigsh'
+
+
+def test_missing_calibration_file_uses_eigsh_without_benchmark(no_calibration_file, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("calibration must not run implicitly")
+
+    monkeypatch.setattr(solver_selection, 'calibrate_solvers_3d', fail)
+    assert get_solver_calibration().timings == []
+    assert solver_selection.choose_solver_3d(500, 4) == 'eigsh'
+
+
+def test_run_solver_calibration_saves_and_installs(no_calibration_file, monkeypatch):
+    monkeypatch.setattr(solver_selection, 'calibrate_solvers_3d', lambda **kwargs: _calibration())
+    solver_selection.run_solver_calibration()
+    assert solver_selection.choose_solver_3d(100, 4) == 'dense'
+
+    set_solver_calibration(None)
+    assert get_solver_calibration().choose(2000, 12) == 'lobpcg'
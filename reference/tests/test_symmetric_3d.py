@@ -0,0 +1,58 @@
+"""Solver choice in the symmetry-reduced 3D model."""
+
+import numpy as np
+import pytest
+
+from multi_modal_tuning import MATERIALS, AnalysisMode
+from multi_modal_tuning.physics import fem_3d
+from multi_modal_tuning.physics.frequencies import FitnessProblem, compute_frequencies
+
+MATERIAL = MATERIALS['sapele']
+NX = 20
+NUM_MODES = 4
+
+
+def _heights():
+    heights = np.full(NX, 0.024)
+    heights[6:14] = 0.018
+    return list(heights)
+
+
+def _frequencies(solver_3d):
+    return compute_frequencies(
+        _heights(), 0.35 / NX, 0.032, MATERIAL.E, MATERIAL.rho, MATERIAL.nu, NUM_MODES,
+        AnalysisMode.SOLID_3D_SYMMETRIC, solver_3d=solver_3d
+    )
+
+
+@pytest.mark.parametrize('solver_3d, use_sparse', [('dense', False), ('eigsh', True)])
+def test_solver_reaches_every_class(solver_3d, use_sparse, monkeypatch):
+    expected = fem_3d.compute_frequencies_3d(
+        _heights(), 0.35, 0.032, MATERIAL.E, MATERIAL.rho, MATERIAL.nu, NUM_MODES, solver='dense'
+    )
+    solve = fem_3d.solve_eigenvalue_3d_with_vectors
+    calls = []
+
+    def recording_solve(K, M, num_modes, sparse, *args):
+        calls.append(sparse)
+        return solve(K, M, num_modes, sparse, *args)
+
+    monkeypatch.setattr(fem_3d, 'solve_eigenvalue_3d_with_vectors', recording_solve)
+    frequencies = _frequencies(solver_3d)
+
+    assert calls == [use_sparse] * len(fem_3d.SYMMETRY_CLASSES)
+    np.testing.assert_allclose(frequencies, expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize('solver_3d', ['lobpcg', 'reduced'])
+def test_full_mesh_solvers_are_rejected(solver_3d):
+    with pytest.raises(ValueError):
+        _frequencies(solver_3d)
+
+
+def test_fitness_problem_rejects_lobpcg_for_the_symmetric_model():
+    with pytest.raises(ValueError):
+        FitnessProblem(
+            bar=None, material=MATERIAL, target_frequencies=(440.0,), num_elements=NX,
+            analysis_mode=AnalysisMode.SOLID_3D_SYMMETRIC, solver_3d='lobpcg'
+        )
@@ -0,0 +1,78 @@
+"""Array-backed EA operators against their per-individual counterparts."""
+
+import numpy as np
+import pytest
+
+from multi_modal_tuning import (
+    BarParameters,
+    EAConfig,
+    EAParameters,
+    MATERIALS,
+    VariableBounds,
+    calculate_target_frequencies,
+    get_preset,
+    note_to_frequency,
+    run_evolutionary_algorithm,
+)
+from multi_modal_tuning.optimization.population import clamp_to_bounds
+from multi_modal_tuning.optimization.vectorized import (
+    clamp_to_bounds_batch,
+    make_rng,
+    roulette_selection_batch,
+)
+
+BOUNDS = VariableBounds(lambda_min=0.0, lambda_max=0.2, h_min=0.004, h_max=0.024)
+
+
+@pytest.mark.parametrize('bounds', [
+    BOUNDS,
+    VariableBounds(**{**vars(BOUNDS), 'min_cut_width': 0.02}),
+    VariableBounds(**{**vars(BOUNDS), 'max_cut_width': 0.05}),
+    VariableBounds(**{**vars(BOUNDS), 'min_cut_width': 0.01, 'max_cut_width': 0.04}),
+    VariableBounds(**{**vars(BOUNDS), 'min_cut_width': 0.02, 'max_length_trim': 0.01,
+                      'max_length_extend': 0.005}),
+])
+@pytest.mark.parametrize('num_cuts', [1, 3, 5])
+def test_clamp_batch_matches_clamp_to_bounds(bounds, num_cuts):
+    rng = np.random.default_rng(num_cuts)
+    num_genes = 2 * num_cuts + (bounds.max_length_trim > 0 or bounds.max_length_extend > 0)
+    # Values spill past every bound, and lambdas often sit closer than the spacing rules allow
+    genes = rng.uniform(-0.05, 0.25, size=(200, num_genes))
+    genes[:50, 0:2 * num_cuts:2] = 0.1 + rng.normal(0, 0.005, size=(50, num_cuts))
+
+    clamped = clamp_to_bounds_batch(genes, bounds)
+    expected = np.array([clamp_to_bounds(list(row), bounds) for row in genes])
+    np.testing.assert_allclose(clamped, expected, rtol=0, atol=1e-15)
+
+
+def test_roulette_selects_only_finite_positive_fitness():
+    fitness = np.array([np.inf, 2.0, np.nan, 0.0, -1.0, 1.0, np.inf])
+    picks = roulette_selection_batch(fitness, 20000, make_rng(0))
+
+    assert set(np.unique(picks)) == {1, 5}
+    # p_i is proportional to 1/e_i
+    assert np.mean(picks == 5) == pytest.approx(2 / 3, abs=0.02)
+
+
+def test_roulette_without_valid_fitness_draws_uniformly():
+    picks = roulette_selection_batch(np.array([np.inf, np.nan, 0.0]), 3000, make_rng(0))
+    assert set(np.unique(picks)) == {0, 1, 2}
+
+
+def test_seeded_runs_are_reproducible():
+    def run(seed):
+        ea_params = EAParameters(
+            population_size=12, max_generations=4, num_elements=60, executor='serial', random_seed=seed
+        )
+        return run_evolutionary_algorithm(EAConfig(
+            bar=BarParameters(L=0.450, b=0.032, h0=0.024, hMin=0.0024),
+            material=MATERIALS['sapele'],
+            target_frequencies=calculate_target_frequencies(get_preset('1:3:6').ratios, note_to_frequency('F4')),
+            num_cuts=2,
+            ea_params=ea_params,
+        ))
+
+    first, second = run(7), run(7)
+    assert first.best_individual.genes == second.best_individual.genes
+    assert first.computed_frequencies == second.computed_frequencies
+    assert run(8).best_individual.genes != first.best_individual.genes